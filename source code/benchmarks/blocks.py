@@ -0,0 +1,65 @@
+# Compile and run time of nested if-else/switch blocks and of blocks with long bodies
+# usage (from the "source code" folder): python benchmarks/blocks.py [depth]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# depth if-else blocks, each one inside the YA RLY of the one before
+def nestedifelse(depth):
+    program = ["HAI", "I HAS A x ITZ 1"]
+    for level in range(0, depth):
+        program.extend(["BOTH SAEM x AN 1", "O RLY?", "YA RLY"])
+    program.append("VISIBLE \"innermost\"")
+    for level in range(0, depth):
+        program.extend(["NO WAI", "VISIBLE \"never\"", "OIC"])
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+# depth switch blocks, each one inside the case that matches in the one before, with GTFO through an if-else block
+def nestedswitch(depth):
+    program = ["HAI", "I HAS A x ITZ 2"]
+    for level in range(0, depth):
+        program.extend(["SUM OF x AN 0", "WTF?", "OMG 1", "VISIBLE \"never\"", "GTFO", "OMG 2"])
+    program.append("VISIBLE \"innermost\"")
+    for level in range(0, depth):
+        program.extend(["BOTH SAEM x AN 2", "O RLY?", "YA RLY", "GTFO", "NO WAI", "OIC", "OMGWTF", "VISIBLE \"never\"", "OIC"])
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+# one if-else block whose branches have count lines each
+def longbranches(count):
+    program = ["HAI", "I HAS A x ITZ 0", "BOTH SAEM x AN 0", "O RLY?", "YA RLY"]
+    program.extend(["x R SUM OF x AN 1"] * count)
+    program.append("NO WAI")
+    program.extend(["x R DIFF OF x AN 1"] * count)
+    program.extend(["OIC", "KTHXBYE"])
+    return "\n".join(program) + "\n"
+
+def measure(name, source):
+    output = []
+    lolinterpreter.iohandlers["write"] = output.append
+    start = time.perf_counter()
+    program = lolinterpreter.compilesource(source)
+    compiletime = time.perf_counter() - start
+    start = time.perf_counter()
+    result = lolinterpreter.runprogram(program, lolinterpreter.newslots(program))
+    runtime = time.perf_counter() - start
+    if program["error"] != None or result != None:
+        print("program stopped on an error")
+    print("%-28s compile %.3f s, run %.4f s, output %s" % (name, compiletime, runtime, "".join(output).split()))
+
+def main(arguments):
+    depth = int(arguments[0]) if len(arguments) != 0 else 2000
+    lolinterpreter.compilesettings["fold"] = False      # the conditions are constants, keep the jumps
+    size = depth // 4
+    while size <= depth:
+        measure("nested if-else depth " + str(size), nestedifelse(size))
+        measure("nested switch depth " + str(size), nestedswitch(size))
+        measure("branches of " + str(size * 10) + " lines", longbranches(size * 10))
+        size *= 2
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
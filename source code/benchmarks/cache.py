@@ -0,0 +1,30 @@
+# First run against repeated runs of the same program text (the repeats take the compiled program from the cache)
+# usage (from the "source code" folder): python benchmarks/cache.py [lines] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from straightline import straightlineprogram
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 10000
+    runs = int(arguments[1]) if len(arguments) > 1 else 10
+    source = straightlineprogram(count)
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    lolinterpreter.clearcache()
+
+    start = time.perf_counter()
+    lolinterpreter.executesource(source)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for run in range(0, runs):
+        lolinterpreter.executesource(source)
+    repeated = (time.perf_counter() - start) / runs
+    stats = lolinterpreter.cachestats
+    print("%d lines, first run %.3f s, repeated runs %.3f s (%.1fx faster)" % (count, first, repeated, first / repeated))
+    print("cache hits %d, misses %d" % (stats["hits"], stats["misses"]))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
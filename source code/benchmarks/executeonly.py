@@ -0,0 +1,41 @@
+# Time and memory of a run with the lexeme table against an execute-only run (lexeme table made only on demand)
+# usage (from the "source code" folder): python benchmarks/executeonly.py [lines] [runs]
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from straightline import straightlineprogram
+
+# first run (compile and run) and best of the repeated runs of source, peak memory of the first run
+def measure(source, recordlexemes, runs):
+    lolinterpreter.clearcache()
+    tracemalloc.start()
+    start = time.perf_counter()
+    lolinterpreter.executesource(source, recordlexemes)
+    first = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    repeated = float("inf")
+    for run in range(0, runs):
+        start = time.perf_counter()
+        lolinterpreter.executesource(source, recordlexemes)
+        repeated = min(repeated, time.perf_counter() - start)
+    return [first, repeated, peak]
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 10000
+    runs = int(arguments[1]) if len(arguments) > 1 else 10
+    source = straightlineprogram(count)
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    for [name, recordlexemes] in [["lexeme table", True], ["execute-only", False]]:
+        [first, repeated, peak] = measure(source, recordlexemes, runs)
+        print("%-13s first run %.3f s (peak %.1f MB), repeated runs %.4f s" % (name, first, peak / 1000000, repeated))
+    start = time.perf_counter()
+    lexemes = lolinterpreter.executesource(source, False)[0]()
+    print("lexeme table made on demand after an execute-only run: %d lexemes, %.4f s" % (len(lexemes), time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,53 @@
+# Compile and run time of programs made of literal expressions and constant conditions, with and without constant folding
+# usage (from the "source code" folder): python benchmarks/folding.py [lines] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+def constantprogram(count):
+    program = ["HAI", "I HAS A x ITZ 0"]
+    for index in range(0, count // 8):
+        program.append("x R SUM OF x AN PRODUKT OF 3 AN 4")
+        program.append("VISIBLE SMOOSH \"total \" AN SUM OF 2 AN 2 MKAY")
+        program.append("BOTH SAEM \"a\" AN \"a\"")
+        program.append("O RLY?")
+        program.append("YA RLY")
+        program.append("x R DIFF OF x AN QUOSHUNT OF 10 AN 5")
+        program.append("NO WAI")
+        program.append("OIC")
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+def measure(source, runs):
+    start = time.perf_counter()
+    program = lolinterpreter.compilesource(source)
+    compiletime = time.perf_counter() - start
+    runtime = float("inf")
+    for run in range(0, runs):
+        slots = lolinterpreter.newslots(program)
+        start = time.perf_counter()
+        result = lolinterpreter.runprogram(program, slots)
+        runtime = min(runtime, time.perf_counter() - start)
+        if result != None:
+            print("program stopped on an error: " + result[0])
+    return [compiletime, runtime, len(program["code"]), lolinterpreter.slotsymbols(program, slots)["x"]]
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 10000
+    runs = int(arguments[1]) if len(arguments) > 1 else 5
+    source = constantprogram(count)
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    results = {}
+    for fold in (False, True):
+        lolinterpreter.compilesettings["fold"] = fold
+        results[fold] = measure(source, runs)
+        print("fold %-5s compile %.3f s, run %.3f s, %d instructions" % (fold, results[fold][0], results[fold][1], results[fold][2]))
+    if results[False][3] != results[True][3]:
+        print("results differ: " + str(results[False][3]) + " / " + str(results[True][3]))
+    print("run %.1fx faster with folding" % (results[False][1] / results[True][1]))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,44 @@
+# Calls per second of functions (HOW IZ I ... IF U SAY SO): a recursive Fibonacci, run without and with the cache of
+# the results of pure functions (lolinterpreter.callsettings["memo"]), and a loop calling a small function.
+# usage (from the "source code" folder): python benchmarks/functions.py [fibonacci number] [calls] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# the programs measured: [name, program text, calls made without the cache]
+def functionprograms(number, count):
+    fibonacci = ["HAI", "HOW IZ I fib YR n", "I HAS A first", "BOTH SAEM n AN BIGGR OF n AN 2", "O RLY?", "YA RLY",
+                 "I IZ fib YR DIFF OF n AN 1 MKAY", "first R IT", "I IZ fib YR DIFF OF n AN 2 MKAY", "FOUND YR SUM OF first AN IT",
+                 "NO WAI", "FOUND YR n", "OIC", "IF U SAY SO", "I IZ fib YR " + str(number) + " MKAY", "VISIBLE IT", "KTHXBYE"]
+    calls = [1, 1]
+    while len(calls) <= number:
+        calls.append(calls[-1] + calls[-2] + 1)
+    looping = ["HAI", "HOW IZ I twice YR x", "FOUND YR PRODUKT OF x AN 2", "IF U SAY SO", "I HAS A i ITZ 0",
+               "IM IN YR calling UPPIN YR i TIL BOTH SAEM i AN " + str(count), "I IZ twice YR i MKAY", "IM OUTTA YR calling", "KTHXBYE"]
+    return [["fib", "\n".join(fibonacci) + "\n", calls[number]], ["loop", "\n".join(looping) + "\n", count]]
+
+def main(arguments):
+    number = int(arguments[0]) if len(arguments) != 0 else 22
+    count = int(arguments[1]) if len(arguments) > 1 else 200000
+    runs = int(arguments[2]) if len(arguments) > 2 else 3
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    for [name, source, calls] in functionprograms(number, count):
+        times = []
+        for memo in [0, 1000]:
+            lolinterpreter.callsettings["memo"] = memo
+            best = float("inf")
+            for run in range(0, runs):
+                start = time.perf_counter()
+                result = lolinterpreter.runsource(source, False)
+                best = min(best, time.perf_counter() - start)
+                if result["error"] != None:
+                    print("program stopped on an error: " + result["error"])
+            times.append(best)
+        print("%-5s %d calls, %.4f s, %.0f calls/s; with the cache %.4f s, speedup %.2fx" % (name, calls, times[0], calls / times[0], times[1], times[0] / times[1]))
+    lolinterpreter.callsettings["memo"] = 0
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,85 @@
+# Synthetic LOLCODE programs for the benchmark suite (see suite.py), each one made to stress one part of the interpreter
+# usage (from the "source code" folder): python benchmarks/generate.py kind [size] > program.lol
+# kinds: declarations, arithmetic, allof, switch, output
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from switch import switchprogram
+
+# lines of declarations and assignments of many variables (each assignment reads two of them)
+def declarationprogram(lines):
+    program = ["HAI"]
+    variables = lines // 2
+    for index in range(0, variables):
+        program.append("I HAS A var" + str(index) + " ITZ " + str(index))
+    for index in range(0, lines - variables):
+        program.append("var" + str(index) + " R SUM OF var" + str(index * 7 % variables) + " AN var" + str(index * 13 % variables))
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+# lines expression statements, each one arithmetic nested depth levels deep on variables (nothing is folded)
+def arithmeticprogram(depth, lines):
+    operations = ["SUM OF ", "DIFF OF ", "PRODUKT OF ", "BIGGR OF ", "SMALLR OF "]
+    expression = ""
+    for level in range(0, depth):
+        expression += operations[level % len(operations)] + ("x AN " if level % 2 == 0 else "")
+    expression += "y"
+    for level in range(depth - 1, -1, -1):
+        if level % 2 != 0:
+            expression += " AN x"
+    return "HAI\nI HAS A x ITZ 1\nI HAS A y ITZ 2\n" + (expression + "\n") * lines + "KTHXBYE\n"
+
+# lines ALL OF/ANY OF expressions of width TROOF variables each (nothing is folded, no operand decides early)
+def allofprogram(width, lines):
+    allof = "ALL OF " + " AN ".join(["t"] * width) + " MKAY"
+    anyof = "ANY OF " + " AN ".join(["f"] * width) + " MKAY"
+    program = ["HAI", "I HAS A t ITZ WIN", "I HAS A f ITZ FAIL"]
+    for line in range(0, lines):
+        program.append(allof if line % 2 == 0 else anyof)
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+# VISIBLE lines mixing literals, variables and expressions
+def outputprogram(lines):
+    program = ["HAI", "I HAS A name ITZ \"cat\"", "I HAS A count ITZ 0"]
+    for line in range(0, lines):
+        program.append("VISIBLE \"line \" " + str(line) + " \" of \" name \": \" SUM OF count AN " + str(line) + " \" lives\"")
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+# program of the given kind and size (the default sizes are the ones of the suite)
+# programs whose blocks have a structure error (their ORLY/WTF/loop/function is compiled without its targets), for the
+# checks that the instrumented code (profiler, hooks) stops on the same error as the code as compiled
+def malformedprograms():
+    bodies = ["O RLY?\nYA RLY\nVISIBLE 1\nOIC", "BOTH SAEM 1 AN 1\nO RLY?\nYA RLY\nVISIBLE 1\nOIC",
+              "BOTH SAEM 1 AN 1\nO RLY?\nVISIBLE 1\nNO WAI\nOIC", "BOTH SAEM 1 AN 1\nO RLY?\nYA RLY\nYA RLY\nNO WAI\nOIC",
+              "BOTH SAEM 1 AN 1\nO RLY?\nYA RLY\nVISIBLE 1", "SUM OF 1 AN 0\nWTF?\nOMG 1\nVISIBLE 1\nGTFO\nOIC",
+              "IM IN YR loop\nVISIBLE 1", "I IZ f MKAY\nHOW IZ I f\nVISIBLE 1"]
+    return ["HAI\n" + body + "\nKTHXBYE\n" for body in bodies]
+
+def generate(kind, size=None):
+    if kind == "declarations":
+        return declarationprogram(size or 10000)
+    elif kind == "arithmetic":
+        return arithmeticprogram(size or 200, 200)
+    elif kind == "allof":
+        return allofprogram(size or 500, 200)
+    elif kind == "switch":
+        return switchprogram(size or 1000, 5, (size or 1000) - 1)
+    elif kind == "output":
+        return outputprogram(size or 10000)
+    return None
+
+def main(arguments):
+    program = None
+    if len(arguments) != 0:
+        program = generate(arguments[0], int(arguments[1]) if len(arguments) > 1 else None)
+    if program == None:
+        sys.stderr.write("usage: python benchmarks/generate.py declarations|arithmetic|allof|switch|output [size]\n")
+        return 2
+    sys.stdout.write(program)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,39 @@
+# Throughput of the batch grader (see lolgrade.py) with 1, 2, 4, ... processes up to the number of processors:
+# generated programs (see generate.py) in a temporary folder, each run against the same cases
+# usage (from the "source code" folder): python benchmarks/grader.py [programs] [cases] [size]
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolgrade
+from generate import generate
+
+def main(arguments):
+    programs = int(arguments[0]) if len(arguments) != 0 else 16
+    cases = int(arguments[1]) if len(arguments) > 1 else 8
+    size = int(arguments[2]) if len(arguments) > 2 else 2000
+    kinds = ["declarations", "output", "switch"]
+    matrix = [{"name": "case" + str(index), "inputs": [str(index)], "expected": ""} for index in range(0, cases)]
+    with tempfile.TemporaryDirectory() as folder:
+        for index in range(0, programs):
+            with open(os.path.join(folder, "program%03d.lol" % index), "w") as file:
+                file.write(generate(kinds[index % len(kinds)], size))
+        paths = lolgrade.programpaths(folder)
+        jobs = 1
+        single = None
+        while True:
+            start = time.perf_counter()
+            counts = lolgrade.grade(paths, matrix, jobs, lambda result: None)
+            elapsed = time.perf_counter() - start
+            runs = sum(counts.values())
+            if single == None:
+                single = elapsed
+            print("%2d processes: %d runs in %.3f s (%.1f runs/s, %.2fx one process)" % (jobs, runs, elapsed, runs / elapsed, single / elapsed))
+            if jobs >= (os.cpu_count() or 1):
+                break
+            jobs = min(jobs * 2, os.cpu_count() or 1)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,68 @@
+# Cost of the event hooks (see lolinterpreter.runhooks) with no subscriber (the code runs as compiled), one subscriber
+# (on_statement) and several subscribers (every event, a few functions each)
+# usage (from the "source code" folder): python benchmarks/hooks.py [lines] [runs] [subscribers]
+# The programs with malformed blocks (see generate.malformedprograms) are also run with a subscriber for every event,
+# to check that they stop on the same error as without hooks (the exit code is 1 if one does not)
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from straightline import straightlineprogram
+from generate import generate, malformedprograms
+
+# best time of runs runs of source
+def measure(source, runs):
+    best = float("inf")
+    for run in range(0, runs):
+        start = time.perf_counter()
+        lolinterpreter.runsource(source, False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# a subscriber that counts the events it gets
+def counter(counts):
+    def count(*arguments):
+        counts[0] += 1
+    return count
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 20000
+    runs = int(arguments[1]) if len(arguments) > 1 else 10
+    subscribers = int(arguments[2]) if len(arguments) > 2 else 3
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    for [name, source] in [["straight-line", straightlineprogram(count)], ["arithmetic", generate("arithmetic")], ["switch", generate("switch")]]:
+        lolinterpreter.runsource(source, False)     # compiled once, then taken from the cache
+        timings = []
+        for setting in ("none", "none again", "one", "several"):
+            counts = [0]
+            if setting == "one":
+                lolinterpreter.addhook("on_statement", counter(counts))
+            elif setting == "several":
+                for event in lolinterpreter.runhooks:
+                    for index in range(0, subscribers):
+                        lolinterpreter.addhook(event, counter(counts))
+            lolinterpreter.runsource(source, False)     # the hooked code is made once for each set of events
+            counts[0] = 0
+            timings.append([setting, measure(source, runs), counts[0] // runs])
+            for event in lolinterpreter.runhooks:
+                del lolinterpreter.runhooks[event][:]
+        plain = timings[0][1]
+        print("%-14s " % name + "  ".join(["%s %.4f s (%+.1f%%, %d calls)" % (setting, elapsed, (elapsed / plain - 1) * 100, calls) for [setting, elapsed, calls] in timings]))
+    different = 0
+    for source in malformedprograms():
+        expected = lolinterpreter.runsource(source, False)["error"]
+        for event in lolinterpreter.runhooks:
+            lolinterpreter.addhook(event, counter([0]))
+        error = lolinterpreter.runsource(source, False)["error"]
+        for event in lolinterpreter.runhooks:
+            del lolinterpreter.runhooks[event][:]
+        if error != expected:
+            different += 1
+            print("hooked run stopped on %r instead of %r:\n%s" % (error, expected, source))
+    print("malformed blocks: %d programs, %d stopped on a different error with hooks" % (len(malformedprograms()), different))
+    return 1 if different != 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
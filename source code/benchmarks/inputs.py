@@ -0,0 +1,36 @@
+# Input-driven runs without a window: a GIMMEH program run many times, each run with its own list of inputs
+# (lolinterpreter.listreader), checking that every input is typed like one typed in the dialog
+# usage (from the "source code" folder): python benchmarks/inputs.py [runs] [gimmehs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# a program reading gimmehs inputs into a variable and printing each of them
+def gimmehprogram(gimmehs):
+    return "HAI\nI HAS A var\n" + "GIMMEH var\nVISIBLE var\n" * gimmehs + "KTHXBYE\n"
+
+def main(arguments):
+    runs = int(arguments[0]) if len(arguments) != 0 else 5000
+    gimmehs = int(arguments[1]) if len(arguments) > 1 else 10
+    source = gimmehprogram(gimmehs)
+    kinds = ["12", "-3.25", "WIN", "some text"]
+    output = []
+    lolinterpreter.iohandlers["write"] = output.append
+    start = time.perf_counter()
+    for run in range(0, runs):
+        inputs = [kinds[(run + gimmeh) % len(kinds)] for gimmeh in range(0, gimmehs)]
+        lolinterpreter.iohandlers["read"] = lolinterpreter.listreader(inputs)
+        symbols = lolinterpreter.runsymbols(lolinterpreter.runsource(source, False))
+        expected = {"12": "NUMBR", "-3.25": "NUMBAR"}.get(inputs[-1], "YARN")
+        if symbols["var"][1] != expected:
+            print("run %d: last input %r typed %s, expected %s" % (run, inputs[-1], symbols["var"][1], expected))
+            return 1
+    elapsed = time.perf_counter() - start
+    print("%d runs of %d GIMMEHs: %.3f s (%.1f us per run, %d output texts)" % (runs, gimmehs, elapsed, elapsed / runs * 1000000, len(output)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,68 @@
+# Refresh time of the lexeme table for 10k, 100k and 1M lexemes: the virtualized view (only the rows seen are put in
+# the Treeview) against inserting every lexeme like before
+# usage (from the "source code" folder): python benchmarks/lexemeview.py [--full]
+# the Treeview needs a display, without one only the lexeme table side of the view is measured
+# the full insert is only measured up to 100k lexemes unless --full is given (1M takes minutes)
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+import lexemeview
+from straightline import straightlineprogram
+
+# a lexeme table of count lexemes (and its line index), made by repeating the one of a small program
+def lexemetable(count):
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    run = lolinterpreter.runsource(straightlineprogram(100))
+    block = lolinterpreter.runlexemes(run)[1:-1]
+    blocklines = [[line[0] - 2, line[1] - 1] for line in lolinterpreter.lexemelines(run)[1:]]
+    rows = []
+    lines = []
+    while len(rows) < count:
+        for [line, index] in blocklines:
+            lines.append([line + 100 * (len(rows) // len(block)), index + len(rows)])
+        rows.extend(block)
+    return [rows[0:count], lines]
+
+def fullrefresh(treeview, rows):
+    for i in treeview.get_children():
+        treeview.delete(i)
+    for item in range(0, len(rows)):
+        treeview.insert(parent='', index=item, iid=item, text=rows[item][0], values=(rows[item][1]))
+
+def main(arguments):
+    treeview = None
+    try:
+        import tkinter as tk
+        import tkinter.ttk as ttk
+        window = tk.Tk()
+        window.withdraw()
+        treeview = ttk.Treeview(window, columns=("Classification"))
+    except Exception as error:
+        print("no display (" + str(error).strip() + "), the Treeview is not measured")
+    for count in (10000, 100000, 1000000):
+        [rows, lines] = lexemetable(count)
+        start = time.perf_counter()
+        view = lexemeview.newview(rows, lines, 30)
+        if treeview != None:
+            lexemeview.showpage(view, treeview, 0)
+        refresh = time.perf_counter() - start
+        start = time.perf_counter()
+        offset = lexemeview.lineindex(view, lines[-1][0] // 2)
+        if treeview != None:
+            lexemeview.showpage(view, treeview, offset)
+        jump = time.perf_counter() - start
+        text = "%7d lexemes: view refresh %.4f s, jump to line %.5f s" % (count, refresh, jump)
+        if treeview != None and (count <= 100000 or "--full" in arguments):
+            start = time.perf_counter()
+            fullrefresh(treeview, rows)
+            text += ", full insert %.3f s" % (time.perf_counter() - start)
+            start = time.perf_counter()
+            fullrefresh(treeview, [])
+            text += " (+%.3f s to clear it)" % (time.perf_counter() - start)
+        print(text)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
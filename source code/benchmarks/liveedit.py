@@ -0,0 +1,39 @@
+# Keystroke-to-update latency of the live lexeme table (see livelexer.py): a character typed in a line of programs
+# of a growing size, then the text compared with the one before, the line that changed lexed again, the lexeme view
+# and the diagnostics made (what 124proj.py does after an edit, without Tkinter), which should stay about flat
+# usage (from the "source code" folder): python benchmarks/liveedit.py [keystrokes]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import livelexer
+import lexemeview
+from straightline import straightlineprogram
+
+# time of one update of buffer to text
+def update(buffer, text):
+    start = time.perf_counter()
+    livelexer.updatebuffer(buffer, text)
+    lexemeview.textview(buffer["rows"], buffer["starts"], 20)
+    livelexer.bufferdiagnostics(buffer)
+    return time.perf_counter() - start
+
+def main(arguments):
+    keystrokes = int(arguments[0]) if len(arguments) != 0 else 50
+    for count in [1000, 10000, 50000]:
+        lines = straightlineprogram(count).split("\n")
+        buffer = livelexer.newbuffer()
+        first = update(buffer, "\n".join(lines))
+        timings = []
+        for keystroke in range(0, keystrokes):          # typing at the end of a line in the middle
+            lines[count // 2] += "x"
+            timings.append(update(buffer, "\n".join(lines)))
+        timings.sort()
+        relexed = buffer["relexed"]
+        lines[count // 2] = "OBTW"                      # a comment opened above half of the program
+        opened = update(buffer, "\n".join(lines))
+        print("%6d lines: first lex %7.1f ms, keystroke median %5.2f ms worst %5.2f ms (%d line lexed), OBTW typed %6.1f ms (%d lines lexed)" % (count, first * 1000, timings[len(timings) // 2] * 1000, timings[-1] * 1000, relexed, opened * 1000, buffer["relexed"]))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,88 @@
+# Load test of the interpreter server (see lolserver.py): clients threads send requests (the testcases and generated
+# programs, each one many times) and the latency of each request is measured, then compared with starting
+# lolrun.py for a single program (what every request would cost without the server)
+# usage (from the "source code" folder): python benchmarks/loadtest.py [requests] [clients] [workers] [--url url]
+# without --url a server is started here (on a free port) and stopped at the end
+import os
+import sys
+import time
+import tempfile
+import threading
+import subprocess
+
+sourcefolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, sourcefolder)
+import lolclient
+import lolserver
+from generate import generate
+
+# the programs sent: the testcases and a few generated ones
+def programs():
+    found = []
+    for (folder, folders, files) in os.walk(os.path.join(sourcefolder, "testcases")):
+        folders.sort()
+        for name in sorted(files):
+            if name.endswith(".lol"):
+                with open(os.path.join(folder, name), "r") as file:
+                    found.append(file.read() + "\n")
+    for kind in ("declarations", "output", "switch"):
+        found.append(generate(kind, 500))
+    return found
+
+# a client: sends count requests, programs in turn from first, and adds their latencies to latencies
+def client(sources, first, count, latencies, failures):
+    for index in range(first, first + count):
+        start = time.perf_counter()
+        try:
+            lolclient.runremote(sources[index % len(sources)], ["7"] * 10, index % 2 == 0)
+        except Exception:
+            failures.append(index)
+        latencies.append(time.perf_counter() - start)
+
+# latency of starting lolrun.py on source (the best of a few)
+def coldstart(source):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "program.lol")
+        with open(path, "w") as file:
+            file.write(source)
+        best = float("inf")
+        for run in range(0, 3):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(sourcefolder, "lolrun.py"), path], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+def main(arguments):
+    url = None
+    if "--url" in arguments and arguments.index("--url") + 1 < len(arguments):
+        url = arguments[arguments.index("--url") + 1]
+        del arguments[arguments.index("--url"):arguments.index("--url") + 2]
+    requests = int(arguments[0]) if len(arguments) != 0 else 2000
+    clients = int(arguments[1]) if len(arguments) > 1 else 8
+    workers = int(arguments[2]) if len(arguments) > 2 else os.cpu_count() or 1
+    server = None
+    if url == None:
+        server = lolserver.startserver("127.0.0.1", 0, workers)
+        url = "http://127.0.0.1:%d" % server.server_address[1]
+    lolclient.clientsettings["url"] = url
+    sources = programs()
+    latencies = []
+    failures = []
+    threads = [threading.Thread(target=client, args=(sources, index * (requests // clients), requests // clients, latencies, failures)) for index in range(0, clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    metrics = lolclient.servermetrics()
+    print("%d requests from %d clients in %.2f s: %.0f requests/s, %d failed" % (len(latencies), clients, elapsed, len(latencies) / elapsed, len(failures)))
+    print("client latency: p50 %.1f ms, p95 %.1f ms, p99 %.1f ms, max %.1f ms" % tuple([latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000 for fraction in (0.5, 0.95, 0.99, 1.0)]))
+    print("server: %d requests, %d cache hits, p50 %.1f ms, p95 %.1f ms, queue %s" % (metrics["requests"], metrics["cachehits"], metrics["latency"]["p50"] * 1000, metrics["latency"]["p95"] * 1000, metrics["queue"]))
+    print("without the server (starting lolrun.py): %.1f ms for one testcase" % (coldstart(sources[0]) * 1000))
+    if server != None:
+        lolserver.stopserver(server)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,39 @@
+# Iterations per second of loops (IM IN YR ... IM OUTTA YR): a counter loop of a million iterations, the same loop
+# with a body, and a WILE loop left with GTFO. The body of a loop is compiled once, so the code does not grow with the
+# number of iterations.
+# usage (from the "source code" folder): python benchmarks/loops.py [iterations] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# the loops measured: [name, program text] for count iterations
+def loopprograms(count):
+    counter = ["HAI", "I HAS A i ITZ 0", "IM IN YR counter UPPIN YR i TIL BOTH SAEM i AN " + str(count), "IM OUTTA YR counter", "KTHXBYE"]
+    body = ["HAI", "I HAS A i ITZ 0", "I HAS A total ITZ 0", "IM IN YR summing UPPIN YR i TIL BOTH SAEM i AN " + str(count),
+            "total R SUM OF total AN PRODUKT OF i AN 2", "IM OUTTA YR summing", "KTHXBYE"]
+    breaking = ["HAI", "I HAS A i ITZ " + str(count), "IM IN YR down WILE WIN", "i R DIFF OF i AN 1", "BOTH SAEM i AN 0",
+                "O RLY?", "YA RLY", "GTFO", "NO WAI", "OIC", "IM OUTTA YR down", "KTHXBYE"]
+    return [["counter", "\n".join(counter) + "\n"], ["body", "\n".join(body) + "\n"], ["GTFO", "\n".join(breaking) + "\n"]]
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 1000000
+    runs = int(arguments[1]) if len(arguments) > 1 else 3
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    for [name, source] in loopprograms(count):
+        start = time.perf_counter()
+        program = lolinterpreter.cachedprogram(source)
+        compiletime = time.perf_counter() - start
+        best = float("inf")
+        for run in range(0, runs):
+            start = time.perf_counter()
+            result = lolinterpreter.runsource(source, False)
+            best = min(best, time.perf_counter() - start)
+            if result["error"] != None:
+                print("program stopped on an error: " + result["error"])
+        print("%-8s %d iterations, %d instructions (compiled in %.4f s), %.3f s, %.0f iterations/s" % (name, count, len(program["code"]), compiletime, best, count / best))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
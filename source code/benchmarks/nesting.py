@@ -0,0 +1,33 @@
+# Scaling benchmark: one expression nested deeper and deeper (SUM OF chains nested on either operand, NOT chains, SMOOSH chains)
+# usage (from the "source code" folder): python benchmarks/nesting.py [deepest level]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+def nestedexpressions(depth):
+    return {
+        "SUM OF":   "SUM OF " * depth + "1" + " AN 1" * depth,
+        "SUM OF 1": "SUM OF 1 AN " * depth + "1",
+        "NOT":      "NOT " * depth + "WIN",
+        "SMOOSH":   "SMOOSH \"a\" AN " * depth + "\"a\""
+    }
+
+def main(arguments):
+    deepest = int(arguments[0]) if len(arguments) != 0 else 16000
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    depth = deepest // 8
+    while depth <= deepest:
+        for name, expression in nestedexpressions(depth).items():
+            start = time.perf_counter()
+            result = lolinterpreter.executesource("HAI\n" + expression + "\nKTHXBYE\n")
+            elapsed = time.perf_counter() - start
+            if result[2] != None:
+                print("program stopped on an error: " + result[2])
+            print("%-8s depth %6d: %.3f s (%.2f us/level)" % (name, depth, elapsed, elapsed / depth * 1000000))
+        depth *= 2
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
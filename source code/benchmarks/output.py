@@ -0,0 +1,55 @@
+# Time of an output-heavy program: every VISIBLE written to its target right away like before, against an output sink
+# (batched writes, and for the Text widget a capped refresh rate and a bounded scrollback)
+# usage (from the "source code" folder): python benchmarks/output.py [lines]
+# the Text widget needs a display, without one only the file targets are measured
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+import outputsink
+
+def outputprogram(count):
+    program = ["HAI", "I HAS A x ITZ 0"]
+    for index in range(0, count):
+        program.append("VISIBLE \"line \" x \" of the output\"")
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+def measure(name, write, finish, program):
+    lolinterpreter.iohandlers["write"] = write
+    start = time.perf_counter()
+    lolinterpreter.runprogram(program, lolinterpreter.newslots(program))
+    finish()
+    print("%-40s %.3f s" % (name, time.perf_counter() - start))
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 100000
+    program = lolinterpreter.compilesource(outputprogram(count))
+    stream = open(os.devnull, "w")
+    measure("file, every write", stream.write, stream.flush, program)
+    sink = outputsink.streamsink(stream)
+    measure("file, output sink", lambda text: outputsink.sinkwrite(sink, text), lambda: outputsink.sinkclose(sink), program)
+    try:
+        import tkinter as tk
+        window = tk.Tk()
+    except Exception as error:
+        print("no display (" + str(error).strip() + "), the Text widget is not measured")
+        return
+    display = tk.Text(window)
+    def displaywrite(text):
+        display.insert(tk.END, text)
+        window.update_idletasks()
+    def displaytrim(chars):
+        display.delete("1.0", "1.0 + " + str(chars) + " chars")
+    measure("Text widget, every write", displaywrite, lambda: None, program)
+    display.delete("1.0", tk.END)
+    sink = outputsink.newsink(displaywrite, 1 / 30, 1000000, 5000, displaytrim)
+    measure("Text widget, output sink (5000 lines)", lambda text: outputsink.sinkwrite(sink, text), lambda: outputsink.sinkclose(sink), program)
+    print("lines kept in the widget: %d, spilled: %d" % (int(display.index("end - 1 chars").split(".")[0]) - 1, sink["spilledlines"]))
+    if outputsink.spillpath(sink) != None:
+        os.remove(outputsink.spillpath(sink))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
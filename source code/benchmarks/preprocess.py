@@ -0,0 +1,46 @@
+# Preprocessing (comment removal and delimiter checks, see lolinterpreter.preprocess) of sources of growing size:
+# the time per line should stay flat, and the memory used by the pass itself should not grow with the source
+# usage (from the "source code" folder): python benchmarks/preprocess.py [lines]
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# a program of about count lines mixing code, whitespace lines and the three kinds of comments
+def commentedprogram(count):
+    block = [
+        "VISIBLE SUM OF var AN 1",
+        "    ",
+        "BTW a comment line",
+        "var R PRODUKT OF var AN 2 BTW an inline comment",
+        "OBTW",
+        "a multiline comment",
+        "TLDR",
+        "VISIBLE var"
+    ]
+    return "HAI\nI HAS A var ITZ 0\n" + "\n".join(block * (count // len(block))) + "\nKTHXBYE\n"
+
+# time of the pass over source (the lines are not kept) and the peak memory of the pass
+def measure(source):
+    status = {}
+    tracemalloc.start()
+    start = time.perf_counter()
+    for pair in lolinterpreter.preprocess(source, status):
+        pass
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return [elapsed, peak, status["error"]]
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 50000
+    for scale in [1, 2, 4, 8]:
+        source = commentedprogram(count * scale)
+        [elapsed, peak, error] = measure(source)
+        print("%8d lines (%5.1f MB): %.3f s, %.2f us per line, peak %.1f KB, error %s" % (count * scale, len(source) / 1000000, elapsed, elapsed / (count * scale) * 1000000, peak / 1000, error))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
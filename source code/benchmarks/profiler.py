@@ -0,0 +1,52 @@
+# Cost of the profiler (see lolinterpreter.newprofile): a run without a profile runs the code as compiled (no MARK
+# in it), so it should take the same time as before, and a profiled run pays one MARK per line
+# usage (from the "source code" folder): python benchmarks/profiler.py [lines] [runs]
+# The programs with malformed blocks (see generate.malformedprograms) are also run profiled, to check that they stop
+# on the same error as without the profiler (the exit code is 1 if one does not)
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from straightline import straightlineprogram
+from generate import generate, malformedprograms
+
+# best time of runs runs of source, with a new profile for each run if profiled
+def measure(source, profiled, runs):
+    best = float("inf")
+    for run in range(0, runs):
+        profile = lolinterpreter.newprofile() if profiled else None
+        start = time.perf_counter()
+        lolinterpreter.runsource(source, False, None, profile)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 20000
+    runs = int(arguments[1]) if len(arguments) > 1 else 10
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    for [name, source] in [["straight-line", straightlineprogram(count)], ["switch", generate("switch")], ["arithmetic", generate("arithmetic")]]:
+        program = lolinterpreter.cachedprogram(source)     # compiled once, then taken from the cache
+        marks = len([opcode for (opcode, argument) in program["code"] if opcode == "MARK"])
+        plain = measure(source, False, runs)
+        again = measure(source, False, runs)            # the noise between two runs of the same code
+        profiled = measure(source, True, runs)
+        print("%-14s disabled %.4f s / %.4f s (%+.1f%%, %d MARK compiled)  profiled %.4f s (%+.1f%%)" % (name, plain, again, (again / plain - 1) * 100, marks, profiled, (profiled / plain - 1) * 100))
+    profile = lolinterpreter.newprofile()
+    run = lolinterpreter.runsource(straightlineprogram(count), False, None, profile)
+    report = lolinterpreter.profilereport(profile, run["program"])
+    print("phases: " + ", ".join(["%s %.4f s" % (phase, seconds) for (phase, seconds) in report["phases"].items()]))
+    print("kinds:  " + ", ".join(["%s %d calls %.4f s" % (kind, entry["calls"], entry["seconds"]) for (kind, entry) in report["kinds"].items()]))
+    different = 0
+    for source in malformedprograms():
+        expected = lolinterpreter.runsource(source, False)["error"]
+        error = lolinterpreter.runsource(source, False, None, lolinterpreter.newprofile())["error"]
+        if error != expected:
+            different += 1
+            print("profiled run stopped on %r instead of %r:\n%s" % (error, expected, source))
+    print("malformed blocks: %d programs, %d stopped on a different error when profiled" % (len(malformedprograms()), different))
+    return 1 if different != 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,48 @@
+# Startup-time benchmark: headless runner (lolrun.py) against the GUI path (124proj.py)
+# usage (from the "source code" folder): python benchmarks/startup.py [runs]
+# Each measurement is a fresh interpreter process, the median wall time of all runs is reported.
+# The GUI path builds the whole window, draws it once and destroys it (124proj.py only enters the main loop when it is
+# run as the main program), so it needs a display; without one, only the cost of importing tkinter is measured as a
+# lower bound. A command still running after timeout seconds is stopped and reported as unavailable.
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+sourcefolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sampleprogram = os.path.join("testcases", "vardecinit.lol")
+timeout = 60
+
+commands = {
+    "python (empty)":       [sys.executable, "-c", "pass"],
+    "lolrun.py":            [sys.executable, "lolrun.py", sampleprogram],
+    "import tkinter":       [sys.executable, "-c", "import tkinter"],
+    "124proj.py (GUI)":     [sys.executable, "-c", "import runpy; window = runpy.run_path('124proj.py')['projectwindow']; window.update(); window.destroy()"],
+}
+
+def timeprocess(command, runs):
+    timings = []
+    for run in range(0, runs):
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(command, cwd=sourcefolder, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return "still running after %d s" % timeout
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            return result.stderr.decode(errors="replace").strip().split("\n")[-1]
+    return timings
+
+def main(arguments):
+    runs = int(arguments[0]) if len(arguments) != 0 else 20
+    print("%-20s %12s %12s" % ("command", "median ms", "min ms"))
+    for name, command in commands.items():
+        timings = timeprocess(command, runs)
+        if isinstance(timings, str):    # the command failed (e.g. no display for the GUI) or did not end
+            print("%-20s %s" % (name, "unavailable: " + timings))
+            continue
+        print("%-20s %12.1f %12.1f" % (name, statistics.median(timings) * 1000, min(timings) * 1000))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,34 @@
+# Throughput benchmark: long straight-line programs (declarations, assignments, expressions, VISIBLE)
+# usage (from the "source code" folder): python benchmarks/straightline.py [lines]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+def straightlineprogram(count):
+    program = ["HAI"]
+    for index in range(0, count // 5):
+        name = "var" + str(index)
+        program.append("I HAS A " + name + " ITZ " + str(index))
+        program.append(name + " R SUM OF " + name + " AN PRODUKT OF 2 AN 3")
+        program.append("BOTH SAEM " + name + " AN 6")
+        program.append("EITHER OF WIN AN FAIL")
+        program.append("VISIBLE \"value: \" " + name)
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 10000
+    source = straightlineprogram(count)
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    start = time.perf_counter()
+    result = lolinterpreter.executesource(source)
+    elapsed = time.perf_counter() - start
+    if result[2] != None:
+        print("program stopped on an error: " + result[2])
+    print("%d lines in %.3f s (%.0f lines/s)" % (count, elapsed, count / elapsed))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,44 @@
+# String building: a SMOOSH and a VISIBLE line with a growing number of operands (the time per operand should stay
+# flat), and the YARN literals of a program repeating the same few strings (interned, see lolinterpreter.yarnconstant)
+# usage (from the "source code" folder): python benchmarks/strings.py [operands] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# a program with one line made of prefix followed by count operands (a variable and literals in turn) and separator
+def operandprogram(prefix, separator, count):
+    operands = ["var" if index % 2 == 0 else "\"lol\"" for index in range(0, count)]
+    return "HAI\nI HAS A var ITZ \"cat \"\n" + prefix + separator.join(operands) + "\nKTHXBYE\n"
+
+# best run time of the program text source
+def measure(source, runs):
+    program = lolinterpreter.compilesource(source)
+    best = float("inf")
+    for run in range(0, runs):
+        start = time.perf_counter()
+        result = lolinterpreter.runprogram(program, lolinterpreter.newslots(program))
+        best = min(best, time.perf_counter() - start)
+        if result != None:
+            print("program stopped on an error: " + result[0])
+    return best
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 10000
+    runs = int(arguments[1]) if len(arguments) > 1 else 5
+    output = []
+    lolinterpreter.iohandlers["write"] = output.append
+    for [name, prefix, separator] in [["SMOOSH", "SMOOSH ", " AN "], ["VISIBLE", "VISIBLE ", " "]]:
+        timings = []
+        for scale in [1, 4, 16]:
+            elapsed = measure(operandprogram(prefix, separator, count * scale), runs)
+            timings.append("%d operands %.4f s (%.3f us each)" % (count * scale, elapsed, elapsed / (count * scale) * 1000000))
+        print("%-8s %s" % (name, ", ".join(timings)))
+    program = lolinterpreter.compilesource("HAI\n" + "VISIBLE \"meow\" \"purr\"\n" * count + "KTHXBYE\n")
+    constants = [argument for (opcode, argument) in program["code"] if opcode == "LOADCONST"]
+    print("%d YARN literals in the code, %d distinct values" % (len(constants), len(set([id(value) for value in constants]))))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
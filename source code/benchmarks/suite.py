@@ -0,0 +1,131 @@
+# Benchmark suite: runs the programs of the testcases folder and the generated workloads (see generate.py) without
+# the GUI, and compares their timings and peak memory with a JSON baseline, flagging the ones that got slower or
+# bigger by more than the threshold (the exit code is 1 if there is one)
+# usage (from the "source code" folder):
+#   python benchmarks/suite.py [--runs count] [--threshold fraction] [--baseline file] [--save] [--only name]
+# --save writes the results as the new baseline (benchmarks/baseline.json by default) instead of comparing them
+# Timings depend on the machine, so the baseline is not part of the sources: write one with --save on the machine the
+# suite runs on (before the changes to measure) and compare with it there
+# A workload is measured three ways: "compile" (first run, compiled from the text), "run" (best of the runs of the
+# cached program) and "peak" (bytes allocated at most during the first run, measured apart as tracing slows it down)
+import os
+import sys
+import json
+import time
+import platform
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from generate import generate
+
+benchmarkfolder = os.path.dirname(os.path.abspath(__file__))
+testcasefolder = os.path.join(os.path.dirname(benchmarkfolder), "testcases")
+settings = {"runs": 5, "threshold": 0.25, "floor": 0.002, "baseline": os.path.join(benchmarkfolder, "baseline.json")}
+# floor: differences of less than this many seconds are never flagged (too small to be told apart from noise)
+
+# the workloads: [name, program text], the testcases first (in the order of their paths)
+def workloads():
+    found = []
+    for (folder, folders, files) in os.walk(testcasefolder):
+        folders.sort()
+        for name in sorted(files):
+            if name.endswith(".lol"):
+                with open(os.path.join(folder, name), "r") as file:
+                    text = file.read()
+                found.append(["testcase " + os.path.relpath(os.path.join(folder, name), testcasefolder), text + "\n"])
+    for kind in ("declarations", "arithmetic", "allof", "switch", "output"):
+        found.append([kind, generate(kind)])
+    return found
+
+# one run of source, every GIMMEH gets the same input, the output is dropped
+def runonce(source):
+    lolinterpreter.iohandlers["read"] = lolinterpreter.listreader(["42"] * 1000)
+    return lolinterpreter.runsource(source, False)
+
+# compile, run and peak of source
+def measure(source, runs):
+    lolinterpreter.clearcache()
+    start = time.perf_counter()
+    run = runonce(source)
+    compiletime = time.perf_counter() - start
+    runtime = float("inf")
+    for index in range(0, runs):
+        start = time.perf_counter()
+        runonce(source)
+        runtime = min(runtime, time.perf_counter() - start)
+    lolinterpreter.clearcache()
+    tracemalloc.start()
+    runonce(source)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"compile": compiletime, "run": runtime, "peak": peak, "error": run["error"]}
+
+# the metrics of result worse than the ones of base by more than the threshold, as texts
+def regressions(result, base):
+    found = []
+    for metric in ("compile", "run"):
+        if result[metric] > base[metric] * (1 + settings["threshold"]) and result[metric] - base[metric] > settings["floor"]:
+            found.append("%s %.4f s -> %.4f s (%+.0f%%)" % (metric, base[metric], result[metric], (result[metric] / base[metric] - 1) * 100))
+    if result["peak"] > base["peak"] * (1 + settings["threshold"]):
+        found.append("peak %.1f KB -> %.1f KB (%+.0f%%)" % (base["peak"] / 1000, result["peak"] / 1000, (result["peak"] / base["peak"] - 1) * 100))
+    return found
+
+def main(arguments):
+    save = False
+    only = None
+    while len(arguments) != 0:
+        if arguments[0] == "--save":
+            save = True
+            arguments = arguments[1:]
+        elif arguments[0] in ("--runs", "--threshold", "--baseline", "--only") and len(arguments) > 1:
+            if arguments[0] == "--runs":
+                settings["runs"] = int(arguments[1])
+            elif arguments[0] == "--threshold":
+                settings["threshold"] = float(arguments[1])
+            elif arguments[0] == "--baseline":
+                settings["baseline"] = arguments[1]
+            else:
+                only = arguments[1]
+            arguments = arguments[2:]
+        else:
+            sys.stderr.write("usage: python benchmarks/suite.py [--runs count] [--threshold fraction] [--baseline file] [--save] [--only name]\n")
+            return 2
+    baseline = None
+    if not save and os.path.isfile(settings["baseline"]):
+        with open(settings["baseline"], "r") as file:
+            baseline = json.load(file)["workloads"]
+    output = []
+    lolinterpreter.iohandlers["write"] = output.append
+    results = {}
+    flagged = 0
+    for [name, source] in workloads():
+        if only != None and only not in name:
+            continue
+        result = measure(source, settings["runs"])
+        del output[:]
+        results[name] = {"compile": round(result["compile"], 6), "run": round(result["run"], 6), "peak": result["peak"]}
+        line = "%-28s compile %8.4f s  run %8.4f s  peak %9.1f KB" % (name, result["compile"], result["run"], result["peak"] / 1000)
+        if result["error"] != None and not name.startswith("testcase"):      # a generated workload must run to the end
+            line += "  stopped: " + result["error"].strip()
+        if baseline != None and name in baseline:
+            found = regressions(result, baseline[name])
+            if len(found) != 0:
+                flagged += 1
+                line += "  REGRESSION: " + ", ".join(found)
+        elif baseline != None:
+            line += "  (not in the baseline)"
+        print(line)
+    if save:
+        with open(settings["baseline"], "w") as file:
+            json.dump({"python": platform.python_version(), "runs": settings["runs"], "workloads": results}, file, indent=1)
+        print("baseline written to " + settings["baseline"])
+    elif baseline == None:
+        print("no baseline to compare with (write one with --save)")
+    elif flagged != 0:
+        print("%d workloads regressed by more than %.0f%%" % (flagged, settings["threshold"] * 100))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,42 @@
+# Run time of WTF? blocks with many cases: the case that runs is looked up in the dispatch table of the block,
+# so the first, the last and the default case should take the same time whatever the number of cases
+# usage (from the "source code" folder): python benchmarks/switch.py [blocks] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# blocks switch blocks of cases OMGs each, run with x set to value
+def switchprogram(cases, blocks, value):
+    block = ["SUM OF x AN 0", "WTF?"]
+    for case in range(0, cases):
+        block.extend(["OMG " + str(case), "y R SUM OF y AN " + str(case), "GTFO"])
+    block.extend(["OMGWTF", "y R DIFF OF y AN 1", "OIC"])
+    program = ["HAI", "I HAS A x ITZ " + str(value), "I HAS A y ITZ 0"]
+    for copy in range(0, blocks):
+        program.extend(block)
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+def main(arguments):
+    blocks = int(arguments[0]) if len(arguments) != 0 else 100
+    runs = int(arguments[1]) if len(arguments) > 1 else 20
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    for cases in (10, 100, 1000):
+        timings = []
+        for [name, value] in [["first", 0], ["last", cases - 1], ["default", -1]]:
+            program = lolinterpreter.compilesource(switchprogram(cases, blocks, value))
+            elapsed = float("inf")
+            for run in range(0, runs):
+                start = time.perf_counter()
+                result = lolinterpreter.runprogram(program, lolinterpreter.newslots(program))
+                elapsed = min(elapsed, time.perf_counter() - start)
+                if result != None:
+                    print("program stopped on an error: " + result[0])
+            timings.append("%s %.2f us" % (name, elapsed / blocks * 1000000))
+        print("%4d cases, per switch: %s" % (cases, ", ".join(timings)))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
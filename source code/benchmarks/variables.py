@@ -0,0 +1,47 @@
+# Run time and memory of a variable-heavy program: many declared variables read and assigned on every line
+# (variables are resolved to slots when compiling, see lolinterpreter.slotof)
+# usage (from the "source code" folder): python benchmarks/variables.py [variables] [lines] [runs]
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+
+# a program declaring variables, then count lines of assignments and comparisons between them
+def variableprogram(variables, count):
+    names = ["var" + str(index) for index in range(0, variables)]
+    program = ["HAI"] + ["I HAS A " + names[index] + " ITZ " + str(index) for index in range(0, variables)]
+    for index in range(0, count):
+        [first, second, third] = [names[index % variables], names[index * 7 % variables], names[index * 13 % variables]]
+        if index % 2 == 0:
+            program.append("DIFFRINT " + first + " AN " + second)
+        else:
+            program.append(first + " R SUM OF " + second + " AN PRODUKT OF " + third + " AN 2")
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+def main(arguments):
+    variables = int(arguments[0]) if len(arguments) != 0 else 200
+    count = int(arguments[1]) if len(arguments) > 1 else 20000
+    runs = int(arguments[2]) if len(arguments) > 2 else 7
+    program = lolinterpreter.compilesource(variableprogram(variables, count))
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    best = float("inf")
+    for run in range(0, runs):
+        slots = lolinterpreter.newslots(program)
+        start = time.perf_counter()
+        result = lolinterpreter.runprogram(program, slots)
+        best = min(best, time.perf_counter() - start)
+        if result != None:
+            print("program stopped on an error: " + result[0])
+    tracemalloc.start()
+    lolinterpreter.runprogram(program, lolinterpreter.newslots(program))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    symbols = lolinterpreter.slotsymbols(program, slots)
+    print("%d variables, %d lines: run %.4f s (%.2f us per line), peak %.1f KB, %d symbols" % (variables, count, best, best / count * 1000000, peak / 1000, len(symbols)))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
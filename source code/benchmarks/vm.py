@@ -0,0 +1,108 @@
+# Speed of the stack machine against walking the expression trees (expressiontree + evaluateexpression below, the way
+# every statement was run before the compile step)
+# usage (from the "source code" folder): python benchmarks/vm.py [lines] [runs]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from lolinterpreter import Token, operationmodes, operandevaulator, shortcircuits, arithmetics, booleans, typedoperand, errorat, expressiontree
+
+expressions = [
+    "SUM OF x AN PRODUKT OF 2 AN 3",
+    "BOTH OF BOTH SAEM x AN 6 AN EITHER OF WIN AN FAIL",
+    "SMOOSH \"x is \" AN x AN \" and y is \" AN y MKAY",
+    "ALL OF WIN AN DIFFRINT x AN y AN NOT FAIL MKAY",
+    "QUOSHUNT OF BIGGR OF x AN y AN SMALLR OF 2.5 AN y"
+]
+
+def expressionprogram(count):
+    program = ["HAI", "I HAS A x ITZ 4", "I HAS A y ITZ 7"]
+    for index in range(0, count):
+        program.append(expressions[index % len(expressions)])
+    program.append("KTHXBYE")
+    return "\n".join(program) + "\n"
+
+# evaluates an expression tree by walking it, operands left to right, with an explicit stack of the operations being
+# evaluated (the way expressions were run before the compile step)
+def evaluateexpression(tree, currentsymbols):
+    stack = [[tree, []]]    # operation and the values of its evaluated operands
+    while True:
+        [node, inoperand] = stack[-1]
+        if len(inoperand) != len(node[1]):
+            operand = node[1][len(inoperand)]
+            if not isinstance(operand, Token):  # nested
+                stack.append([operand, []])     # expression
+                continue
+            result = operandevaulator(operand, currentsymbols, operationmodes[node[0]], node[0])
+            if isinstance(result, str):
+                return result
+            inoperand.append(result)
+            if not shortcircuits(node[0], result):
+                continue
+        elif operationmodes[node[0]] == "mathmode":                         # --|
+            result = arithmetics(node[0], inoperand)                        #   |
+            if isinstance(result, str):                                     #   |
+                return errorat(result, node[2])                             #   |
+        elif operationmodes[node[0]] == "boolmode":                         #   |--> Actual operation
+            result = booleans(node[0], inoperand)                           #   |
+        else:                                                               #   |
+            result = ["".join([item[0] for item in inoperand]), "YARN"]     # --|
+        # the operation is done, its result is an operand of the operation below it
+        stack.pop()
+        while len(stack) != 0:
+            [parent, inoperand] = stack[-1]
+            result = typedoperand(result, node[2], operationmodes[parent[0]], parent[0])
+            if isinstance(result, str):
+                return result
+            inoperand.append(result)
+            if not shortcircuits(parent[0], result):
+                break
+            node = stack.pop()[0]
+        if len(stack) == 0:
+            return result
+
+# value of the expression of tokens (or an error message), the reference the stack machine is measured against
+def expressionanalyzer(tokens, currentsymbols):
+    tree = expressiontree(tokens)
+    if isinstance(tree, str):
+        return tree
+    return evaluateexpression(tree, currentsymbols)
+
+def treewalk(program, symbolgroup):
+    for line in range(0, len(program["source"])):
+        tokens = lolinterpreter.tokenize(program["source"][line], line + 1)
+        if lolinterpreter.statementkind(tokens) == "expression":
+            symbolgroup["IT"] = expressionanalyzer(tokens, symbolgroup)
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 10000
+    runs = int(arguments[1]) if len(arguments) > 1 else 5
+    source = expressionprogram(count)
+    lolinterpreter.iohandlers["write"] = lambda text: None
+
+    start = time.perf_counter()
+    program = lolinterpreter.compilesource(source)
+    compiletime = time.perf_counter() - start
+    treesymbols = {"IT": ["", ""], "x": [4, "NUMBR"], "y": [7, "NUMBR"]}
+    vmslots = lolinterpreter.newslots(program)
+
+    treetime = vmtime = float("inf")
+    for run in range(0, runs):
+        start = time.perf_counter()
+        treewalk(program, treesymbols)
+        treetime = min(treetime, time.perf_counter() - start)
+        start = time.perf_counter()
+        result = lolinterpreter.runprogram(program, vmslots)
+        vmtime = min(vmtime, time.perf_counter() - start)
+        if result != None:
+            print("program stopped on an error: " + result[0])
+    if treesymbols["IT"] != vmslots[0]:
+        print("results differ: " + str(treesymbols["IT"]) + " / " + str(vmslots[0]))
+    print("%d expressions, %d instructions, compiled in %.3f s" % (count, len(program["code"]), compiletime))
+    print("tree walking:  %.3f s (%.0f expressions/s)" % (treetime, count / treetime))
+    print("stack machine: %.3f s (%.0f expressions/s), %.1fx faster" % (vmtime, count / vmtime, treetime / vmtime))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,57 @@
+# Cost of running with a control (progress and Stop, see lolinterpreter.newcontrol) against a plain run, and how long
+# a run on a worker thread takes to stop and how often the main thread gets to run while it works (the GUI polls it)
+# usage (from the "source code" folder): python benchmarks/worker.py [lines] [runs]
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lolinterpreter
+from straightline import straightlineprogram
+
+# best time of runs runs of source, with a new control for each run if withcontrol
+def measure(source, withcontrol, runs):
+    best = float("inf")
+    for run in range(0, runs):
+        control = lolinterpreter.newcontrol() if withcontrol else None
+        start = time.perf_counter()
+        lolinterpreter.runsource(source, False, control)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# runs source until it is stopped (a run shorter than the control interval never checks "stop" itself)
+def runagain(source, control):
+    while not control["stop"] and lolinterpreter.runsource(source, False, control)["finished"]:
+        pass
+
+def main(arguments):
+    count = int(arguments[0]) if len(arguments) != 0 else 20000
+    runs = int(arguments[1]) if len(arguments) > 1 else 10
+    source = straightlineprogram(count)
+    lolinterpreter.iohandlers["write"] = lambda text: None
+    lolinterpreter.runsource(source, False)                 # compiled once, then taken from the cache
+    plain = measure(source, False, runs)
+    watched = measure(source, True, runs)
+    print("plain run     %.4f s" % plain)
+    print("with control  %.4f s (%+.1f%%)" % (watched, (watched / plain - 1) * 100))
+    # the program run again and again on a worker thread (with the same control) while the main thread polls
+    # every 16 ms like the GUI, then stopped
+    control = lolinterpreter.newcontrol()
+    worker = threading.Thread(target=runagain, args=(source, control), daemon=True)
+    worker.start()
+    gaps = []
+    last = time.perf_counter()
+    for poll in range(0, 30):
+        time.sleep(0.016)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+    control["stop"] = True
+    stopped = time.perf_counter()
+    worker.join()
+    print("polls while running: worst gap %.1f ms, %d instructions run" % (max(gaps) * 1000, control["instructions"]))
+    print("stopped %.1f ms after Stop" % ((time.perf_counter() - stopped) * 1000))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,59 @@
+# Virtualized lexeme table: the Treeview only holds the rows that can be seen, taken from the lexeme table
+# of the run (a list that can have millions of lexemes) when the view is scrolled, paged or jumped to a line
+# This module does not import Tkinter, the Treeview is only used through its methods (124proj.py creates it)
+import bisect
+
+
+# a view of the lexeme table rows (a list of [lexeme, classification]), lines is the [line number, index of
+# its first lexeme] of every line (see lolinterpreter.lexemelines), size the number of rows that can be seen
+def newview(rows, lines, size):
+    return {"rows": rows, "linenumbers": [line[0] for line in lines], "starts": [line[1] for line in lines], "offset": 0, "size": size}
+
+# a view of rows made of the lexemes of every line of a text, starts is the index of the first lexeme of each line
+# (line number 1 first), made without going through the lines (see livelexer.py)
+def textview(rows, starts, size):
+    return {"rows": rows, "linenumbers": range(1, len(starts) + 1), "starts": starts, "offset": 0, "size": size}
+
+# the offset of the first row seen, kept inside the table
+def clampoffset(view, offset):
+    return max(0, min(offset, len(view["rows"]) - view["size"]))
+
+# puts the rows from offset in the Treeview, reusing the items already in it (their iids are "0", "1", ...)
+def showpage(view, treeview, offset):
+    view["offset"] = clampoffset(view, offset)
+    page = view["rows"][view["offset"]:view["offset"] + view["size"]]
+    items = len(treeview.get_children())
+    for item in range(0, len(page)):                                                        # --|
+        if item < items:                                                                    #   |--> refresh the rows
+            treeview.item(str(item), text=page[item][0], values=(page[item][1],))           #   |--> already there, add
+        else:                                                                               #   |--> the missing ones
+            treeview.insert(parent='', index=item, iid=str(item), text=page[item][0], values=(page[item][1],))   # --|
+    if items > len(page):
+        treeview.delete(*[str(item) for item in range(len(page), items)])
+
+# position of the rows seen in the table, as the (first, last) fractions of a Scrollbar
+def scrollfractions(view):
+    if len(view["rows"]) == 0:
+        return (0.0, 1.0)
+    return (view["offset"] / len(view["rows"]), min(1.0, (view["offset"] + view["size"]) / len(view["rows"])))
+
+# offset after a Scrollbar command: ("moveto", fraction) or ("scroll", count, "units"/"pages")
+def scrolloffset(view, arguments):
+    if arguments[0] == "moveto":
+        return clampoffset(view, int(float(arguments[1]) * len(view["rows"])))
+    elif arguments[2] == "pages":
+        return clampoffset(view, view["offset"] + int(arguments[1]) * view["size"])
+    return clampoffset(view, view["offset"] + int(arguments[1]))
+
+# index of the first lexeme of a line of the program text (of the line before it if it has no lexemes)
+def lineindex(view, linenumber):
+    line = bisect.bisect_right(view["linenumbers"], linenumber) - 1
+    if line < 0:
+        return 0
+    return view["starts"][line]
+
+# "first-last of count" text of the rows seen
+def pagetext(view):
+    if len(view["rows"]) == 0:
+        return "0 of 0"
+    return str(view["offset"] + 1) + "-" + str(min(view["offset"] + view["size"], len(view["rows"]))) + " of " + str(len(view["rows"]))
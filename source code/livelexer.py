@@ -0,0 +1,148 @@
+# Live lexeme table of the editor: the lexemes and the diagnostics (code delimiters, comments, quotes) of the text
+# being edited, updated after each edit by lexing again only the lines that changed
+# This module does not import Tkinter, 124proj.py gives it the text of the code display (see lexemeview.py)
+import bisect
+import itertools
+import lolinterpreter
+
+livesettings = {"cachesize": 200000}    # lexed lines kept (by content) before the cache is emptied
+
+# A buffer holds the text, its lines, the entry of every line (see lexline), the lexemes of all the lines in one list
+# ("rows") with the number of lexemes of each line ("counts") and the index of the first one of each line ("starts",
+# with the number of rows at the end), and the lines that have a diagnostic ("flagged"), a HAI, a KTHXBYE or an OBTW
+# (sorted lists of line indexes). "cache" holds the entries by (comment state, line), "relexed" is the number of
+# lines lexed by the last update.
+def newbuffer():
+    return {"text": "", "lines": [""], "entries": [lexline("", False)], "rows": [], "counts": [0], "starts": [0, 0], "flagged": [], "hai": [], "kthxbye": [], "obtw": [], "cache": {}, "relexed": 0}
+
+# entry of a line of the program text lexed inside a comment (incomment) or not, like preprocess sees it:
+# "start" (incomment), "comment" (if the next line is inside a comment), "lexemes", "delimiter" ("HAI", "KTHXBYE"
+# or None), "obtw" (if it opens a comment) and "diagnostics" ([column or None, error message])
+def lexline(line, incomment):
+    entry = {"start": incomment, "comment": incomment, "lexemes": [], "delimiter": None, "obtw": False, "diagnostics": []}
+    patterns = lolinterpreter.patterns
+    errorcode = lolinterpreter.errorcode
+    if patterns["spaces"].search(line):
+        return entry
+    elif incomment:                                                 # --|
+        if "TLDR" in line and patterns["tldr"].search(line):        #   |
+            entry["comment"] = False                                #   |
+        return entry                                                #   |
+    elif "TLDR" in line and patterns["tldr"].search(line):          #   |--> comments, the same
+        entry["diagnostics"] = [[None, errorcode["nopairTLDR"]]]    #   |--> way as preprocess
+        return entry                                                #   |
+    elif "OBTW" in line and patterns["obtw"].search(line):          #   |
+        entry["comment"] = True                                     #   |
+        entry["obtw"] = True                                        #   |
+        return entry                                                #   |
+    elif "BTW" in line and patterns["btw"].search(line):            #   |
+        line = patterns["btw"].split(line)[0]                       #   |
+        if len(line) == 0:                                          #   |
+            return entry                                            # --|
+    if patterns["hai"].search(line):
+        entry["delimiter"] = "HAI"
+    elif patterns["kthxbye"].search(line):
+        entry["delimiter"] = "KTHXBYE"
+    tokens = lolinterpreter.tokenize(line, 0)
+    entry["lexemes"] = lolinterpreter.tokenlexemes(tokens)
+    for token in tokens:
+        if token.kind == "UNPAIRED":
+            entry["diagnostics"].append([token.column, errorcode["unpairedquotes"]])
+    return entry
+
+# entry of a line, lexed only if the same line was not lexed before in the same comment state
+def cachedline(buffer, line, incomment):
+    entry = buffer["cache"].get((incomment, line))
+    if entry == None:
+        if len(buffer["cache"]) >= livesettings["cachesize"]:
+            buffer["cache"].clear()
+        entry = lexline(line, incomment)
+        buffer["cache"][(incomment, line)] = entry
+    return entry
+
+# length of the text at the start (or at the end if fromend) of old and new that is the same, at most limit characters
+# (the texts are compared in slices, halving the slice on a difference)
+def commonlength(old, new, limit, fromend):
+    same = 0
+    while same < limit:
+        middle = (same + limit + 1) // 2
+        if fromend and old[len(old) - middle:len(old) - same] == new[len(new) - middle:len(new) - same]:
+            same = middle
+        elif not fromend and old[same:middle] == new[same:middle]:
+            same = middle
+        else:
+            limit = middle - 1
+    return same
+
+# puts found (the positions in the lines first to newend) in place of the positions of positions in the lines
+# first to oldend, and moves the ones after them as the lines were
+def replacepositions(positions, first, oldend, newend, found):
+    low = bisect.bisect_left(positions, first)
+    high = bisect.bisect_left(positions, oldend)
+    positions[low:] = found + [position + newend - oldend for position in positions[high:]]
+
+# updates buffer to text: only the lines that changed are split and lexed again (and the lines after them whose
+# comment state changed), the texts are only compared, so an edit costs about the same in a text of any size
+def updatebuffer(buffer, text):
+    old = buffer["text"]
+    if text == old:
+        buffer["relexed"] = 0
+        return
+    same = commonlength(old, text, min(len(old), len(text)), False)
+    sameend = commonlength(old, text, min(len(old), len(text)) - same, True)
+    start = old.rfind("\n", 0, same) + 1                # --|
+    oldstop = old.find("\n", len(old) - sameend)        #   |--> the lines with a change,
+    newstop = text.find("\n", len(text) - sameend)      #   |--> from the start of the first
+    oldstop = len(old) if oldstop == -1 else oldstop    #   |--> to the end of the last
+    newstop = len(text) if newstop == -1 else newstop   # --|
+    first = old.count("\n", 0, start)
+    oldend = first + old.count("\n", start, oldstop) + 1
+    changedlines = text[start:newstop].split("\n")
+    newend = first + len(changedlines)
+    lines = buffer["lines"]
+    entries = buffer["entries"]
+    lines[first:oldend] = changedlines
+    state = entries[first - 1]["comment"] if first != 0 else False
+    changed = []
+    for index in range(first, newend):
+        changed.append(cachedline(buffer, lines[index], state))
+        state = changed[-1]["comment"]
+    while oldend < len(entries) and entries[oldend]["start"] != state:     # a comment opened or closed above
+        changed.append(cachedline(buffer, lines[newend], state))
+        state = changed[-1]["comment"]
+        oldend += 1
+        newend += 1
+    starts = buffer["starts"]
+    counts = [len(entry["lexemes"]) for entry in changed]
+    buffer["rows"][starts[first]:starts[oldend]] = [lexeme for entry in changed for lexeme in entry["lexemes"]]
+    moved = newend != oldend or sum(counts) != starts[oldend] - starts[first]     # if the lines after moved
+    buffer["counts"][first:oldend] = counts
+    if moved:
+        starts[first:] = itertools.accumulate(buffer["counts"][first:], initial=starts[first])
+    else:
+        starts[first:newend + 1] = itertools.accumulate(counts, initial=starts[first])
+    for [name, test] in [["flagged", lambda entry: len(entry["diagnostics"]) != 0], ["hai", lambda entry: entry["delimiter"] == "HAI"], ["kthxbye", lambda entry: entry["delimiter"] == "KTHXBYE"], ["obtw", lambda entry: entry["obtw"]]]:
+        found = [first + index for index in range(0, len(changed)) if test(changed[index])]
+        replacepositions(buffer[name], first, oldend, newend, found)
+    entries[first:oldend] = changed
+    buffer["text"] = text
+    buffer["relexed"] = len(changed)
+
+# diagnostics of the buffer: [line number (None for the whole text), message], the lines in order
+def bufferdiagnostics(buffer):
+    errorcode = lolinterpreter.errorcode
+    found = []
+    for line in buffer["flagged"]:
+        for [column, message] in buffer["entries"][line]["diagnostics"]:
+            if column != None:
+                message = lolinterpreter.errorat(message, lolinterpreter.Token("UNPAIRED", "\"", line + 1, column))
+            found.append([line + 1, message.rstrip("\n")])
+    if len(buffer["entries"]) != 0 and buffer["entries"][-1]["comment"]:
+        found.append([buffer["obtw"][-1] + 1, "Warning: Unpaired OBTW at line " + str(buffer["obtw"][-1] + 1)])
+    for [name, missing, double] in [["hai", "noHAI", "dblHAI"], ["kthxbye", "noKTHXBYE", "dblKTHXBYE"]]:
+        if len(buffer[name]) == 0:
+            found.append([None, errorcode[missing].rstrip("\n")])
+        elif len(buffer[name]) > 1:
+            found.append([buffer[name][1] + 1, errorcode[double].rstrip("\n")])
+    found.sort(key=lambda diagnostic: diagnostic[0] if diagnostic[0] != None else 0)
+    return found
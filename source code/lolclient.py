@@ -0,0 +1,72 @@
+# Client of the interpreter server (see lolserver.py), with the standard library only
+# usage: python lolclient.py [--url url] [--input file] [--metrics] [file.lol]
+# runs file.lol on the server and writes its output to stdout (the exit code is 1 if it stopped on an error),
+# --input takes the GIMMEH inputs from the lines of a file, --metrics writes the metrics of the server as JSON
+# Other tools can import it and call runremote (and servermetrics).
+import sys
+import json
+import os.path
+import urllib.request
+
+usage = "usage: python lolclient.py [--url url] [--input file] [--metrics] [file.lol]\n"
+clientsettings = {"url": "http://127.0.0.1:8124", "timeout": 60}
+
+
+# answer of the server to a request (see lolserver.py) running source with the GIMMEH inputs
+def runremote(source, inputs=[], lexemes=True, url=None):
+    body = json.dumps({"source": source, "inputs": inputs, "lexemes": lexemes}).encode("utf-8")
+    request = urllib.request.Request((url or clientsettings["url"]) + "/run", body, {"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=clientsettings["timeout"]) as response:
+        return json.loads(response.read())
+
+# metrics of the server (see lolserver.servermetrics)
+def servermetrics(url=None):
+    with urllib.request.urlopen((url or clientsettings["url"]) + "/metrics", timeout=clientsettings["timeout"]) as response:
+        return json.loads(response.read())
+
+def main(arguments):
+    inputpath = None
+    showmetrics = False
+    while len(arguments) != 0 and arguments[0].startswith("--"):
+        if arguments[0] == "--metrics":
+            showmetrics = True
+            arguments = arguments[1:]
+        elif arguments[0] in ("--url", "--input") and len(arguments) > 1:
+            if arguments[0] == "--url":
+                clientsettings["url"] = arguments[1]
+            else:
+                inputpath = arguments[1]
+            arguments = arguments[2:]
+        else:
+            sys.stderr.write(usage)
+            return 2
+    if len(arguments) > 1 or (len(arguments) == 0 and not showmetrics):
+        sys.stderr.write(usage)
+        return 2
+    if showmetrics:
+        sys.stdout.write(json.dumps(servermetrics(), indent=1) + "\n")
+    if len(arguments) == 0:
+        return 0
+    for path in [arguments[0]] + ([inputpath] if inputpath != None else []):
+        if not os.path.isfile(path):
+            sys.stderr.write("lolclient: no such file: " + path + "\n")
+            return 2
+    inputs = []
+    if inputpath != None:
+        with open(inputpath, "r") as file:
+            inputs = [line.rstrip("\r") for line in file.read().split("\n")]
+        if len(inputs) != 0 and inputs[-1] == "":
+            inputs.pop()
+    with open(arguments[0], "r") as file:
+        source = file.read()
+    answer = runremote(source, inputs, False)
+    sys.stdout.write(answer["output"])
+    if answer["error"] != None:
+        if not answer["error"].endswith("\n"):      # some error messages are not newline-terminated
+            sys.stdout.write("\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,226 @@
+# Batch grader: runs every LOLCODE program of a folder against every case of a test matrix on a pool of processes,
+# and compares the output of each run with the expected output (without the GUI, like lolrun.py)
+# usage: python lolgrade.py [--jobs count] [--timeout seconds] [--results file] folder matrix.json
+# The test matrix is a JSON file: {"cases": [{"name": "...", "inputs": ["GIMMEH input", ...], "expected": "output"}, ...]}
+# (a case may have its own "timeout"). Every run writes one line of JSON to the results (stdout by default) as soon as
+# it is done: "program", "case", "status" ("pass", "fail", "timeout" or "error"), "error" (the error message the
+# program stopped on, null if it ran to the end), "seconds" (run time, without compiling) and "diff" (the unified diff
+# of the expected and the actual output, empty if they match). Outputs are compared line by line without the trailing
+# spaces of the lines (VISIBLE ends each line with one) and without the trailing empty lines.
+# "error" is the status of a run that could not be graded (the grader itself failed on it, or its process died), the
+# other runs go on.
+# --jobs is the number of processes (the number of processors by default), --timeout the seconds a run may take
+# (10 by default). The exit code is 1 if a run did not pass.
+import os
+import sys
+import json
+import time
+import difflib
+import threading
+import multiprocessing
+import multiprocessing.connection
+import lolinterpreter
+
+usage = "usage: python lolgrade.py [--jobs count] [--timeout seconds] [--results file] folder matrix.json\n"
+gradesettings = {"jobs": os.cpu_count() or 1, "timeout": 10.0, "grace": 5.0}
+# grace: seconds a run may go on after its timeout (compiling, or a single long instruction that does not see the stop)
+# before its process is killed
+
+
+# the .lol files of folder (and its subfolders), in the order of their paths
+def programpaths(folder):
+    found = []
+    for (path, folders, files) in os.walk(folder):
+        folders.sort()
+        for name in sorted(files):
+            if name.endswith(".lol"):
+                found.append(os.path.join(path, name))
+    return found
+
+# the lines of an output to compare, without their trailing spaces and without the trailing empty lines
+def outputlines(text):
+    lines = [line.rstrip() for line in text.split("\n")]
+    while len(lines) != 0 and lines[-1] == "":
+        lines.pop()
+    return lines
+
+# one run (in a worker process): the program of path with the GIMMEH inputs and the expected output of case
+# the run is stopped (see lolinterpreter.newcontrol) if it takes longer than timeout seconds, compiling is not timed
+# (the programs are compiled once per process, see lolinterpreter.cachedprogram)
+def gradecase(path, case, timeout):
+    with open(path, "r") as file:
+        rawtextinput = file.read()
+    if not rawtextinput.endswith("\n"):     # same shape as the text taken from the code display
+        rawtextinput += "\n"
+    output = []
+    lolinterpreter.iohandlers["write"] = output.append
+    lolinterpreter.iohandlers["read"] = lolinterpreter.listreader(case.get("inputs", []))
+    lolinterpreter.cachedprogram(rawtextinput)     # compiled before the run is timed
+    control = lolinterpreter.newcontrol()
+    timer = threading.Timer(timeout, lambda: control.update(stop=True))
+    start = time.perf_counter()
+    timer.start()
+    try:
+        run = lolinterpreter.runsource(rawtextinput, False, control)
+    finally:
+        timer.cancel()
+    seconds = time.perf_counter() - start
+    expected = outputlines(case.get("expected", ""))
+    actual = outputlines("".join(output))
+    diff = list(difflib.unified_diff(expected, actual, "expected", "actual", lineterm=""))
+    status = "pass" if len(diff) == 0 else "fail"
+    if run["error"] == lolinterpreter.errorcode["stopped"]:
+        status = "timeout"
+    return {"program": path, "case": case.get("name"), "status": status, "error": run["error"], "seconds": round(seconds, 6), "diff": diff}
+
+# the result of a run that could not be graded
+def errorresult(path, case, status, message, seconds):
+    return {"program": path, "case": case.get("name"), "status": status, "error": message, "seconds": round(seconds, 6), "diff": []}
+
+
+# WORKERS
+# a worker process takes (path, case, timeout) from its connection and sends back the result, until it takes None
+# each worker has a connection of its own, so killing one (see grade) leaves the others and their connections working
+
+# the loop of a worker process
+def workerloop(connection):
+    while True:
+        task = connection.recv()
+        if task == None:
+            return
+        (path, case, timeout) = task
+        start = time.perf_counter()
+        try:
+            result = gradecase(path, case, timeout)
+        except Exception as error:          # MemoryError, RecursionError, ...: only this run is lost
+            result = errorresult(path, case, "error", type(error).__name__ + ": " + str(error), time.perf_counter() - start)
+        connection.send(result)
+
+# a new worker: [process, connection, task running, time it started, deadline]
+def startworker():
+    (connection, workerconnection) = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=workerloop, args=(workerconnection,), daemon=True)
+    process.start()
+    workerconnection.close()
+    return [process, connection, None, None, None]
+
+# stops a worker at once (a run past its deadline, or a process that died)
+def killworker(worker):
+    worker[0].kill()
+    worker[0].join()
+    worker[1].close()
+
+# runs every program of paths against every case on jobs processes, calls report with each result as soon as it is
+# done, returns the number of results by status
+# a run is stopped when it takes longer than its timeout (see gradecase), and its process is killed (and replaced)
+# if it is still running gradesettings["grace"] seconds later
+def grade(paths, cases, jobs, report):
+    counts = {"pass": 0, "fail": 0, "timeout": 0, "error": 0}
+    tasks = []
+    for path in paths:                  # the cases of a program one after the other, so that a process mostly
+        for case in cases:              # gets the same program again (taken from its cache)
+            tasks.append((path, case, case.get("timeout", gradesettings["timeout"])))
+    tasks.reverse()                     # taken from the end
+    workers = [startworker() for index in range(0, min(max(jobs, 1), len(tasks)))]
+    def finish(worker, result):
+        counts[result["status"]] += 1
+        worker[2] = None
+        report(result)
+    try:
+        while True:
+            for worker in workers:          # the idle workers get the next runs
+                if worker[2] == None and len(tasks) != 0:
+                    worker[2] = tasks.pop()
+                    worker[3] = time.perf_counter()
+                    worker[4] = worker[3] + worker[2][2] + gradesettings["grace"]
+                    worker[1].send(worker[2])
+            running = [worker for worker in workers if worker[2] != None]
+            if len(running) == 0:
+                break
+            wait = max(0.0, min([worker[4] for worker in running]) - time.perf_counter())
+            ready = multiprocessing.connection.wait([worker[1] for worker in running] + [worker[0].sentinel for worker in running], wait)
+            for index in range(0, len(workers)):
+                worker = workers[index]
+                if worker[2] == None:
+                    continue
+                (path, case, timeout) = worker[2]
+                seconds = time.perf_counter() - worker[3]
+                if worker[1] in ready:
+                    try:
+                        finish(worker, worker[1].recv())
+                        continue
+                    except (EOFError, OSError):         # died while sending
+                        pass
+                if worker[1] in ready or worker[0].sentinel in ready:
+                    killworker(worker)
+                    finish(worker, errorresult(path, case, "error", "the grading process died (exit code " + str(worker[0].exitcode) + ")", seconds))
+                    workers[index] = startworker()
+                elif time.perf_counter() >= worker[4]:
+                    killworker(worker)
+                    finish(worker, errorresult(path, case, "timeout", "killed after %.1f s" % seconds, seconds))
+                    workers[index] = startworker()
+    finally:
+        for worker in workers:
+            if worker[2] == None and worker[0].is_alive():
+                worker[1].send(None)
+                worker[0].join()
+            else:
+                killworker(worker)
+    return counts
+
+# if text is a number of seconds greater than 0
+def positivenumber(text):
+    try:
+        return float(text) > 0 and float(text) != float("inf")
+    except ValueError:
+        return False
+
+# writes a result as a line of JSON to stream, at once
+def writeresult(stream, result):
+    stream.write(json.dumps(result) + "\n")
+    stream.flush()
+
+def main(arguments):
+    resultspath = None
+    while len(arguments) != 0 and arguments[0].startswith("--"):
+        if arguments[0] in ("--jobs", "--timeout", "--results") and len(arguments) > 1:
+            if arguments[0] == "--jobs" and arguments[1].isdigit() and int(arguments[1]) > 0:
+                gradesettings["jobs"] = int(arguments[1])
+            elif arguments[0] == "--timeout" and positivenumber(arguments[1]):
+                gradesettings["timeout"] = float(arguments[1])
+            elif arguments[0] != "--results":
+                sys.stderr.write(usage)
+                return 2
+            else:
+                resultspath = arguments[1]
+            arguments = arguments[2:]
+        else:
+            sys.stderr.write(usage)
+            return 2
+    if len(arguments) != 2:
+        sys.stderr.write(usage)
+        return 2
+    if not os.path.isdir(arguments[0]):
+        sys.stderr.write("lolgrade: no such folder: " + arguments[0] + "\n")
+        return 2
+    if not os.path.isfile(arguments[1]):
+        sys.stderr.write("lolgrade: no such file: " + arguments[1] + "\n")
+        return 2
+    with open(arguments[1], "r") as file:
+        matrix = json.load(file)
+    cases = matrix["cases"] if isinstance(matrix, dict) else matrix
+    paths = programpaths(arguments[0])
+    start = time.perf_counter()
+    if resultspath != None:
+        with open(resultspath, "w") as results:
+            counts = grade(paths, cases, gradesettings["jobs"], lambda result: writeresult(results, result))
+    else:
+        counts = grade(paths, cases, gradesettings["jobs"], lambda result: writeresult(sys.stdout, result))
+    sys.stderr.write("%d passed, %d failed, %d timed out, %d errors in %.2f s\n" % (counts["pass"], counts["fail"], counts["timeout"], counts["error"], time.perf_counter() - start))
+    if counts["pass"] != sum(counts.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,2205 @@
+import re
+import sys
+import json
+import time
+import bisect
+import hashlib
+import collections
+
+
+# DICTIONARIES
+# Error logs
+errorcode = {
+    "noHAI":            "Error 01: Program has no HAI code delimiter.\n",
+    "noKTHXBYE":        "Error 02: Program has no KTHXBYE code delimiter.\n",
+    "nopairTLDR":       "Error 03: Missing OBTW.\n",
+    "dblHAI":           "Error 04: Double HAI keyword.\n",
+    "dblKTHXBYE":       "Error 05: Double KTHXBYE keyword.\n",
+    "wrongvarname":     "Error 06: Invalid variable name ",
+    "invalidvalue":     "Error 07: Invalid value/expression for variable: ",
+    "novalue":          'Error 08: No value given to variable ',
+    "unknownref":       "Error 09: Unknown/Undeclared variable reference ",
+    "missingvisible":   "Error 10: Missing statement after VISIBLE.\n",
+    "missinggimmeh":    "Error 11: Missing statement after GIMMEH.\n",
+    "multiplegimmeh":   "Error 12: Multiple arguments after GIMMEH is not allowed.\n",
+    "notsubscript":     "Error 13: Unpermitted data type for ",
+    "unknownop":        "Error 14: Unidentified operation: ",
+    "quotedoperand":    "Error 15: Quoted operand is not of type NUMBR/NUMBAR.\n",
+    "min2args":         "Error 16: Expression must have at least 2 operands.\n",
+    "max2args":         "Error 17: Expression must have at most 2 operands.\n",
+    "missingarg":       "Error 18: Missing operand on expression.\n",
+    "noRleft":          "Error 19: Missing variable before R.\n",
+    "noRRight":         "Error 20: Missing literal/variable/expression after R.\n",
+    "manyRleft":        "Error 21: Multiple variables before R is not allowed.\n",
+    "manyRright":       "Error 22: Multiple statements after R is not allowed.\n",
+    "unpairedquotes":   "Error 23: Unpaired double quotes.\n",
+    "boolrecursive":    "Error 24: ALL OF/ANY OF cannot be called recursively.\n",
+    "noMKAY":           "Error 25: ALL OF/ANY OF must be terminated in MKAY.\n",
+    "dblMKAY":          "Error 26: Double MKAY found.\n",
+    "missingoperand":   "Error 27: Lacking operand/s. Please check the expression again.\n",
+    "noOIC":            "Error 26: If-else/Switch blocks must be terminated by OIC\n",
+    "loneOIC":          "Error 27: If-else blocks must be preceded by O RLY?/Switch blocks must be preceded by WTF?\n",
+    "noYARLY":          "Error 28: O RLY? must be succeeded by YA RLY\n",
+    "noNOWAI":          "Error 29: Missing NO WAI.\n",
+    "conditionerror":   "Error 30: Preceding expression of If-else blocks must result to the type \"TROOF\"\n",
+    "missingcasevalue": "Error 31: The succeeding expression after OMG is missing.\n",
+    "multicasevalue":   "Error 32: Only one succeeding expression after OMG is allowed.\n",
+    "missingdefault":   "Error 33: Missing OMGWTF statement.\n",
+    "itemptyerror":     "Error 34: The Implicit Variable does not contain any value.\n",
+    "nowtf":            "Error 35: Switch blocks must be preceded by WTF?\n",
+    "noomg":            "Error 36: WTF? must be succeeded by a proper OMG statement.\n",
+    "missingquote":     "Error 37: YARN literals must start and end with quotation marks.\n",
+    "invalidcase":      "Error 38: This case value is invalid: ",
+    "multiYARLY":       "Error 39: Only one YA RLY is allowed per block.\n",
+    "multiNOWAI":       "Error 40: Only one NO WAI is allowed per block.\n",
+    "multiOMGWTF":      "Error 41: Only one OMGWTF is allowed per block.\n",
+    "noORLY":           "Error 42: Missing O RLY? statement.\n",
+    "unreqcomm":        "Error 43: Unrecognizable command.\n",
+    "invalidliteral":   "Error 44: Invalid literal: ",
+    "noinput":          "Error 45: Please add an input.\n",
+    "notvardec":        "Error 46: Variable declaration is not allowed inside If-Else/Switch blocks.\n",
+    "multiorly":        "Error 47: Only one ORLY? is allowed per block.\n",
+    "multiwtf":         "Error 48: Only one WTF? is allowed per block.\n",
+    "manyNOT":          "Error 49: NOT must have exactly 1 operand.\n",
+    "stopped":          "Error 50: Program stopped.\n",
+    "noloopname":       "Error 51: IM IN YR must be followed by the name of the loop.\n",
+    "looplabel":        "Error 52: IM OUTTA YR must be followed by the name of the loop it ends: ",
+    "noIMOUTTAYR":      "Error 53: Loops must be terminated by IM OUTTA YR.\n",
+    "loneIMOUTTAYR":    "Error 54: IM OUTTA YR must be preceded by IM IN YR.\n",
+    "loopoperation":    "Error 55: UPPIN/NERFIN must be followed by YR and a variable.\n",
+    "loopcondition":    "Error 56: TIL/WILE must be followed by an expression.\n",
+    "nofuncname":       "Error 57: HOW IZ I must be followed by the name of the function.\n",
+    "funcparams":       "Error 58: Parameters must be written YR name AN YR name ...: ",
+    "noIFUSAYSO":       "Error 59: Functions must be terminated by IF U SAY SO.\n",
+    "loneIFUSAYSO":     "Error 60: IF U SAY SO must be preceded by HOW IZ I.\n",
+    "nestedfunc":       "Error 61: Functions must be defined outside of blocks, loops and functions.\n",
+    "dblfunc":          "Error 62: Function already defined: ",
+    "unknownfunc":      "Error 63: Unknown/Undefined function ",
+    "funcargs":         "Error 64: Wrong number of arguments for function ",
+    "invalidcall":      "Error 65: Function calls must be written I IZ name YR value AN YR value ... MKAY.\n",
+    "loneFOUNDYR":      "Error 66: FOUND YR is only allowed inside functions.\n",
+    "missingfound":     "Error 67: Missing value after FOUND YR.\n",
+    "calldepth":        "Error 68: Too many nested function calls.\n",
+    "divzero":          "Error 69: Division by zero.\n",
+    "overflow":         "Error 70: Number too large.\n"
+}
+
+# Literals
+literals = {
+    "numbr":    "\-?[0-9]+",
+    "numbar":   "\-?[0-9]*\.[0-9]+",
+    "yarn":     "\"[^\"]*\"\s*",
+    "troof":    "(WIN)|(FAIL)"
+}
+
+# Arithmetic and Logic Lexemes
+logic = {
+    "add":          "SUM OF",
+    "sub":          "DIFF OF",
+    "mul":          "PRODUKT OF",
+    "div":          "QUOSHUNT OF",
+    "mod":          "MOD OF",
+    "mor":          "BIGGR OF",
+    "les":          "SMALLR OF",
+    "equ":          "BOTH SAEM",
+    "neq":          "DIFFRINT",
+    "not":          "NOT",
+    "xor":          "WON OF",
+    "any":          "ANY OF",
+    "all":          "ALL OF",
+    "and":          "BOTH OF",
+    "or_":          "EITHER OF",
+    "mkay":         "MKAY",
+    "smoosh":       "SMOOSH",
+    "operandid":    "AN"
+}
+# operator keyword -> operation, and the operations of each kind of expression
+operations = {}
+for operation in ("add", "sub", "mul", "div", "mod", "mor", "les", "equ", "neq", "not", "xor", "any", "all", "and", "or_", "smoosh"):
+    operations[logic[operation]] = operation
+mathoperations = ("add", "sub", "mul", "div", "mod", "mor", "les", "equ", "neq")
+booloperations = ("not", "xor", "any", "all", "and", "or_")
+# operand count of each operation (None for ALL OF/ANY OF/SMOOSH, which take any number) and its kind of operands
+arity = {"not": 1, "any": None, "all": None, "smoosh": None}
+operationmodes = {"smoosh": "concatmode"}
+for operation in mathoperations:
+    arity[operation] = 2
+    operationmodes[operation] = "mathmode"
+for operation in booloperations:
+    arity.setdefault(operation, 2)
+    operationmodes[operation] = "boolmode"
+
+# LOLCODE Lexemes (line patterns used before tokenizing)
+regexlist = {
+    "varname":      "^[a-zA-Z][a-zA-Z0-9\_]*$",
+    "spaces":       "^\s*$",
+    "hai":          "^HAI\s*",
+    "kthxbye":      "^\s*KTHXBYE$",
+    "btw":          "\s*BTW\s",
+    "obtw":         "^\s*OBTW\s*",
+    "tldr":         "\s*TLDR$"
+}
+
+# Keywords and their classification in the lexeme table
+keywords = {
+    "HAI":          '"Code Delimiter"',
+    "KTHXBYE":      '"Code Delimiter"',
+    "I HAS A":      '"Variable Declaration"',
+    "ITZ":          '"Variable Assignment"',
+    "R":            '"Assignment Operator"',
+    "VISIBLE":      '"Function Identifier"',
+    "GIMMEH":       '"Function Identifier"',
+    "SMOOSH":       '"Function Identifier"',
+    "O RLY?":       '"Function Identifier"',
+    "YA RLY":       '"Function Identifier"',
+    "NO WAI":       '"Function Identifier"',
+    "WTF?":         '"Function Identifier"',
+    "OMGWTF":       '"Function Identifier"',
+    "OMG":          '"Function Identifier"',
+    "GTFO":         '"Function Identifier"',
+    "OIC":          '"Function Identifier"',
+    "IM IN YR":     '"Loop Delimiter"',
+    "IM OUTTA YR":  '"Loop Delimiter"',
+    "UPPIN":        '"Loop Operation"',
+    "NERFIN":       '"Loop Operation"',
+    "YR":           '"Parameter Delimiter"',
+    "TIL":          '"Loop Condition"',
+    "WILE":         '"Loop Condition"',
+    "HOW IZ I":     '"Function Delimiter"',
+    "IF U SAY SO":  '"Function Delimiter"',
+    "I IZ":         '"Function Call"',
+    "FOUND YR":     '"Return Statement"',
+    "AN":           '"Operands Identifier"',
+    "MKAY":         '"Expession Delimiter"'
+}
+for operation in mathoperations[0:7]:
+    keywords[logic[operation]] = '"Arithmetic Identifier"'
+for operation in ("equ", "neq"):
+    keywords[logic[operation]] = '"Comparison Identifier"'
+for operation in booloperations:
+    keywords[logic[operation]] = '"Boolean Identifier"'
+
+# Statement keywords
+# the first token of a line decides which statement it is; block keywords must stand alone on their line
+statementkinds = {
+    "I HAS A":      "ihasa",
+    "VISIBLE":      "visible",
+    "GIMMEH":       "gimmeh",
+    "O RLY?":       "ifblock",
+    "YA RLY":       "if",
+    "NO WAI":       "else",
+    "WTF?":         "switchblock",
+    "OMG":          "case",
+    "OMGWTF":       "default",
+    "GTFO":         "break",
+    "OIC":          "blockend",
+    "IM IN YR":     "loopblock",
+    "IM OUTTA YR":  "loopend",
+    "HOW IZ I":     "funcblock",
+    "IF U SAY SO":  "funcend",
+    "I IZ":         "call",
+    "FOUND YR":     "return"
+}
+for keyword in operations:
+    statementkinds[keyword] = "expression"
+blockkeywords = ("ifblock", "if", "else", "switchblock", "default", "break", "blockend", "funcend")
+
+# Precompiled lexeme registry
+# every pattern above is compiled once, together with the tokenizer pattern built from the keywords
+patterns = {}
+for lexemes in (literals, regexlist):
+    for key, pattern in lexemes.items():
+        patterns[key] = re.compile(pattern)
+patterns["numbr_full"] =    re.compile("^" + literals["numbr"] + "$")
+patterns["numbar_full"] =   re.compile("^" + literals["numbar"] + "$")
+# a token is a YARN, an unterminated YARN, a keyword (longest first, so OMGWTF is not read as OMG) or any other word
+# (AN and MKAY are words, they get their own token kinds)
+patterns["token"] =         re.compile("\s*(?:(?P<YARN>\"[^\"]*\")|(?P<UNPAIRED>\".*)|(?P<KEYWORD>"
+                                + "|".join([re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True) if keyword != "AN" and keyword != "MKAY"])
+                                + ")(?=[\s\"]|$)|(?P<WORD>[^\s\"]+))")
+
+
+# TOKENIZER
+# Token kinds: KEYWORD, IDENTIFIER, NUMBR, NUMBAR, YARN, TROOF, AN, MKAY,
+# UNPAIRED for a quote that is never closed and INVALID for a word that is none of the above.
+# line and column are 1-based positions in the source file.
+Token = collections.namedtuple("Token", ["kind", "text", "line", "column"])
+
+# identifies the kind of a word that is not a keyword or a YARN
+def wordkind(word):
+    if word == "AN" or word == "MKAY":
+        return word
+    elif word == "WIN" or word == "FAIL":
+        return "TROOF"
+    elif patterns["numbar_full"].search(word):
+        return "NUMBAR"
+    elif patterns["numbr_full"].search(word):
+        return "NUMBR"
+    elif patterns["varname"].search(word):
+        return "IDENTIFIER"
+    return "INVALID"
+
+# single pass over a line of code, returns its list of tokens
+def tokenize(line, linenumber):
+    tokens = []
+    for match in patterns["token"].finditer(line):
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "WORD":
+            kind = wordkind(text)
+        tokens.append(Token(kind, text, linenumber, match.start(match.lastgroup) + 1))
+    return tokens
+
+# lexeme table entries of a list of tokens
+def tokenlexemes(tokens):
+    lex = []
+    for index in range(0, len(tokens)):
+        token = tokens[index]
+        if token.kind == "KEYWORD" or token.kind == "AN" or token.kind == "MKAY":
+            lex.append([token.text, keywords[token.text]])
+        elif token.kind == "YARN":
+            lex.append(["\"", '"String Delimiter"'])
+            lex.append([token.text[1:-1], 'Literal'])
+            lex.append(["\"", '"String Delimiter"'])
+        elif token.kind == "IDENTIFIER":
+            if index != 0 and tokens[index - 1].text == "I HAS A":
+                lex.append([token.text, '"Variable Identifier"'])
+            elif index == 1 and (tokens[0].text == "IM IN YR" or tokens[0].text == "IM OUTTA YR"):
+                lex.append([token.text, '"Loop Identifier"'])
+            elif index == 1 and (tokens[0].text == "HOW IZ I" or tokens[0].text == "I IZ"):
+                lex.append([token.text, '"Function Identifier"'])
+            elif tokens[0].text == "HOW IZ I" and tokens[index - 1].text == "YR":
+                lex.append([token.text, '"Parameter Identifier"'])
+            elif token.text == "IT":
+                lex.append([token.text, '"Implicit Variable"'])
+            else:
+                lex.append([token.text, '"Variable Reference"'])
+        elif token.kind != "UNPAIRED" and token.kind != "INVALID":
+            lex.append([token.text, 'Literal'])
+    return lex
+
+# attaches the position of the offending token to an error message
+def errorat(message, token):
+    return message.rstrip("\n") + " (line " + str(token.line) + ", column " + str(token.column) + ")\n"
+
+# source text of a list of tokens (for error messages)
+def tokentext(tokens):
+    return " ".join([token.text for token in tokens])
+
+# identifies the kind of statement of a tokenized line (a value of statementkinds, "var_assign" or "unknown")
+def statementkind(tokens):
+    if len(tokens) != 0 and tokens[0].kind == "KEYWORD":
+        kind = statementkinds.get(tokens[0].text)
+        if kind != None and (len(tokens) == 1 or kind not in blockkeywords):
+            return kind
+    for token in tokens:
+        if token.kind == "KEYWORD" and token.text == "R":
+            return "var_assign"
+    return "unknown"
+
+
+# OUTPUT/INPUT HANDLERS
+# The interpreter never touches a widget or a terminal directly. The front-end that runs a program
+# (124proj.py for the GUI, lolrun.py for the command line) binds these before executing.
+# The read handler is an input provider: a function taking the GIMMEH variable name and returning the raw input
+# (typed by readvalue) or None if there is none. The GUI has the dialog provider, the ones below need no window.
+
+# next line of a stream without its line break, None at the end of the stream
+def streamline(stream):
+    liveInput = stream.readline()
+    if len(liveInput) == 0:     # end of input behaves like a cancelled dialog
+        return None
+    return liveInput.rstrip("\r\n")
+
+# provider reading one line of the standard input per GIMMEH
+def stdinread(variable):
+    return streamline(sys.stdin)
+
+# provider giving the inputs of a list one by one, then None (like a cancelled dialog) once they are used up
+def listreader(inputs):
+    remaining = collections.deque(inputs)
+    def listread(variable):
+        if len(remaining) == 0:
+            return None
+        return remaining.popleft()
+    return listread
+
+# provider giving the lines of a file one by one (the file is read at once and closed)
+def filereader(path):
+    with open(path, "r") as stream:
+        text = stream.read()
+    lines = text.split("\n")
+    if text.endswith("\n"):        # no empty input after the last line break
+        lines.pop()
+    return listreader([line.rstrip("\r") for line in lines])
+
+iohandlers = {
+    "write":    sys.stdout.write,  # receives VISIBLE output, echoed lines and error messages
+    "read":     stdinread          # receives the GIMMEH variable name, returns the raw input (None if cancelled)
+}
+
+
+# FUNCTIONS
+
+
+# for quoted literals in arithmetics
+def quotedoperand(string):
+    if patterns["numbar_full"].search(string):
+        return [float(string), "NUMBAR"]
+    elif patterns["numbr_full"].search(string):
+        return [int(string), "NUMBR"]
+    return errorcode["quotedoperand"]
+
+# token classes used by the expression functions
+def isoperator(token):
+    return token.kind == "KEYWORD" and token.text in operations
+
+# operand evaluator for arithmetic, logic and concatenation operations
+# token is a lone literal/variable operand; returns [value, type] or an error message
+def operandevaulator(token, currentsymbols, mode, operation):
+    # for quoted values in arithmetic
+    if mode == "mathmode" and token.kind == "YARN":
+        evaluate = quotedoperand(token.text[1:-1])
+        if isinstance(evaluate, str):
+            if operation == "equ" or operation == "neq":                    # equalities and inequalities take any TYPE
+                return [token.text[1:-1], "YARN"]
+            return errorat(evaluate, token)
+        return evaluate
+    elif mode == "concatmode" and token.kind == "YARN":                                     # --|
+        return [token.text[1:-1], "YARN"]                                                   #   |--> concatenations take
+    elif mode == "concatmode" and (token.kind == "TROOF" or token.kind == "NUMBR" or token.kind == "NUMBAR"):   # the literals as written
+        return [token.text, "YARN"]                                                         # --|
+    # variable references
+    elif token.kind == "IDENTIFIER" and token.text in currentsymbols:
+        return typedoperand(currentsymbols[token.text], token, mode, operation)
+    elif token.kind == "NUMBAR" and mode == "mathmode":     # --|
+        return [float(token.text), "NUMBAR"]                #   |--> numbr/numbar operand
+    elif token.kind == "NUMBR" and mode == "mathmode":      #   |--> (only for arithmetics)
+        return [int(token.text), "NUMBR"]                   # --|
+    elif token.kind == "NUMBAR" or token.kind == "NUMBR" or token.kind == "INVALID" or (token.kind == "YARN" and mode == "boolmode"):
+        return errorat(errorcode["invalidliteral"] + token.text, token)
+    elif token.kind == "TROOF" and (mode == "boolmode" or operation == "equ" or operation == "neq"):    # Raw boolean
+        return [token.text, "TROOF"]                                                                    # operand
+    elif token.kind == "UNPAIRED":
+        return errorat(errorcode["missingquote"], token)
+    return errorat(errorcode["unknownref"] + token.text + ".\n", token)       # Main error display
+
+# type check of a variable value or of the value of a nested expression (named by token) used as an operand
+def typedoperand(value, token, mode, operation):
+    # follows their repsective type limits (equalities and inequalities take any TYPE)
+    if (mode == "mathmode" and ((value[1] == "NUMBR" or value[1] == "NUMBAR") or operation == "equ" or operation == "neq")) or (mode == "boolmode" and value[1] == "TROOF"):
+        return value
+    elif mode == "boolmode" and (value[1] == "NUMBR" or value[1] == "NUMBAR"):  # --|
+        if value[0] == 0:                                                       #   |--> logic expressions accepts integers, WIN if not 0, FAIL otherwise
+            return ["FAIL", "TROOF"]                                            #   |
+        return ["WIN", "TROOF"]                                                 # --|
+    elif mode == "concatmode":
+        return [str(value[0]), "YARN"]
+    errorstring = token.text + " is of type " + value[1] + ".\n"                        # --|
+    if mode == "mathmode":                                                              #   |
+        mode = "arithmetics"                                                            #   |--> error
+    else:                                                                               #   |--> display
+        mode = "boolean"                                                                #   |
+    return errorat(errorcode["notsubscript"] + mode + ": " + errorstring, token)       # --|
+
+# error for tokens found where an AN (or the end of the expression) was expected
+def separatorerror(tokens, index):
+    start = index
+    if start != 0 and not isoperator(tokens[start - 1]) and tokens[start - 1].kind != "AN" and tokens[start - 1].kind != "MKAY":
+        start -= 1                                                  # the operand before it is part of the message
+    end = index
+    while end < len(tokens) and tokens[end].kind != "AN" and tokens[end].kind != "MKAY":
+        end += 1
+    return errorat(errorcode["unknownref"] + tokentext(tokens[start:end]) + ".\n", tokens[index])
+
+# prefix expression parser
+# builds the expression tree of the expression starting at tokens[start] in one pass, with an explicit stack of open operations
+# a node is [operation, operands, operator token], an operand is a node or a literal/variable token
+# returns [tree, index after the expression] or an error message
+def parseexpression(tokens, start):
+    stack = []          # operations still waiting for operands
+    boolnesting = 0     # ALL OF/ANY OF operations in the stack
+    index = start
+    expecting = True    # an operand is expected next, otherwise an AN/MKAY
+    while True:
+        token = None                    # None is the
+        if index < len(tokens):         # end of the line
+            token = tokens[index]
+        if expecting:
+            if token == None and index != start and tokens[index - 1].kind == "AN":    # --|
+                return errorat(errorcode["missingarg"], tokens[index - 1])              #   |--> the line ended
+            elif token == None:                                                         #   |--> before an operand
+                return errorat(errorcode["missingoperand"], tokens[index - 1])          # --|
+            elif isoperator(token):                                                 # --|
+                operation = operations[token.text]                                  #   |
+                if operation == "all" or operation == "any":                        #   |
+                    if boolnesting != 0:                                            #   |--> opens a new operation
+                        return errorat(errorcode["boolrecursive"], token)           #   |
+                    boolnesting += 1                                                #   |
+                stack.append([operation, [], token])                                #   |
+                index += 1                                                          #   |
+                continue                                                            # --|
+            elif token.kind == "AN" or token.kind == "MKAY":
+                return errorat(errorcode["missingarg"], token)
+            operand = token     # literal/variable operand
+            index += 1
+        elif token != None and token.kind == "AN":
+            expecting = True
+            index += 1
+            continue
+        elif token != None and token.kind == "MKAY":                                # --|
+            node = stack[-1]                                                        #   |
+            if arity[node[0]] != None or len(node[1]) < 2:                          #   |
+                return errorat(errorcode["min2args"], node[2])                      #   |--> closes an ALL OF/ANY OF/SMOOSH
+            if node[0] == "all" or node[0] == "any":                                #   |
+                boolnesting -= 1                                                    #   |
+            operand = stack.pop()                                                   #   |
+            index += 1                                                              # --|
+        elif stack[-1][0] == "smoosh":                                              # --|
+            if len(stack[-1][1]) < 2:                                               #   |--> the end of the line or an operand after
+                return errorat(errorcode["min2args"], stack[-1][2])                 #   |--> a complete operand ends a SMOOSH
+            operand = stack.pop()                                                   # --|
+        elif token == None and (stack[-1][0] == "all" or stack[-1][0] == "any"):    # --|
+            return errorat(errorcode["noMKAY"], stack[-1][2])                       #   |
+        elif token == None and len(stack) == 1:                                     #   |--> the line ended
+            return errorat(errorcode["min2args"], stack[-1][2])                     #   |--> before an operand
+        elif token == None:                                                         #   |
+            return errorat(errorcode["missingoperand"], stack[-1][2])               # --|
+        else:
+            return separatorerror(tokens, index)
+        # the finished operand goes to the innermost open operation, closing every operation it completes
+        while len(stack) != 0:
+            node = stack[-1]
+            node[1].append(operand)
+            if arity[node[0]] == None or len(node[1]) < arity[node[0]]:
+                break
+            operand = stack.pop()
+        if len(stack) == 0:
+            return [operand, index]
+        expecting = False
+
+# expression tree of a whole statement, nothing may follow the expression
+def expressiontree(tokens):
+    result = parseexpression(tokens, 0)
+    if isinstance(result, str):
+        return result
+    return trailingerror(result, tokens)
+
+# checks what follows a parsed expression ([tree, index after it]) in tokens, returns the tree or an error message
+def trailingerror(result, tokens):
+    [tree, index] = result
+    if index == len(tokens):
+        return tree
+    elif tokens[index].kind == "AN" and tree[0] == "not":
+        return errorat(errorcode["manyNOT"], tree[2])
+    elif tokens[index].kind == "AN":
+        return errorat(errorcode["max2args"], tree[2])
+    elif tokens[index].kind == "MKAY" and (tree[0] == "all" or tree[0] == "any"):
+        return errorat(errorcode["dblMKAY"], tokens[index])
+    return separatorerror(tokens, index)
+
+# arithmetic or comparison operation on two operands, returns [value, type] or an error message (division by zero,
+# a quotient of NUMBRs too large for a NUMBAR)
+def arithmetics(mode, inoperand):
+    evaluated = []  # will hold the result of the arithmetic/comparison operation
+    a = inoperand[0][0]                                                 # --|
+    b = inoperand[1][0]                                                 #   |
+    if mode == "add":                                                   #   |
+        evaluated.append(a + b)                                         #   |
+    elif mode == "sub":                                                 #   |
+        evaluated.append(a - b)                                         #   |
+    elif mode == "mul":                                                 #   |
+        evaluated.append(a * b)                                         #   |
+    elif (mode == "div" or mode == "mod") and b == 0:                   #   |
+        return errorcode["divzero"]                                     #   |
+    elif mode == "div":                                                 #   |--> Actual
+        try:                                                            #   |--> arithmetic
+            evaluated.append(a / b)                                     #   |--> computation /
+        except OverflowError:                                           #   |--> comparison
+            return errorcode["overflow"]                                #   |
+    elif mode == "mod":                                                 #   |--> evaluation
+        evaluated.append(a % b)                                         #   |
+    elif mode == "mor":                                                 #   |
+        evaluated.append(max(a,b))                                      #   |
+    elif mode == "les":                                                 #   |
+        evaluated.append(min(a,b))                                      #   |
+    else:                                                               #   |
+        if (mode == "equ" and a == b) or (mode == "neq" and a != b):    #   |
+            evaluated.append("WIN")                                     #   |
+        else:                                                           #   |
+            evaluated.append("FAIL")                                    # --|
+
+    # Result type assignment
+    if mode == "equ" or mode == "neq":
+        evaluated.append("TROOF")
+    elif inoperand[0][1] == "NUMBAR" or inoperand[1][1] == "NUMBAR":
+        evaluated.append("NUMBAR")
+    else:
+        evaluated.append("NUMBR")
+        if mode == "div":
+            evaluated[0] = int(evaluated[0])
+    return evaluated
+
+# logic operation on the TROOF operands (and/all/or/any are only called when no operand short-circuited)
+def booleans(mode, inoperand):
+    if mode == "not":                           # --|
+        if inoperand[0][0] == "WIN":            #   |--> NOT
+            return ["FAIL", "TROOF"]            #   |--> OPERATION
+        return ["WIN", "TROOF"]                 # --|
+    elif mode == "xor":                                 # --|
+        if inoperand[1][0] != inoperand[0][0]:          #   |--> XOR OPERATION
+            return ["WIN", "TROOF"]                     # --|
+        return ["FAIL", "TROOF"]
+    elif mode == "any" or mode == "or_":                # --|
+        return ["FAIL", "TROOF"]                        #   |--> no WIN for any/or, no FAIL for all/and
+    return ["WIN", "TROOF"]                             # --|
+
+# an operand value that decides the result of an and/all/or/any operation on its own
+def shortcircuits(operation, value):
+    return ((operation == "any" or operation == "or_") and value[0] == "WIN") or ((operation == "all" or operation == "and") and value[0] == "FAIL")
+
+# value of a lone literal or variable token, returns [value, type] or an error message
+def tokenvalue(token, currentsymbols):
+    if token.kind == "YARN":
+        return [token.text[1:-1], "YARN"]
+    elif token.kind == "TROOF":
+        return [token.text, "TROOF"]
+    elif token.kind == "NUMBAR":
+        return [float(token.text), "NUMBAR"]
+    elif token.kind == "NUMBR":
+        return [int(token.text), "NUMBR"]
+    elif token.kind == "IDENTIFIER":
+        if token.text in currentsymbols:
+            return currentsymbols[token.text]
+        return errorat(errorcode["unknownref"] + token.text + ".\n", token)
+    elif token.kind == "UNPAIRED":
+        return errorat(errorcode["missingquote"], token)
+    return errorat(errorcode["invalidvalue"] + token.text, token)
+
+# a YARN written with inner double quotes is split into several tokens,
+# returns [value, type] when tokens span such a YARN (inner quotes kept as they are), None otherwise
+def quotedspan(tokens):
+    if tokens[0].text[0] != "\"" or tokens[-1].text[-1] != "\"":
+        return None
+    fragments = []
+    for index in range(0, len(tokens)):                                                     # --|
+        if index != 0:                                                                      #   |--> the gaps between the tokens
+            fragments.append(" " * (tokens[index].column - tokens[index - 1].column - len(tokens[index - 1].text)))   # are spaces
+        fragments.append(tokens[index].text)                                                # --|
+    return ["".join(fragments)[1:-1], "YARN"]
+
+# lexer for ignored lines inside if-else/switch blocks (the lines are not evaluated)
+def linelexer(tokens):
+    kind = statementkind(tokens)
+    if kind == "ihasa":                                             # --|
+        return errorat(errorcode["notvardec"], tokens[0])           #   |--> variable declarations
+    elif kind in ("visible", "gimmeh", "expression", "var_assign", "call", "return"):
+        return tokenlexemes(tokens)
+    elif kind in ("ifblock", "switchblock", "if", "else", "case", "break", "default", "loopblock", "loopend", "funcblock", "funcend"):
+        # IGNORE THE KEYWORDS OF IF-ELSE/SWITCH CLAUSES, LOOPS AND FUNCTIONS
+        return []
+    return errorat(errorcode["unreqcomm"], tokens[0])   # unrecognized command
+
+# value of the case of an OMG line, returns [value] or an error message
+def casevalue(tokens):
+    value = tokens[1:len(tokens)]
+    if len(value) == 0:                                 # check if the value is missing
+        return errorat(errorcode["missingcasevalue"], tokens[0])
+    elif len(value) == 2 and value[0].text == logic["not"] and value[0].kind == "KEYWORD" and value[1].kind == "TROOF":   # --|
+        if value[1].text == "WIN":                                                                                      #   |--> negated
+            return ["FAIL"]                                                                                             #   |--> BOOLEAN LITERAL
+        return ["WIN"]                                                                                                  # --|
+    elif len(value) > 1:                                # check the arity of the case arguments
+        return errorat(errorcode["multicasevalue"], value[1])
+    value = value[0]
+    # check the data type of the case value
+    if value.kind == "YARN":                            # STRING LITERAL
+        return [value.text[1:-1]]
+    elif value.kind == "TROOF":                         # BOOLEAN LITERAL
+        return [value.text]
+    elif value.kind == "NUMBAR":                        # FLOATING POINT LITERAL
+        return [float(value.text)]
+    elif value.kind == "NUMBR":                         # INTEGER LITERAL
+        return [int(value.text)]
+    elif value.kind == "IDENTIFIER":                    # VARIABLE NAME
+        return errorat(errorcode["invalidliteral"] + value.text, value)
+    elif value.kind == "UNPAIRED":                      # uneven quotation marks
+        return errorat(errorcode["missingquote"], value)
+    return errorat(errorcode["invalidcase"] + value.text + "\n", value)
+
+# parts of an IM IN YR line: IM IN YR label [UPPIN/NERFIN YR variable] [TIL/WILE expression]
+# returns the header of the loop or an error message: "label" (name of the loop), "operation" ("add" for UPPIN, "sub"
+# for NERFIN, None), "variable" (its token), "exit" (value of the condition that ends the loop: "WIN" for TIL, "FAIL"
+# for WILE, None if there is no condition) and "condition" (expression tree or lone operand token)
+def loopheader(tokens):
+    header = {"label": None, "operation": None, "variable": None, "exit": None, "condition": None}
+    if len(tokens) < 2 or tokens[1].kind != "IDENTIFIER":       # check the name of the loop
+        return errorat(errorcode["noloopname"], tokens[0])
+    header["label"] = tokens[1].text
+    index = 2
+    if index < len(tokens) and tokens[index].kind == "KEYWORD" and (tokens[index].text == "UPPIN" or tokens[index].text == "NERFIN"):
+        if len(tokens) < index + 3 or tokens[index + 1].text != "YR" or tokens[index + 2].kind != "IDENTIFIER":
+            return errorat(errorcode["loopoperation"], tokens[index])
+        header["operation"] = "add" if tokens[index].text == "UPPIN" else "sub"     # UPPIN/NERFIN YR variable
+        header["variable"] = tokens[index + 2]
+        index += 3
+    if index == len(tokens):
+        return header
+    elif tokens[index].kind != "KEYWORD" or (tokens[index].text != "TIL" and tokens[index].text != "WILE"):
+        return errorat(errorcode["unreqcomm"], tokens[index])
+    header["exit"] = "WIN" if tokens[index].text == "TIL" else "FAIL"
+    condition = tokens[index + 1:len(tokens)]
+    if len(condition) == 0:                                             # --|
+        return errorat(errorcode["loopcondition"], tokens[index])       #   |
+    elif isoperator(condition[0]):                                      #   |
+        header["condition"] = expressiontree(condition)                 #   |--> an expression or
+        if isinstance(header["condition"], str):                        #   |--> a lone literal/variable
+            return header["condition"]                                  #   |--> after TIL/WILE
+    elif len(condition) > 1:                                            #   |
+        return errorat(errorcode["loopcondition"], condition[1])        #   |
+    else:                                                               #   |
+        header["condition"] = condition[0]                              # --|
+    return header
+
+# parts of a HOW IZ I line: HOW IZ I name [YR parameter [AN YR parameter ...]]
+# returns the header of the function or an error message: "name" (token of the name of the function) and "params"
+# (names of the parameters, in order)
+def funcheader(tokens):
+    if len(tokens) < 2 or tokens[1].kind != "IDENTIFIER":       # check the name of the function
+        return errorat(errorcode["nofuncname"], tokens[0])
+    header = {"name": tokens[1], "params": []}
+    index = 2
+    while index < len(tokens):
+        if index != 2 and tokens[index].kind == "AN":           # the parameters after the first
+            index += 1                                          # one are written AN YR name
+        if index + 1 >= len(tokens) or tokens[index].text != "YR" or tokens[index + 1].kind != "IDENTIFIER" or tokens[index + 1].text in header["params"]:
+            return errorat(errorcode["funcparams"] + tokentext(tokens[2:len(tokens)]) + "\n", tokens[min(index, len(tokens) - 1)])
+        header["params"].append(tokens[index + 1].text)
+        index += 2
+    return header
+
+# COMPILER
+# "fold" turns the constant folding and dead branch elimination on (False compiles every expression and branch as written)
+compilesettings = {"fold": True}
+
+# A program is compiled once into a flat list of instructions for the stack machine below (runprogram).
+# An instruction is an (opcode, argument) tuple, program["lines"] holds the index of the source line
+# that emitted each instruction (the line echoed when that instruction stops the program).
+# Errors that can be found while compiling are compiled into ERROR instructions at the place where the
+# interpreter met them, so a program still runs up to its first error.
+#
+#   LOADCONST   [value, type]                   pushes a literal value
+#   LOADVAR     [token, mode, operation, slot]  pushes the value of a variable, typed for mode (see variablevalue)
+#   STORE       slot                            pops a value into a variable
+#   DEFINED     [token, slot]                   stops if the variable is not declared
+#   MATH        [operation, token]              arithmetic and comparison (BOTH SAEM/DIFFRINT) of the two top values,
+#                                               stops on a division by zero (token is the operator, for the error)
+#   NOT         None                            negates the top TROOF
+#   XOR         None                            WON OF of the two top TROOFs
+#   CAST        [mode, operation, token]        types the top value for mode (see typedoperand)
+#   CONCAT      count                           joins the count top YARNs
+#   JUMPKEEP    [value, target]                 jumps if the top value is value (keeping it), else pops it
+#   JUMPIF      [value, target]                 pops the top TROOF, jumps if it is value (the condition of a loop)
+#   STEP        [token, step, slot]             adds step to a NUMBR/NUMBAR variable (1 for UPPIN, -1 for NERFIN)
+#   CALL        [token, name, count]            calls a function with the count top values as arguments (see runprogram)
+#   RETURN      None                            returns the top value from a function, into the IT of the caller
+#   PRINT       count                           writes the count top YARNs
+#   READ        [token, gimmeh token, slot]     reads a variable with GIMMEH
+#   ORLY        [token, error if WIN, error if FAIL, target]    checks IT, jumps to target (NO WAI) if it is FAIL
+#   WTF         [token, cases, default]         checks IT, jumps to cases[value of IT] (a dict), or to default
+#   JUMP        target                          jumps to target
+#   ERROR       [message, line index]           stops the program
+#   HOOK        [event, line number, ...]       calls the subscribers of an event (only in hooked code, see HOOKS)
+#   MARK        [profile, line index]           a line starts (only in profiled code, see PROFILER)
+#
+# Variables are resolved when compiling: every identifier gets a slot, its index in the list of values of a run
+# (see newslots). program["names"] holds the identifier of every slot (IT is slot 0) and program["slotof"] the slot
+# of every identifier. The declared variables get the first slots, in the order of their declarations, so the
+# symbol table made from the slots (see slotsymbols) lists them in the order they were declared.
+def emit(program, opcode, argument, lineindex):
+    if opcode == "LOADCONST" and argument[1] == "YARN":
+        argument = yarnconstant(program, argument)
+    program["code"].append((opcode, argument))
+    program["lines"].append(lineindex)
+
+# YARN literals are interned: the equal literals of a program share one string and one [value, "YARN"] list
+def yarnconstant(program, value):
+    shared = program["yarns"].get(value[0])
+    if shared == None:
+        shared = [sys.intern(value[0]), "YARN"]
+        program["yarns"][shared[0]] = shared
+    return shared
+
+# position of the next instruction (for jump targets)
+def here(program):
+    return len(program["code"])
+
+# position of the next instruction when it is a jump target, the value of IT is not known there
+def label(program):
+    program["constantit"] = None
+    return here(program)
+
+# value of IT at the next instruction if it was set by a constant expression statement, None if it is only known when running
+def knownit(program):
+    if program["constantit"] != None and program["constantit"][0] == here(program):
+        return program["constantit"][1]
+    return None
+
+# sets the target of an already emitted jump
+def patch(program, position, target):
+    if target == here(program):
+        program["constantit"] = None
+    (opcode, argument) = program["code"][position]
+    if opcode == "JUMP":
+        program["code"][position] = (opcode, target)
+    else:
+        program["code"][position] = (opcode, argument[0:-1] + [target])
+
+# slot of the variable name, a new slot is given to a name seen for the first time
+def slotof(program, name):
+    slot = program["slotof"].get(name)
+    if slot == None:
+        slot = len(program["names"])
+        program["slotof"][name] = slot
+        program["names"].append(name)
+    return slot
+
+# resolution pass: gives their slots to the declared variables, in the order of their declarations
+# (the variables of the functions are in their frames, see compilefunction)
+def resolveslots(programline, program):
+    infunction = False
+    for tokens in programline:
+        kind = statementkind(tokens)
+        if kind == "funcblock" or kind == "funcend":
+            infunction = kind == "funcblock"
+        elif kind == "ihasa" and not infunction and len(tokens) > 1 and tokens[1].kind == "IDENTIFIER":
+            slotof(program, tokens[1].text)
+
+# type that the result of an operation always has
+def resulttype(operation):
+    if operation == "equ" or operation == "neq" or operationmodes[operation] == "boolmode":
+        return "TROOF"
+    elif operation == "smoosh":
+        return "YARN"
+    return "NUMBR"
+
+# emits the code of a lone literal/variable operand of operation
+def compileoperand(token, mode, operation, program, lineindex):
+    if token.kind == "IDENTIFIER":
+        emit(program, "LOADVAR", [token, mode, operation, slotof(program, token.text)], lineindex)
+        return
+    value = operandevaulator(token, {}, mode, operation)    # literals are typed once
+    if isinstance(value, str):
+        emit(program, "ERROR", [value, lineindex], lineindex)
+    else:
+        emit(program, "LOADCONST", value, lineindex)
+
+# CONSTANT FOLDING
+# an operand of operation already known when compiling (a literal or a folded operation), typed for mode
+# returns [value, type] or None (variables, and operands that stop the program are left to the compiled code)
+def constantoperand(operand, mode, operation):
+    if isinstance(operand, Token) and operand.kind == "IDENTIFIER":
+        return None
+    elif isinstance(operand, Token):
+        value = operandevaulator(operand, {}, mode, operation)
+    elif operand[0] == "constant":
+        value = typedoperand(operand[1], operand[2], mode, operation)
+    else:
+        return None
+    if isinstance(value, str):
+        return None
+    return value
+
+# folds an operation whose operands are already folded
+# returns ["constant", [value, type], operator token] if the result is known, otherwise the node itself, without
+# the operands of BOTH OF/EITHER OF/ALL OF/ANY OF that cannot change the result
+def foldnode(node):
+    mode = operationmodes[node[0]]
+    kept = []           # operands that are evaluated
+    values = []         # their values (None if not known)
+    constant = True     # every operand is known
+    for operand in node[1]:
+        value = constantoperand(operand, mode, node[0])
+        kept.append(operand)
+        values.append(value)
+        if value == None:
+            constant = False
+        elif shortcircuits(node[0], value) and constant:    # --|
+            return ["constant", value, node[2]]             #   |--> the operands after it
+        elif shortcircuits(node[0], value):                 #   |--> are never evaluated
+            break                                           # --|
+    if constant:
+        if mode == "mathmode":                                      # --|
+            value = arithmetics(node[0], values)                    #   |
+        elif mode == "boolmode":                                    #   |--> the operation
+            value = booleans(node[0], values)                       #   |--> done once
+        else:                                                       #   |
+            value = ["".join([item[0] for item in values]), "YARN"] # --|
+        if isinstance(value, str):      # division by zero, left to stop the program when it runs
+            return node
+        return ["constant", value, node[2]]
+    if node[0] == "and" or node[0] == "all" or node[0] == "or_" or node[0] == "any":
+        last = len(kept) - 1                                            # --|
+        node[1] = []                                                    #   |--> known operands that do not decide the result
+        for index in range(0, len(kept)):                               #   |--> only matter if they are the last one
+            if values[index] == None or index == last:                  #   |
+                node[1].append(kept[index])                             # --|
+    else:
+        node[1] = kept
+    return node
+
+# folds the operations of an expression tree that only have known operands, innermost first, with an explicit stack
+def foldexpression(tree):
+    stack = [[tree, 0]]     # operation, operands folded
+    while True:
+        entry = stack[-1]
+        node = entry[0]
+        if entry[1] != len(node[1]):
+            operand = node[1][entry[1]]
+            entry[1] += 1
+            if not isinstance(operand, Token):
+                stack.append([operand, 0])
+            continue
+        stack.pop()
+        folded = foldnode(node)
+        if len(stack) == 0:
+            return folded
+        stack[-1][0][1][stack[-1][1] - 1] = folded
+
+# emits the code of an expression tree, in the order the operands are evaluated, with an explicit stack
+# BOTH OF/EITHER OF/ALL OF/ANY OF jump to their end as soon as an operand decides their result
+# returns the value of the expression if it was folded into a constant, None otherwise
+def compileexpression(tree, program, lineindex):
+    if compilesettings["fold"]:
+        tree = foldexpression(tree)
+    if tree[0] == "constant":
+        emit(program, "LOADCONST", tree[1], lineindex)
+        return tree[1]
+    stack = [[tree, 0, []]]     # operation, operands emitted, short-circuit jumps to patch
+    while len(stack) != 0:
+        entry = stack[-1]
+        [node, index, jumps] = entry
+        mode = operationmodes[node[0]]
+        if index != len(node[1]):
+            if index != 0 and (node[0] == "and" or node[0] == "all"):   # --|
+                jumps.append(here(program))                             #   |
+                emit(program, "JUMPKEEP", ["FAIL", None], lineindex)    #   |--> "short-circuiting" and/all
+            elif index != 0 and (node[0] == "or_" or node[0] == "any"): #   |--> and or/any operations
+                jumps.append(here(program))                             #   |
+                emit(program, "JUMPKEEP", ["WIN", None], lineindex)     # --|
+            entry[1] += 1
+            operand = node[1][index]
+            if isinstance(operand, Token):
+                compileoperand(operand, mode, node[0], program, lineindex)
+            elif operand[0] == "constant":                                                  # --|
+                value = typedoperand(operand[1], operand[2], mode, node[0])                 #   |
+                if isinstance(value, str):                                                  #   |--> folded operation
+                    emit(program, "ERROR", [value, lineindex], lineindex)                   #   |
+                else:                                                                       #   |
+                    emit(program, "LOADCONST", value, lineindex)                            # --|
+            else:
+                stack.append([operand, 0, []])
+            continue
+        stack.pop()
+        if mode == "mathmode":                                      # --|
+            emit(program, "MATH", [node[0], node[2]], lineindex)    #   |
+        elif node[0] == "not":                                      #   |
+            emit(program, "NOT", None, lineindex)                   #   |--> the operation
+        elif node[0] == "xor":                                      #   |--> (and/all/or/any leave
+            emit(program, "XOR", None, lineindex)                   #   |--> their last operand)
+        elif node[0] == "smoosh":                                   #   |
+            emit(program, "CONCAT", len(node[1]), lineindex)        # --|
+        for position in jumps:
+            patch(program, position, here(program))
+        if len(stack) != 0:                                                                     # --|
+            parent = stack[-1][0]                                                               #   |
+            parentmode = operationmodes[parent[0]]                                              #   |
+            check = typedoperand(["", resulttype(node[0])], node[2], parentmode, parent[0])     #   |--> the result as an operand
+            if isinstance(check, str):                                                          #   |--> of the operation below it
+                emit(program, "ERROR", [check, lineindex], lineindex)                           #   |
+            elif check[1] != resulttype(node[0]):                                               #   |
+                emit(program, "CAST", [parentmode, parent[0], node[2]], lineindex)              # --|
+
+# emits the code of a declaration/assignment value that is not an expression
+def compilevalue(value, mode, program, lineindex):
+    if len(value) > 1:                                                          # --|
+        result = quotedspan(value)                                              #   |
+        if result == None and value[0].text[0] == "\"":                         #   |--> string with inner quotes
+            result = errorat(errorcode["unpairedquotes"], value[0])             #   |
+        elif result == None:                                                    #   |
+            result = errorat(errorcode["invalidvalue"] + tokentext(value), value[0])    # --|
+    elif value[0].kind == "IDENTIFIER":                                         # --|
+        slot = slotof(program, value[0].text)                                   #   |--> variable reference
+        emit(program, "LOADVAR", [value[0], mode, None, slot], lineindex)       #   |
+        return                                                                  # --|
+    else:                                                               # string, boolean,
+        result = tokenvalue(value[0], {})                               # float and integer
+    if isinstance(result, str):
+        emit(program, "ERROR", [result, lineindex], lineindex)
+    else:
+        emit(program, "LOADCONST", result, lineindex)
+
+# getting input from user
+def compilegimmeh(tokens, program, lineindex):
+    readdata = tokens[1:len(tokens)]
+    if len(readdata) > 1:
+        emit(program, "ERROR", [errorat(errorcode["multiplegimmeh"], readdata[1]), lineindex], lineindex)
+    elif len(readdata) == 0:  # no variable provided
+        emit(program, "ERROR", [errorat(errorcode["missinggimmeh"], tokens[0]), lineindex], lineindex)
+    elif readdata[0].kind == "IDENTIFIER":
+        emit(program, "READ", [readdata[0], tokens[0], slotof(program, readdata[0].text)], lineindex)
+    else:
+        emit(program, "ERROR", [errorat(errorcode["unknownref"] + readdata[0].text, readdata[0]), lineindex], lineindex)
+
+# assignment statements
+def compileassignment(tokens, program, lineindex):
+    rindex = 0
+    while tokens[rindex].text != "R" or tokens[rindex].kind != "KEYWORD":
+        rindex += 1
+    left = tokens[0:rindex]
+    value = tokens[rindex + 1:len(tokens)]
+    error = None
+    if len(left) == 0:                                                                  # missing left statement
+        error = errorat(errorcode["noRleft"], tokens[rindex])
+    elif len(value) == 0:                                                               # missing right statement
+        error = errorat(errorcode["noRRight"], tokens[rindex])
+    elif len(left) > 1:                                                                 # --|
+        error = errorat(errorcode["manyRleft"], left[1])                                #   |--> check if both sides are single arguments
+    elif len(value) > 1 and not isoperator(value[0]) and quotedspan(value) == None:     #   |--> (unless the right side is an expression
+        if value[0].text[0] == "\"" or value[-1].text[-1] == "\"":                      #   |--> or a YARN with inner quotes)
+            error = errorat(errorcode["missingquote"], value[0])                        #   |
+        else:                                                                           #   |
+            error = errorat(errorcode["manyRright"], value[1])                          # --|
+    elif left[0].kind != "IDENTIFIER":                                                  # check if the variable name is valid
+        error = errorat(errorcode["wrongvarname"] + left[0].text + ".\n", left[0])
+    elif isoperator(value[0]):
+        tree = expressiontree(value)
+        if isinstance(tree, str):
+            error = tree
+    if error != None:
+        emit(program, "ERROR", [error, lineindex], lineindex)
+        return
+    emit(program, "DEFINED", [left[0], slotof(program, left[0].text)], lineindex)  # check if the variable is in the symbol table
+    if isoperator(value[0]):                                    # --|
+        compileexpression(tree, program, lineindex)             #   |--> EXPRESSIONS
+    else:                                                       # --|
+        compilevalue(value, "assignmode", program, lineindex)
+    emit(program, "STORE", slotof(program, left[0].text), lineindex)
+
+# printing
+def compilevisible(tokens, program, lineindex):
+    readdata = tokens[1:len(tokens)]
+    if len(readdata) == 0:                                                                          # No arguments
+        emit(program, "ERROR", [errorat(errorcode["missingvisible"], tokens[0]), lineindex], lineindex)  # after visible keyword
+        return
+    index = 0
+    count = 0       # values to be printed
+    while index < len(readdata):
+        token = readdata[index]
+        error = None
+        if token.kind == "YARN":                                                    # --|
+            emit(program, "LOADCONST", [token.text[1:-1], "YARN"], lineindex)       #   |--> STRINGS
+            index += 1                                                              # --|
+        elif isoperator(token):                                                 # --|
+            result = parseexpression(readdata, index)                           #   |
+            if not isinstance(result, str) and result[1] < len(readdata) and (readdata[result[1]].kind == "AN" or readdata[result[1]].kind == "MKAY"):
+                result = trailingerror(result, readdata)                        #   |--> EXPRESSIONS
+            if isinstance(result, str):                                         #   |
+                error = result                                                  #   |
+            else:                                                               #   |
+                value = compileexpression(result[0], program, lineindex)        #   |
+                if value != None:                                               #   |--> (a folded one is typed once)
+                    program["code"][-1] = ("LOADCONST", yarnconstant(program, typedoperand(value, token, "concatmode", None)))
+                else:                                                           #   |
+                    emit(program, "CAST", ["concatmode", None, token], lineindex)
+                index = result[1]                                               # --|
+        elif token.kind == "IDENTIFIER":                                            # --|
+            slot = slotof(program, token.text)                                      #   |--> VARIABLE REFERENCES
+            emit(program, "LOADVAR", [token, "printmode", None, slot], lineindex)   #   |
+            index += 1                                                              # --|
+        elif token.kind == "TROOF" or token.kind == "NUMBR" or token.kind == "NUMBAR":  # --|
+            emit(program, "LOADCONST", [token.text, "YARN"], lineindex)                 #   |--> BOOLEANS, FLOATS AND INTEGERS
+            index += 1                                                                  # --|
+        elif token.kind == "UNPAIRED":
+            error = errorat(errorcode["missingquote"], token)
+        else:
+            error = errorat(errorcode["invalidvalue"] + token.text, token)
+        if error != None:
+            emit(program, "ERROR", [error, lineindex], lineindex)
+            return
+        count += 1
+    emit(program, "PRINT", count, lineindex)
+
+# variable declarations
+def compiledeclaration(tokens, program, lineindex):
+    error = None
+    if len(tokens) == 1 or tokens[1].kind != "IDENTIFIER" or (len(tokens) > 2 and (tokens[2].kind != "KEYWORD" or tokens[2].text != "ITZ")):
+        error = errorat(errorcode["wrongvarname"] + tokentext(tokens[1:len(tokens)]) + ".\n", tokens[0])   # for unqualified variable names
+    elif len(tokens) == 3:                                              # --|
+        error = errorat(errorcode["novalue"] + tokens[1].text, tokens[2])   #   |--> identify if value is present
+    elif len(tokens) > 3 and isoperator(tokens[3]):
+        tree = expressiontree(tokens[3:len(tokens)])
+        if isinstance(tree, str):
+            error = tree
+    if error != None:
+        emit(program, "ERROR", [error, lineindex], lineindex)
+        return
+    if len(tokens) == 2:                                                # blank
+        emit(program, "LOADCONST", ["", "NOOB"], lineindex)             # initializatons
+    elif isoperator(tokens[3]):                                         # expression
+        compileexpression(tree, program, lineindex)                     # assignment
+    else:                                                               # string, boolean, variable reference,
+        compilevalue(tokens[3:len(tokens)], None, program, lineindex)   # float and integer assignment
+    emit(program, "STORE", slotof(program, tokens[1].text), lineindex)
+
+# the arguments of an I IZ line (I IZ name [YR value [AN YR value ...]] MKAY): an expression tree or a lone
+# literal/variable token for each one, returns the list of arguments or an error message
+def callarguments(tokens):
+    arguments = []
+    index = 2
+    while index < len(tokens) and tokens[index].kind != "MKAY":
+        if index != 2 and tokens[index].kind == "AN":       # the arguments after the first
+            index += 1                                      # one are written AN YR value
+        if index + 1 >= len(tokens) or tokens[index].text != "YR":
+            return errorat(errorcode["invalidcall"], tokens[min(index, len(tokens) - 1)])
+        elif isoperator(tokens[index + 1]):                         # --|
+            result = parseexpression(tokens, index + 1)             #   |--> an expression
+            if isinstance(result, str):                             #   |--> ends where its
+                return result                                       #   |--> last operand ends
+            arguments.append(result[0])                             #   |
+            index = result[1]                                       # --|
+        elif tokens[index + 1].kind in ("IDENTIFIER", "YARN", "TROOF", "NUMBR", "NUMBAR"):
+            arguments.append(tokens[index + 1])
+            index += 2
+        else:
+            return errorat(errorcode["invalidvalue"] + tokens[index + 1].text + "\n", tokens[index + 1])
+    if index != len(tokens) - 1:        # MKAY ends the line
+        return errorat(errorcode["invalidcall"], tokens[min(index, len(tokens) - 1)])
+    return arguments
+
+# function call, the arguments are pushed in order and the value the function returns goes to IT
+def compilecall(tokens, program, lineindex):
+    if len(tokens) < 2 or tokens[1].kind != "IDENTIFIER":
+        emit(program, "ERROR", [errorat(errorcode["invalidcall"], tokens[0]), lineindex], lineindex)
+        return
+    function = program["functions"].get(tokens[1].text)
+    arguments = callarguments(tokens)
+    error = None
+    if function == None:
+        error = errorat(errorcode["unknownfunc"] + tokens[1].text + ".\n", tokens[1])
+    elif isinstance(arguments, str):
+        error = arguments
+    elif len(arguments) != len(function["params"]):
+        error = errorat(errorcode["funcargs"] + tokens[1].text + " (" + str(len(function["params"])) + " expected).\n", tokens[1])
+    if error != None:
+        emit(program, "ERROR", [error, lineindex], lineindex)
+        return
+    for argument in arguments:
+        if isinstance(argument, Token):
+            compilevalue([argument], None, program, lineindex)
+        else:
+            compileexpression(argument, program, lineindex)
+    emit(program, "CALL", [tokens[1], tokens[1].text, len(arguments)], lineindex)
+    if program["scope"] != None:
+        program["scope"]["calls"].append(tokens[1].text)
+
+# FOUND YR, returns the value of an expression from the function being compiled
+def compilereturn(tokens, program, lineindex):
+    value = tokens[1:len(tokens)]
+    error = None
+    if program["scope"] == None:
+        error = errorat(errorcode["loneFOUNDYR"], tokens[0])
+    elif len(value) == 0:
+        error = errorat(errorcode["missingfound"], tokens[0])
+    elif isoperator(value[0]):
+        tree = expressiontree(value)
+        if isinstance(tree, str):
+            error = tree
+    if error != None:
+        emit(program, "ERROR", [error, lineindex], lineindex)
+        return
+    if isoperator(value[0]):
+        compileexpression(tree, program, lineindex)
+    else:
+        compilevalue(value, None, program, lineindex)
+    emit(program, "RETURN", None, lineindex)
+
+# a statement that is not a block, inblock tells if it is inside an if-else/switch block (loops and functions may
+# declare variables)
+def compilestatement(tokens, program, lineindex, inblock):
+    kind = statementkind(tokens)
+    error = None
+    if (kind == "visible" or kind == "gimmeh") and program["scope"] != None:
+        program["scope"]["effects"] = True      # the function is not pure (see purefunctions)
+    if kind == "ihasa" and inblock:                                 # --|
+        error = errorat(errorcode["notvardec"], tokens[0])          #   |--> variable declarations
+    elif kind == "ihasa":                                           #   |
+        compiledeclaration(tokens, program, lineindex)              # --|
+    elif kind == "visible":                                         # printing
+        compilevisible(tokens, program, lineindex)                  # in terminal
+    elif kind == "gimmeh":                                          # user input
+        compilegimmeh(tokens, program, lineindex)
+    elif kind == "expression":                                          # --|
+        tree = expressiontree(tokens)                                   #   |
+        if isinstance(tree, str):                                       #   |--> expression
+            error = tree                                                #   |--> evaluation (stored into IT)
+        else:                                                           #   |
+            value = compileexpression(tree, program, lineindex)         #   |
+            emit(program, "STORE", 0, lineindex)                       #   |
+            if value != None:                                           #   |
+                program["constantit"] = [here(program), value]          # --|
+    elif kind == "var_assign":                                      # variable
+        compileassignment(tokens, program, lineindex)               # assignment
+    elif kind == "call":                                            # function
+        compilecall(tokens, program, lineindex)                     # call
+    elif kind == "return":                                          # FOUND YR
+        compilereturn(tokens, program, lineindex)
+    elif kind == "if":                                                  # --|
+        error = errorat(errorcode["noORLY"], tokens[0])                 #   |--> invalid keywords
+    elif kind == "case" or kind == "default":                           #   |--> outside blocks
+        error = errorat(errorcode["nowtf"], tokens[0])                  # --|
+    elif kind == "blockend":                                            # block termination
+        error = errorat(errorcode["loneOIC"], tokens[0])                # without a block
+    elif kind == "loopend":                                             # loop termination
+        error = errorat(errorcode["loneIMOUTTAYR"], tokens[0])          # without a loop
+    elif kind == "funcend":                                             # function termination
+        error = errorat(errorcode["loneIFUSAYSO"], tokens[0])           # without a function
+    else:                                                               # unrecognized command
+        error = errorat(errorcode["unreqcomm"], tokens[0])
+    if error != None:
+        emit(program, "ERROR", [error, lineindex], lineindex)
+
+# BLOCK TABLE
+# One pass over the program matches every O RLY?/WTF? with its YA RLY, NO WAI, OMG, OMGWTF, GTFO and OIC, every
+# IM IN YR with its GTFO and IM OUTTA YR and every HOW IZ I with its GTFO and IF U SAY SO, innermost block first, so
+# blocks can be nested to any depth (functions are only defined outside of the other blocks). The table holds a record
+# for every block (by the index of its O RLY?/WTF?/IM IN YR/HOW IZ I line), the block that owns each of these keyword
+# lines, and the errors of the lines inside blocks (the lines that do not run are checked on entering a block, see
+# entryerror). GTFO leaves the innermost switch, loop or function.
+#
+#   "blocks"        {index: block}, a block is a dict:
+#                       "kind"          "ifblock", "switchblock", "loopblock" or "funcblock"
+#                       "start", "end"  index of the O RLY?/WTF?/IM IN YR/HOW IZ I and OIC/IM OUTTA YR/IF U SAY SO
+#                                       lines (end is the number of lines if there is none)
+#                       "structure"     [error, line index] of the first error in the structure of the block, or None
+#                       "yarly", "nowai"            (if-else) index of YA RLY and NO WAI, or None
+#                       "cases", "default"          (switch) [value, index] of every OMG, index of OMGWTF or None
+#                       "breaks"                    (switch) index of every GTFO directly in the block
+#                       "header"                    (loop, function) the parts of the IM IN YR line (see loopheader)
+#                                                   or of the HOW IZ I line (see funcheader)
+#   "owners"        the block that owns each line (None for the lines that are not YA RLY/NO WAI/OMG/OMGWTF/GTFO/OIC/
+#                   IM OUTTA YR/IF U SAY SO of a block)
+#   "errorlines"    index of every line inside a block that has an error, in order
+#   "lineerrors"    the [error, line index] of these lines
+def structureerror(block, message, token, lineindex):
+    if block["structure"] == None:      # only the first one is reported
+        block["structure"] = [errorat(message, token), lineindex]
+
+def blocktable(programline):
+    table = {"blocks": {}, "owners": [None] * len(programline), "errorlines": [], "lineerrors": []}
+    stack = []      # blocks still open, innermost last
+    exits = []      # switch, loop and function blocks still open (the blocks GTFO leaves)
+    for line in range(0, len(programline)):
+        tokens = programline[line]
+        kind = statementkind(tokens)
+        block = None
+        if len(stack) != 0:
+            block = stack[-1]
+        if block != None and line == block["start"] + 1:                                # --|
+            if block["kind"] == "ifblock" and kind != "if":                             #   |--> the first line
+                structureerror(block, errorcode["noYARLY"], tokens[0], line)            #   |--> of a block
+            elif block["kind"] == "switchblock" and kind != "case":                     #   |
+                structureerror(block, errorcode["noomg"], tokens[0], line)              # --|
+        if kind == "ifblock" or kind == "switchblock":
+            block = {"kind": kind, "start": line, "end": len(programline), "structure": None}
+            if kind == "ifblock":
+                block.update({"yarly": None, "nowai": None})
+            else:
+                block.update({"cases": [], "default": None, "breaks": []})
+                exits.append(block)
+            table["blocks"][line] = block
+            stack.append(block)
+        elif kind == "loopblock":
+            block = {"kind": kind, "start": line, "end": len(programline), "structure": None, "header": loopheader(tokens)}
+            if isinstance(block["header"], str):                # the loop never runs
+                block["structure"] = [block["header"], line]
+            table["blocks"][line] = block
+            stack.append(block)
+            exits.append(block)
+        elif kind == "loopend" and block != None and block["kind"] == "loopblock":
+            table["owners"][line] = block["start"]
+            block["end"] = line
+            if len(tokens) != 2 or isinstance(block["header"], str) or tokens[1].text != block["header"]["label"]:
+                structureerror(block, errorcode["looplabel"] + tokentext(tokens[1:len(tokens)]) + ".\n", tokens[0], line)
+            exits.pop()
+            stack.pop()
+        elif kind == "funcblock":
+            block = {"kind": kind, "start": line, "end": len(programline), "structure": None, "header": funcheader(tokens)}
+            if len(stack) != 0:                                 # not a definition (see definefunctions)
+                block["header"] = errorat(errorcode["nestedfunc"], tokens[0])
+            if isinstance(block["header"], str):                # the function never runs
+                block["structure"] = [block["header"], line]
+            table["blocks"][line] = block
+            stack.append(block)
+            exits.append(block)
+        elif kind == "funcend" and block != None and block["kind"] == "funcblock":
+            table["owners"][line] = block["start"]
+            block["end"] = line
+            exits.pop()
+            stack.pop()
+        elif kind == "blockend" and block != None and block["kind"] in ("ifblock", "switchblock"):
+            table["owners"][line] = block["start"]                                      # --|
+            block["end"] = line                                                         #   |
+            if block["kind"] == "ifblock" and block["nowai"] == None:                   #   |
+                structureerror(block, errorcode["noNOWAI"], tokens[0], line)            #   |--> END OF WHOLE BLOCK
+            elif block["kind"] == "switchblock" and block["default"] == None:           #   |
+                structureerror(block, errorcode["missingdefault"], tokens[0], line)     #   |
+                exits.pop()                                                             #   |
+            elif block["kind"] == "switchblock":                                        #   |
+                exits.pop()                                                             #   |
+            stack.pop()                                                                 # --|
+        elif (kind == "if" or kind == "else") and block != None and block["kind"] == "ifblock":
+            table["owners"][line] = block["start"]
+            if kind == "if" and block["yarly"] != None:             # check if YA RLY already exists in the block
+                structureerror(block, errorcode["multiYARLY"], tokens[0], line)
+            elif kind == "if":
+                block["yarly"] = line
+            elif block["nowai"] != None:                            # check if NO WAI already exists in the block
+                structureerror(block, errorcode["multiNOWAI"], tokens[0], line)
+            else:
+                block["nowai"] = line
+        elif (kind == "case" or kind == "default") and block != None and block["kind"] == "switchblock":
+            table["owners"][line] = block["start"]
+            value = None
+            if kind == "case":
+                value = casevalue(tokens)
+            if isinstance(value, str):                                                  # --|
+                if block["structure"] == None:                                          #   |--> invalid case value
+                    block["structure"] = [value, line]                                  # --|
+            elif kind == "case" and block["default"] != None:       # if OMGWTF is already encountered
+                structureerror(block, errorcode["nowtf"], tokens[0], line)
+            elif kind == "case":
+                block["cases"].append([value[0], line])
+            elif block["default"] != None:                          # if OMGWTF is already in the block
+                structureerror(block, errorcode["multiOMGWTF"], tokens[0], line)
+            else:
+                block["default"] = line
+        elif kind == "break" and len(exits) != 0:                           # --|
+            table["owners"][line] = exits[-1]["start"]                      #   |--> GTFO leaves the innermost switch,
+            if exits[-1] is block and block["kind"] == "switchblock":       #   |--> loop or function, even from
+                block["breaks"].append(line)                                # --|--> inside an if-else block
+        elif block != None:
+            result = linelexer(tokens)
+            if isinstance(result, str):
+                table["errorlines"].append(line)
+                table["lineerrors"].append([result, line])
+    for block in stack:     # blocks without OIC/IM OUTTA YR/IF U SAY SO
+        if block["kind"] == "loopblock":
+            structureerror(block, errorcode["noIMOUTTAYR"], programline[block["start"]][0], len(programline) - 1)
+        elif block["kind"] == "funcblock":
+            structureerror(block, errorcode["noIFUSAYSO"], programline[block["start"]][0], len(programline) - 1)
+        else:
+            structureerror(block, errorcode["noOIC"], programline[block["start"]][0], len(programline) - 1)
+    return table
+
+# first error met on entering block when only its lines from start to end (excluded) run
+# the lines that do not run are checked on entering the block, in order with the error in the block structure
+# returns [error, line index] or None
+def entryerror(block, table, start, end):
+    structure = block["structure"]
+    limit = block["end"]                # errors after the structure error
+    if structure != None:               # are not reached
+        limit = min(limit, structure[1] + 1)
+    errorlines = table["errorlines"]
+    first = bisect.bisect_right(errorlines, block["start"])                     # --|
+    if first < len(errorlines) and errorlines[first] < min(start, limit):       #   |--> first error before the lines
+        return table["lineerrors"][first]                                       # --|--> that run, then after them
+    first = bisect.bisect_left(errorlines, max(end, block["start"] + 1))
+    if first < len(errorlines) and errorlines[first] < limit:
+        return table["lineerrors"][first]
+    return structure
+
+# if-else control flow, compiles the O RLY? line, returns the index of the next line to compile
+def compileifelse(programline, index, program, table, blockstack):
+    block = table["blocks"][index]
+    nowai = block["nowai"]
+    if nowai == None:               # --|--> without NO WAI, every line
+        nowai = block["end"]        # --|--> after YA RLY is in its block
+    winerror = entryerror(block, table, index, nowai)
+    failerror = entryerror(block, table, nowai, block["end"])
+    block["known"] = None
+    it = knownit(program)
+    if it != None and (it[0] == "WIN" or it[0] == "FAIL"):      # --|
+        error = winerror                                        #   |
+        if it[0] == "FAIL":                                     #   |--> IT is known, only the branch
+            error = failerror                                   #   |--> that runs is compiled
+        if error != None:                                       #   |
+            emit(program, "ERROR", error, index)                #   |
+            return block["end"] + 1                             #   |
+        block["known"] = it[0]                                  #   |
+        blockstack.append(block)                                #   |
+        if it[0] == "FAIL":                                     #   |
+            return nowai + 1                                    #   |
+        return index + 1                                        # --|
+    block["orly"] = here(program)
+    emit(program, "ORLY", [programline[index][0], winerror, failerror, None], index)
+    if block["structure"] != None:      # the block never runs
+        return block["end"] + 1
+    blockstack.append(block)
+    return index + 1
+
+# switch control flow, compiles the WTF? line, returns the index of the next line to compile
+def compileswitch(programline, index, program, table, blockstack):
+    block = table["blocks"][index]
+    end = block["end"]
+    it = knownit(program)       # if IT is known, the case that matches is known too
+    block["dispatch"] = None
+    if it == None:                                      # the dispatch table is only
+        block["dispatch"] = here(program)               # complete at the end of the block
+        emit(program, "WTF", [programline[index][0], None, None], index)
+    # each case runs from its OMG up to the next GTFO of the block (or OIC)
+    starts = []
+    for [value, line] in block["cases"]:
+        starts.append([value, line])
+    if block["default"] != None:
+        starts.append([None, block["default"]])
+    targets = []
+    nextbreak = 0
+    for [value, line] in starts:
+        while nextbreak < len(block["breaks"]) and block["breaks"][nextbreak] < line:
+            nextbreak += 1
+        caseend = end
+        if nextbreak < len(block["breaks"]):
+            caseend = block["breaks"][nextbreak]
+        targets.append([value, line, entryerror(block, table, line, caseend)])
+    if block["default"] == None:                                            # no case matches
+        targets.append([None, None, entryerror(block, table, end, end)])
+    matched = False         # a known IT already matched a case
+    for target in targets:
+        if it == None:
+            target.append(block["dispatch"])
+        elif matched or (target[0] != None and target[0] != it[0]):
+            target.append(None)     # never taken
+        else:
+            target.append(here(program))
+            emit(program, "JUMP", None, index)
+            matched = True
+    block["targets"] = targets
+    block["labels"] = {}        # instruction position of every OMG/OMGWTF
+    block["jumps"] = []         # GTFO jumps
+    if block["structure"] != None:      # the block never runs
+        switchend(block, program)
+        return end + 1
+    blockstack.append(block)
+    return index + 1
+
+# end of a switch block: GTFO jumps here, and the cases that stop the program on entering the block
+# the dispatch table maps the value of each case to its first OMG (the first case with a value is the one that matches)
+def switchend(block, program):
+    for position in block["jumps"]:
+        patch(program, position, here(program))
+    cases = {}
+    default = None
+    for [value, line, error, position] in block["targets"]:
+        if position == None:        # never taken
+            continue
+        elif error != None:                                     # --|
+            target = label(program)                             #   |--> cases that stop the program
+            emit(program, "ERROR", error, block["start"])       #   |--> on entering the block
+        else:                                                   #   |
+            target = block["labels"][line]                      # --|
+        if block["dispatch"] == None:       # known IT, a single jump
+            patch(program, position, target)
+        elif value != None and value not in cases:
+            cases[value] = target
+        elif value == None:
+            default = target
+    if block["dispatch"] != None:
+        program["code"][block["dispatch"]] = ("WTF", [program["code"][block["dispatch"]][1][0], cases, default])
+
+# loop, compiles the IM IN YR line, returns the index of the next line to compile
+# the body is compiled once, between the condition (checked before every iteration) and the UPPIN/NERFIN and the jump
+# back, both compiled on the IM OUTTA YR line:
+#   top:    condition, JUMPIF [exit value, end]     (IM IN YR line)
+#           body
+#           UPPIN/NERFIN, JUMP top                  (IM OUTTA YR line)
+#   end:
+def compileloop(programline, index, program, table, blockstack):
+    block = table["blocks"][index]
+    if block["structure"] != None:      # the loop never runs
+        emit(program, "ERROR", block["structure"], index)
+        return block["end"] + 1
+    header = block["header"]
+    block["top"] = label(program)
+    block["jumps"] = []         # JUMPIF and GTFO jumps to the end of the loop
+    condition = header["condition"]
+    if isinstance(condition, Token):                                            # --|
+        compileoperand(condition, "boolmode", None, program, index)             #   |
+    elif condition != None:                                                     #   |
+        value = compileexpression(condition, program, index)                    #   |
+        if value != None:                                                       #   |--> the condition
+            value = typedoperand(value, condition[2], "boolmode", None)         #   |--> as a TROOF
+            program["code"][-1] = ("LOADCONST", value)                          #   |--> (a folded one
+        if isinstance(value, str):                                              #   |--> is typed once)
+            program["code"][-1] = ("ERROR", [value, index])                     #   |
+        elif value == None and resulttype(condition[0]) != "TROOF":             #   |
+            emit(program, "CAST", ["boolmode", None, condition[2]], index)      # --|
+    if condition != None:
+        block["jumps"].append(here(program))
+        emit(program, "JUMPIF", [header["exit"], None], index)
+    blockstack.append(block)
+    return index + 1
+
+# records of the functions defined in the program by name, made before compiling so that a function can be called
+# before its definition (a HOW IZ I with an error in its line, inside another block or with the name of a function
+# already defined defines nothing):
+#   "params"            names of the parameters
+#   "names", "slotof"   the slots of its frame (like the ones of the program, see COMPILER), IT then the parameters
+#   "entry"             position of its first instruction
+#   "start", "end"      index of its HOW IZ I and IF U SAY SO lines
+#   "calls"             names of the functions it calls
+#   "effects"           if it has a VISIBLE or GIMMEH
+#   "pure"              see purefunctions
+def definefunctions(table, program):
+    for start in sorted(table["blocks"]):
+        block = table["blocks"][start]
+        if block["kind"] != "funcblock" or isinstance(block["header"], str):
+            continue
+        name = block["header"]["name"]
+        if name.text in program["functions"]:
+            structureerror(block, errorcode["dblfunc"] + name.text + ".\n", name, start)
+            continue
+        names = ["IT"] + block["header"]["params"]
+        slots = {}
+        for slot in range(0, len(names)):
+            slots[names[slot]] = slot
+        block["function"] = {"params": block["header"]["params"], "names": names, "slotof": slots, "entry": None, "start": start, "end": block["end"], "calls": [], "effects": False, "pure": False}
+        program["functions"][name.text] = block["function"]
+
+# function definition, compiles the HOW IZ I line, returns the index of the next line to compile
+# the body is compiled where the function is defined, with a jump over it, its variables get the slots of its own
+# frame (a call makes a new frame, see runprogram): program["scope"] is the function being compiled (None outside)
+#           JUMP end                (HOW IZ I line)
+#   entry:  body
+#           LOADVAR IT, RETURN      (IF U SAY SO line, a function that did not return yet returns its IT)
+#   end:
+def compilefunction(programline, index, program, table, blockstack):
+    block = table["blocks"][index]
+    if block["structure"] != None:      # the program stops where the function is defined, or when it is called
+        if "function" in block:
+            block["function"]["entry"] = here(program)
+        emit(program, "ERROR", block["structure"], index)
+        return block["end"] + 1
+    function = block["function"]
+    block["jump"] = here(program)
+    emit(program, "JUMP", None, index)
+    function["entry"] = label(program)
+    block["globals"] = [program["names"], program["slotof"]]        # --|
+    program["names"] = function["names"]                            #   |--> the names of the
+    program["slotof"] = function["slotof"]                          #   |--> frame of the function
+    program["scope"] = function                                     # --|
+    blockstack.append(block)
+    return index + 1
+
+# a function is pure if it has no VISIBLE or GIMMEH and only calls pure functions: a function only sees its own frame,
+# so the value it returns then only depends on its arguments (and can be cached, see callsettings)
+def purefunctions(program):
+    functions = program["functions"]
+    for function in functions.values():
+        function["pure"] = not function["effects"]
+    changed = True
+    while changed:          # until the functions calling an impure one are all impure
+        changed = False
+        for function in functions.values():
+            for name in function["calls"]:
+                if function["pure"] and not functions[name]["pure"]:
+                    function["pure"] = False
+                    changed = True
+
+# a YA RLY/NO WAI/OMG/OMGWTF/GTFO/OIC/IM OUTTA YR/IF U SAY SO line of a block being compiled, returns the index of the
+# next line to compile
+def compileblockline(programline, index, program, table, blockstack):
+    block = table["blocks"][table["owners"][index]]
+    kind = statementkind(programline[index])
+    if kind == "else" and block["known"] == "WIN":          # the NO WAI lines never run
+        return block["end"]
+    elif kind == "else":                                                # --|
+        block["jump"] = here(program)                                   #   |--> end of YA RLY
+        emit(program, "JUMP", None, index)                              #   |
+        patch(program, block["orly"], here(program))                    # --|
+    elif kind == "case" or kind == "default":
+        block["labels"][index] = label(program)
+    elif kind == "break" and block["kind"] == "funcblock":     # --|
+        emit(program, "LOADCONST", ["", "NOOB"], index)         #   |--> GTFO returns NOOB
+        emit(program, "RETURN", None, index)                    # --|
+    elif kind == "break":
+        block["jumps"].append(here(program))
+        emit(program, "JUMP", None, index)
+    elif kind == "blockend" and block["kind"] == "ifblock":
+        blockstack.pop()
+        if block["known"] == None:
+            patch(program, block["jump"], here(program))
+    elif kind == "blockend":
+        blockstack.pop()
+        switchend(block, program)
+    elif kind == "loopend":
+        blockstack.pop()
+        variable = block["header"]["variable"]
+        if variable != None:        # UPPIN/NERFIN
+            emit(program, "STEP", [variable, 1 if block["header"]["operation"] == "add" else -1, slotof(program, variable.text)], index)
+        emit(program, "JUMP", block["top"], index)
+        for position in block["jumps"]:
+            patch(program, position, here(program))
+    elif kind == "funcend":
+        blockstack.pop()
+        emit(program, "LOADVAR", [programline[index][0], None, None, 0], index)
+        emit(program, "RETURN", None, index)
+        [program["names"], program["slotof"]] = block["globals"]
+        program["scope"] = None
+        patch(program, block["jump"], here(program))
+    return index + 1
+
+# compiles the tokenized lines of a program (between HAI and KTHXBYE)
+def compileprogram(programline, program):
+    resolveslots(programline, program)
+    table = blocktable(programline)
+    definefunctions(table, program)
+    blockstack = []     # blocks being compiled, innermost last
+    index = 0
+    while index < len(programline):
+        kind = statementkind(programline[index])
+        if kind == "ifblock":
+            index = compileifelse(programline, index, program, table, blockstack)
+        elif kind == "switchblock":
+            index = compileswitch(programline, index, program, table, blockstack)
+        elif kind == "loopblock":
+            index = compileloop(programline, index, program, table, blockstack)
+        elif kind == "funcblock":
+            index = compilefunction(programline, index, program, table, blockstack)
+        elif table["owners"][index] != None:
+            index = compileblockline(programline, index, program, table, blockstack)
+        else:
+            inblock = False                                 # inside an if-else/switch block
+            for block in blockstack:
+                inblock = inblock or block["kind"] == "ifblock" or block["kind"] == "switchblock"
+            compilestatement(programline[index], program, index, inblock)
+            index += 1
+    purefunctions(program)
+
+
+# STACK MACHINE
+# The values of the variables of a run are in a list indexed by slot (see COMPILER), None for a variable not
+# declared yet. A value is a [value, type] list, shared with the stack and the literals of the code (never changed).
+# A function call runs on a frame of its own: a new list of values with only IT and the parameters, so a function
+# never sees (or copies) the variables of the program or of its caller.
+# "depth" bounds the calls running at once (a recursion that never ends stops with an error instead of filling the
+# memory), "memo" is the number of results of calls of pure functions (see purefunctions) kept in a run, the least
+# recently used out first, to return the same result again without running the function: 0 (the default) keeps none.
+callsettings = {"depth": 100000, "memo": 0}
+
+# values of the variables of a new run of program, only IT (empty) is declared
+def newslots(program):
+    slots = [None] * len(program["names"])
+    slots[0] = ["", ""]             # implicit IT declaration
+    return slots
+
+# symbol table (identifier: [value, type]) of the declared variables in slots, in the order of their slots
+def slotsymbols(program, slots):
+    symbolgroup = {}
+    for slot in range(0, len(slots)):
+        if slots[slot] != None:
+            symbolgroup[program["names"][slot]] = slots[slot]
+    return symbolgroup
+
+# value of a variable for a LOADVAR instruction, returns [value, type] or an error message
+# mode is the kind of operand it is (see typedoperand), "printmode" for VISIBLE, "assignmode" for R and None for ITZ
+# (the value as it is)
+def variablevalue(argument, slots):
+    [token, mode, operation, slot] = argument
+    value = slots[slot]
+    if value == None:
+        return errorat(errorcode["unknownref"] + token.text + ".\n", token)
+    if mode == "printmode":
+        return [str(value[0]), "YARN"]
+    elif mode != None and mode != "assignmode":
+        return typedoperand(value, token, mode, operation)
+    return value
+
+# GIMMEH, returns the value read or an error message
+def readvalue(argument, slots):
+    [token, gimmehtoken, slot] = argument
+    if slots[slot] == None:
+        return errorat(errorcode["unknownref"] + token.text, token)
+    liveInput = iohandlers["read"](token.text)                  # --|
+    if liveInput == None:                                       #   |
+        return errorat(errorcode["noinput"], gimmehtoken)       #   |
+    elif patterns["numbar_full"].search(liveInput):             #   |--> input asking
+        return [float(liveInput), "NUMBAR"]                     #   |--> and typecasting
+    elif patterns["numbr_full"].search(liveInput):              #   |
+        return [int(liveInput), "NUMBR"]                        #   |
+    return [liveInput, "YARN"]                                  # --|
+
+# runs the compiled code of program on the values of its variables (see newslots), returns None or the
+# [error, line index] that stopped it
+# a CALL puts the position to return to, the values of the caller and the key of the result to keep (None if it is not
+# kept) on the frames stack and goes on with the values of the new frame, RETURN takes them back
+# control (None if the run is not watched) is a dict shared with another thread, every control["interval"] instructions
+# "instructions" (instructions run so far) and "line" (index of the line running) are updated and "stop" is checked
+def runprogram(program, slots, control=None):
+    code = program["code"]
+    stack = []
+    frames = []             # calls running, innermost last
+    results = collections.OrderedDict()     # results of calls of pure functions by function name and arguments
+    memo = callsettings["memo"]
+    pc = 0
+    end = len(code)
+    countdown = -1          # instructions before the next control check (never 0 without control)
+    if control != None:
+        countdown = control["interval"]
+    while pc != end:
+        countdown -= 1
+        if countdown == 0:                                      # --|
+            countdown = control["interval"]                     #   |
+            control["instructions"] += countdown                #   |--> progress
+            control["line"] = program["lines"][pc]              #   |--> and stop
+            if control["stop"]:                                 #   |
+                return [errorcode["stopped"], program["lines"][pc]]     # --|
+        (opcode, argument) = code[pc]
+        pc += 1
+        if opcode == "LOADCONST":
+            stack.append(argument)
+        elif opcode == "LOADVAR":
+            value = variablevalue(argument, slots)
+            if isinstance(value, str):
+                return [value, program["lines"][pc - 1]]
+            stack.append(value)
+        elif opcode == "STORE":
+            slots[argument] = stack.pop()
+        elif opcode == "MATH":
+            value = arithmetics(argument[0], [stack[-2], stack.pop()])
+            if isinstance(value, str):
+                return [errorat(value, argument[1]), program["lines"][pc - 1]]
+            stack[-1] = value
+        elif opcode == "JUMP":
+            pc = argument
+        elif opcode == "JUMPIF":
+            if stack.pop()[0] == argument[0]:
+                pc = argument[1]
+        elif opcode == "STEP":
+            value = slots[argument[2]]
+            if value == None or (value[1] != "NUMBR" and value[1] != "NUMBAR"):
+                return [variablevalue([argument[0], "mathmode", "add", argument[2]], slots), program["lines"][pc - 1]]
+            slots[argument[2]] = [value[0] + argument[1], value[1]]
+        elif opcode == "CALL":
+            function = program["functions"][argument[1]]
+            first = len(stack) - argument[2]        # the first argument
+            key = None
+            if memo != 0 and function["pure"]:
+                key = (argument[1],) + tuple([tuple(value) for value in stack[first:]])
+                if key in results:                                          # --|
+                    results.move_to_end(key)                                #   |--> the same call
+                    slots[0] = results[key]                                 #   |--> already returned
+                    del stack[first:]                                       #   |
+                    continue                                                # --|
+            if len(frames) == callsettings["depth"]:
+                return [errorat(errorcode["calldepth"], argument[0]), program["lines"][pc - 1]]
+            frame = [None] * len(function["names"])
+            frame[0] = ["", ""]
+            frame[1:argument[2] + 1] = stack[first:]
+            del stack[first:]
+            frames.append((pc, slots, key))
+            slots = frame
+            pc = function["entry"]
+        elif opcode == "RETURN":
+            value = stack.pop()
+            (pc, slots, key) = frames.pop()
+            slots[0] = value
+            if key != None:
+                results[key] = value
+                if len(results) > memo:
+                    results.popitem(last=False)
+        elif opcode == "JUMPKEEP":
+            if stack[-1][0] == argument[0]:
+                pc = argument[1]
+            else:
+                stack.pop()
+        elif opcode == "NOT":
+            stack[-1] = booleans("not", [stack[-1]])
+        elif opcode == "XOR":
+            value = stack.pop()
+            stack[-1] = booleans("xor", [stack[-1], value])
+        elif opcode == "CAST":
+            value = typedoperand(stack[-1], argument[2], argument[0], argument[1])
+            if isinstance(value, str):
+                return [value, program["lines"][pc - 1]]
+            stack[-1] = value
+        elif opcode == "CONCAT":
+            value = ["".join([item[0] for item in stack[-argument:]]), "YARN"]
+            del stack[-argument:]
+            stack.append(value)
+        elif opcode == "PRINT":
+            iohandlers["write"](" ".join([item[0] for item in stack[-argument:]]) + " \n")
+            del stack[-argument:]
+        elif opcode == "DEFINED":
+            if slots[argument[1]] == None:
+                return [errorat(errorcode["unknownref"] + argument[0].text + ".\n", argument[0]), program["lines"][pc - 1]]
+        elif opcode == "READ":
+            value = readvalue(argument, slots)
+            if isinstance(value, str):
+                return [value, program["lines"][pc - 1]]
+            slots[argument[2]] = value
+        elif opcode == "WTF":
+            if slots[0] == ["", ""]:            # if the IT variable is empty
+                return [errorat(errorcode["itemptyerror"], argument[0]), program["lines"][pc - 1]]
+            pc = argument[1].get(slots[0][0], argument[2])
+        elif opcode == "ORLY":
+            if slots[0] == ["", ""]:            # if the IT variable is empty
+                return [errorat(errorcode["itemptyerror"], argument[0]), program["lines"][pc - 1]]
+            elif slots[0][0] != "WIN" and slots[0][0] != "FAIL":  # if the preceding line does not result to the type TROOF
+                return [errorat(errorcode["conditionerror"], argument[0]), program["lines"][pc - 1]]
+            elif slots[0][0] == "WIN" and argument[1] != None:
+                return argument[1]
+            elif slots[0][0] == "FAIL" and argument[2] != None:
+                return argument[2]
+            elif slots[0][0] == "FAIL":
+                pc = argument[3]
+        elif opcode == "HOOK":      # only in hooked code (see HOOKS), after the other instructions
+            hookevent(argument, slots, stack)
+        elif opcode == "MARK":      # only in profiled code (see PROFILER)
+            profilemark(argument)
+        else:   # ERROR
+            return argument
+    return None
+
+
+# PREPROCESSING
+# One pass over the program text, line by line, without splitting or copying it: comments (BTW, OBTW ... TLDR)
+# and whitespace lines are removed and the code delimiters are checked while the lines with code are yielded
+# with their line number in the program text. Errors are only known when the pass ends: a comment error (an
+# unpaired TLDR or OBTW) comes before a delimiter error (HAI/KTHXBYE missing or repeated) found earlier.
+
+# the (line number, line) pairs of text, split on newlines like str.split
+def sourcelines(text):
+    linenumber = 1
+    start = 0
+    end = text.find("\n")
+    while end != -1:
+        yield (linenumber, text[start:end])
+        linenumber += 1
+        start = end + 1
+        end = text.find("\n", start)
+    yield (linenumber, text[start:])
+
+# the (line number, code) pairs of the lines of rawtextinput with code, comments removed, in one pass
+# status is filled when the pass ends: "error" (None if there is none) and "hailine" (line number of the first HAI)
+def preprocess(rawtextinput, status):
+    commentline = None          # line number of the OBTW of the comment being skipped
+    haiseen = False
+    kthxseen = False
+    delimitererror = None       # first delimiter error, the lines after it are not yielded
+    status["error"] = None
+    status["hailine"] = None
+    for (linenumber, line) in sourcelines(rawtextinput):
+        if patterns["spaces"].search(line):
+            continue
+        elif commentline != None:                               # --|
+            if "TLDR" in line and patterns["tldr"].search(line):  #   |
+                commentline = None                              #   |
+            continue                                            #   |--> comment stripper:
+        elif "TLDR" in line and patterns["tldr"].search(line):  #   |--> multiline and inline comments,
+            status["error"] = errorcode["nopairTLDR"]           #   |--> the code before BTW is kept
+            status["hailine"] = None                            #   |
+            return                                              #   |
+        elif "OBTW" in line and patterns["obtw"].search(line):  #   |
+            commentline = linenumber                            #   |
+            continue                                            #   |
+        elif "BTW" in line and patterns["btw"].search(line):    #   |
+            line = patterns["btw"].split(line)[0]               #   |
+            if len(line) == 0:                                  #   |
+                continue                                        # --|
+        if delimitererror != None:
+            continue
+        elif patterns["hai"].search(line):                      # --|
+            if haiseen:                                         #   |
+                delimitererror = errorcode["dblHAI"]            #   |
+                continue                                        #   |
+            haiseen = True                                      #   |--> code delimiter
+            status["hailine"] = linenumber                      #   |--> verifiers
+        elif haiseen and patterns["kthxbye"].search(line):      #   |
+            if kthxseen:                                        #   |
+                delimitererror = errorcode["dblKTHXBYE"]        #   |
+                continue                                        #   |
+            kthxseen = True                                     # --|
+        yield (linenumber, line)
+    if commentline != None:                                                     # --|
+        status["error"] = "Warning: Unpaired OBTW at line " + str(commentline)  #   |
+        status["hailine"] = None                                                #   |
+    elif delimitererror != None:                                                #   |--> errors, comment
+        status["error"] = delimitererror                                        #   |--> errors first
+    elif not haiseen:                                                           #   |
+        status["error"] = errorcode["noHAI"]                                    #   |
+    elif not kthxseen:                                                          #   |
+        status["error"] = errorcode["noKTHXBYE"]                                # --|
+
+# compile step, preprocesses the program text (see PREPROCESSING) and compiles the lines between HAI and KTHXBYE
+# rawtextinput is the whole program text, ending in a newline like the contents of a Text widget
+# returns the program: "error" (found before compiling, or None), "delimiters" (lexemes of HAI), "source" (the lines
+# between HAI and KTHXBYE), "hailine" and "linenumbers" (line numbers of HAI and of these lines in the program text),
+# "tokens" (the tokens of each of these lines), "linelexemes" (the lexemes of the first lines,
+# filled by programlexemes when they are needed), "code", "lines", "names", "slotof" and "yarns" (see COMPILER),
+# "functions" and "scope" (see definefunctions and compilefunction)
+# "timings" (seconds spent to "preprocess", "tokenize" and "compile" it) and "hooked" (see hookedprogram)
+def compilesource(rawtextinput):
+    program = {"error": None, "delimiters": [], "source": [], "hailine": None, "linenumbers": [], "tokens": [], "linelexemes": [], "code": [], "lines": [], "constantit": None, "names": ["IT"], "slotof": {"IT": 0}, "yarns": {}, "functions": {}, "scope": None, "timings": {}, "hooked": {}}
+    # string "***" is sourced from the file error string
+    if len(rawtextinput) - 1 == 0 or rawtextinput[0:3] == "***":
+        program["error"] = "*** Please load a valid file before executing ***"     # a file error has occurred
+        return program
+    status = {}
+    source = program["source"]
+    linenumbers = program["linenumbers"]
+    start = time.perf_counter()
+    for (linenumber, code) in preprocess(rawtextinput, status):
+        source.append(code)
+        linenumbers.append(linenumber)
+    program["timings"]["preprocess"] = time.perf_counter() - start
+    program["error"] = status["error"]
+    program["hailine"] = status["hailine"]
+    if status["hailine"] != None:
+        program["delimiters"].append(["HAI", '"Code Delimiter"'])
+    if status["error"] != None:
+        program["source"] = []
+        program["linenumbers"] = []
+        return program
+    del source[0]                   # --|
+    del source[-1]                  #   |--> first and last lines with code,
+    del linenumbers[0]              #   |--> HAI and KTHXBYE
+    del linenumbers[-1]             # --|
+    start = time.perf_counter()
+    program["tokens"] = [tokenize(source[line], linenumbers[line]) for line in range(0, len(source))]   # every line is tokenized once
+    program["timings"]["tokenize"] = time.perf_counter() - start
+    start = time.perf_counter()
+    compileprogram(program["tokens"], program)
+    program["timings"]["compile"] = time.perf_counter() - start
+    return program
+
+# PROGRAM CACHE
+# compiled programs by the hash of their text, least recently used first
+# "size" bounds the number of programs kept (0 turns the cache off), "hits" and "misses" count the lookups
+programcache = collections.OrderedDict()
+cachestats = {"size": 32, "hits": 0, "misses": 0}
+
+# compiled program of rawtextinput, compiled only if the same text is not in the cache
+# the programs are only read when running, so one can be shared by any number of runs
+def cachedprogram(rawtextinput):
+    key = hashlib.sha256(rawtextinput.encode("utf-8")).hexdigest() + str(compilesettings["fold"])    # same text, other settings
+    if key in programcache:
+        cachestats["hits"] += 1
+        programcache.move_to_end(key)
+        return programcache[key]
+    cachestats["misses"] += 1
+    program = compilesource(rawtextinput)
+    if cachestats["size"] > 0:
+        programcache[key] = program
+        while len(programcache) > cachestats["size"]:   # drop the least recently used
+            programcache.popitem(last=False)
+    return program
+
+# empties the cache and resets the counters
+def clearcache():
+    programcache.clear()
+    cachestats["hits"] = 0
+    cachestats["misses"] = 0
+
+
+# INSTRUMENTATION
+# The profiler and the hooks below run a copy of the compiled code with their own instructions (MARK, HOOK) put
+# around the compiled ones, the code of the runs that use neither is never changed.
+
+# copy of program with instructions put around the compiled ones, insertions(position) returns [before, after]: the
+# instructions put before and after the instruction at position (they get its line). The jump targets (and the
+# entries of the functions) are moved to match: a jump to an instruction goes to the first instruction put before it.
+def instrumentedprogram(program, insertions):
+    code = program["code"]
+    lines = program["lines"]
+    moved = []              # new position of every instruction, counting the ones put before it (and of the end of the code)
+    newcode = []
+    newlines = []
+    for position in range(0, len(code)):
+        [before, after] = insertions(position)
+        moved.append(len(newcode))
+        for instruction in before + [code[position]] + after:
+            newcode.append(instruction)
+            newlines.append(lines[position])
+    moved.append(len(newcode))
+    for position in range(0, len(newcode)):
+        (opcode, argument) = newcode[position]
+        if opcode == "JUMP":
+            newcode[position] = (opcode, moved[argument])
+        elif opcode == "JUMPKEEP" or opcode == "JUMPIF":
+            newcode[position] = (opcode, [argument[0], moved[argument[1]]])
+        elif opcode == "ORLY":          # no target in a block with a structure error (the ORLY stops the program)
+            target = moved[argument[3]] if argument[3] != None else None
+            newcode[position] = (opcode, argument[0:3] + [target])
+        elif opcode == "WTF":
+            cases = dict([(value, moved[target]) for (value, target) in argument[1].items()])
+            default = moved[argument[2]] if argument[2] != None else None
+            newcode[position] = (opcode, [argument[0], cases, default])
+    functions = {}
+    for (name, function) in program["functions"].items():
+        functions[name] = dict(function, entry=moved[function["entry"]])
+    return dict(program, code=newcode, lines=newlines, functions=functions)
+
+# PROFILER
+# Opt-in: a profiled run (runsource with a profile) runs a copy of the compiled code with a MARK instruction where each
+# line starts, which charges the time since the previous MARK to the line that was running. Runs without a profile
+# run the code as compiled, with no MARK in it, so profiling costs them nothing.
+# A profile holds, for every line index, "calls" (times the line started) and "seconds" (time spent in it), and
+# "phases": seconds spent in each phase around the run ("load", "instrument", "run", "lexemes", and the ones a front-end adds,
+# e.g. "display" and "tables" in the GUI). "current" is the line running (-1 before the first MARK) since "since",
+# "start" the time the profiled run started (None out of a run).
+def newprofile():
+    return {"calls": [], "seconds": [], "current": -1, "since": 0.0, "start": None, "phases": {}}
+
+# adds seconds to the phase name of profile
+def profilephase(profile, name, seconds):
+    profile["phases"][name] = profile["phases"].get(name, 0.0) + seconds
+
+# MARK: the line argument[1] starts, the time since the previous MARK goes to the line that was running
+def profilemark(argument):
+    [profile, line] = argument
+    now = time.perf_counter()
+    if profile["current"] != -1:
+        profile["seconds"][profile["current"]] += now - profile["since"]
+    profile["calls"][line] += 1
+    profile["current"] = line
+    profile["since"] = now
+
+# end of a profiled run, the time since the last MARK goes to the last line that ran
+def profileend(profile):
+    now = time.perf_counter()
+    if profile["current"] != -1:
+        profile["seconds"][profile["current"]] += now - profile["since"]
+    profile["current"] = -1
+    if profile["start"] != None:
+        profilephase(profile, "run", now - profile["start"])
+        profile["start"] = None
+
+# copy of program whose code has a MARK at the start of each line (see instrumentedprogram), the time it takes is
+# the phase "instrument"
+def profiledprogram(program, profile):
+    start = time.perf_counter()
+    lines = program["lines"]
+    def marks(position):
+        if position == 0 or lines[position] != lines[position - 1]:
+            return [[("MARK", [profile, lines[position]])], []]
+        return [[], []]
+    profiled = instrumentedprogram(program, marks)
+    while len(profile["calls"]) < len(program["source"]):
+        profile["calls"].append(0)
+        profile["seconds"].append(0.0)
+    profile["start"] = time.perf_counter()
+    profilephase(profile, "instrument", profile["start"] - start)
+    return profiled
+
+# report of profile for program: "phases" (including the "preprocess", "tokenize" and "compile" timings of the
+# program), "kinds" (calls and seconds by statement kind, see statementkind) and "lines" (the lines that ran, the
+# slowest first): each as [line number in the program text, statement kind, calls, seconds, source]
+def profilereport(profile, program):
+    phases = dict(program["timings"])
+    phases.update(profile["phases"])
+    kinds = {}
+    lines = []
+    for line in range(0, len(profile["calls"])):
+        if profile["calls"][line] == 0:
+            continue
+        kind = statementkind(program["tokens"][line])
+        if kind not in kinds:
+            kinds[kind] = {"calls": 0, "seconds": 0.0}
+        kinds[kind]["calls"] += profile["calls"][line]
+        kinds[kind]["seconds"] += profile["seconds"][line]
+        lines.append([program["linenumbers"][line], kind, profile["calls"][line], profile["seconds"][line], program["source"][line]])
+    lines.sort(key=lambda entry: entry[3], reverse=True)
+    return {"phases": phases, "kinds": kinds, "lines": lines}
+
+# writes a report (see profilereport) to the file path as JSON
+def profileexport(report, path):
+    lines = [{"line": line, "kind": kind, "calls": calls, "seconds": seconds, "source": source} for [line, kind, calls, seconds, source] in report["lines"]]
+    with open(path, "w") as file:
+        json.dump({"phases": report["phases"], "kinds": report["kinds"], "lines": lines}, file, indent=1)
+
+# HOOKS
+# Tools (tracers, coverage, watchdogs) follow a run by subscribing functions to its events, called with the line
+# number (in the program text) of the line that made the event:
+#   on_statement    (linenumber, source)            a line starts
+#   on_assign       (linenumber, name, value)       a variable gets a value (R, I HAS A, GIMMEH, UPPIN/NERFIN at IM OUTTA YR),
+#                                                   value is [value, type]
+#   on_output       (linenumber, text)              VISIBLE writes text
+#   on_branch       (linenumber, kind, value)       an O RLY? ("ifelse") or WTF? ("switch") checks IT, whose value is value
+#                                                   (blocks decided when compiling, see CONSTANT FOLDING, check nothing),
+#                                                   or an IM IN YR ("loop") checks its condition, whose value is value
+#   on_error        (linenumber, message)           the program stopped on an error (linenumber is None if it did not run)
+# A run only has HOOK instructions for the events that have subscribers (see hookedprogram), so without any
+# subscriber it runs the code as compiled and the hooks cost it nothing.
+runhooks = {"on_statement": [], "on_assign": [], "on_output": [], "on_branch": [], "on_error": []}
+# the lines that only mark the parts of a block are no statements (their code is the jump out of the part before them)
+blockparts = ("if", "else", "case", "default", "blockend")
+
+# subscribes function to event (a key of runhooks)
+def addhook(event, function):
+    runhooks[event].append(function)
+
+# unsubscribes function from event
+def removehook(event, function):
+    if function in runhooks[event]:
+        runhooks[event].remove(function)
+
+# copy of program with a HOOK instruction wherever an event with subscribers happens (see instrumentedprogram), made
+# once for each set of events and kept in program["hooked"] (a HOOK calls the subscribers of the time it runs)
+#   HOOK        [event, linenumber, ...]        calls the subscribers of event (see hookevent)
+def hookedprogram(program, events):
+    if events in program["hooked"]:
+        return program["hooked"][events]
+    code = program["code"]
+    lines = program["lines"]
+    names = [program["names"]] * len(program["source"])     # names of the slots of each line (see compilefunction)
+    for function in program["functions"].values():
+        names[function["start"]:function["end"] + 1] = [function["names"]] * (function["end"] + 1 - function["start"])
+    def hooks(position):
+        (opcode, argument) = code[position]
+        line = lines[position]
+        linenumber = program["linenumbers"][line]
+        before = []
+        after = []
+        if "on_statement" in events and (position == 0 or line != lines[position - 1]) and statementkind(program["tokens"][line]) not in blockparts:
+            before.append(("HOOK", ["on_statement", linenumber, program["source"][line]]))
+        if "on_assign" in events and opcode == "STORE" and statementkind(program["tokens"][line]) in ("var_assign", "ihasa"):
+            after.append(("HOOK", ["on_assign", linenumber, names[line][argument], argument]))
+        elif "on_assign" in events and (opcode == "READ" or opcode == "STEP"):
+            after.append(("HOOK", ["on_assign", linenumber, names[line][argument[2]], argument[2]]))
+        elif "on_output" in events and opcode == "PRINT":
+            before.append(("HOOK", ["on_output", linenumber, argument]))
+        elif "on_branch" in events and opcode == "ORLY":
+            before.append(("HOOK", ["on_branch", linenumber, "ifelse"]))
+        elif "on_branch" in events and opcode == "WTF":
+            before.append(("HOOK", ["on_branch", linenumber, "switch"]))
+        elif "on_branch" in events and opcode == "JUMPIF":
+            before.append(("HOOK", ["on_branch", linenumber, "loop"]))
+        return [before, after]
+    hooked = instrumentedprogram(program, hooks)
+    program["hooked"][events] = hooked
+    return hooked
+
+# HOOK: calls the subscribers of the event argument[0]
+def hookevent(argument, slots, stack):
+    event = argument[0]
+    if event == "on_statement":
+        data = (argument[1], argument[2])
+    elif event == "on_assign":
+        data = (argument[1], argument[2], slots[argument[3]])
+    elif event == "on_output":
+        data = (argument[1], " ".join([item[0] for item in stack[-argument[2]:]]) + " \n")
+    elif argument[2] == "loop":     # on_branch, the condition is on the stack
+        data = (argument[1], argument[2], stack[-1])
+    else:   # on_branch
+        data = (argument[1], argument[2], slots[0])
+    for function in runhooks[event]:
+        function(*data)
+
+# lexeme table of a run of program that stopped at the line index stop (finished if it reached KTHXBYE)
+# the lexemes of each line are only made once for a program, the first time a run needs them
+def programlexemes(program, stop, finished):
+    linelexemes = program["linelexemes"]
+    while len(linelexemes) <= stop:
+        linelexemes.append(tokenlexemes(program["tokens"][len(linelexemes)]))
+    lexemegroup = list(program["delimiters"])
+    for line in range(0, stop + 1):                     # lexemes of the lines
+        lexemegroup.extend(linelexemes[line])           # up to where it stopped
+    if finished:
+        lexemegroup.append(["KTHXBYE", '"Code Delimiter"'])
+    return lexemegroup
+
+# lexeme index of every line of a run: [line number in the program text, index of its first lexeme in the lexeme table]
+# (HAI is the first lexeme), for the lines up to the one where the run stopped
+def lexemelines(run):
+    program = run["program"]
+    runlexemes(run)                             # the lexemes of the lines are made
+    lines = []
+    if len(program["delimiters"]) != 0:
+        lines.append([program["hailine"], 0])
+    index = len(program["delimiters"])
+    for line in range(0, run["stop"] + 1):
+        lines.append([program["linenumbers"][line], index])
+        index += len(program["linelexemes"][line])
+    return lines
+
+# symbol table of a run, made from its slots the first time it is asked for
+def runsymbols(run):
+    if run["symbols"] == None:
+        run["symbols"] = slotsymbols(run["program"], run["slots"])
+    return run["symbols"]
+
+# lexeme table of a run, made the first time it is asked for if the run did not record it
+def runlexemes(run):
+    if run["lexemes"] == None:
+        run["lexemes"] = programlexemes(run["program"], run["stop"], run["finished"])
+    return run["lexemes"]
+
+# compiles the program text (or takes it from the cache) and runs it
+# rawtextinput is the whole program text, ending in a newline like the contents of a Text widget
+# recordlexemes False is the execute-only mode: no lexeme is made while running (see runlexemes)
+# returns the run: "program", "slots" (the values of the variables, see newslots), "symbols" (the symbol table, made
+# from the slots by runsymbols), "error" (the error message, None if the program ran to the end), "stop" (index of the
+# last line run), "finished" (if it reached KTHXBYE) and "lexemes" (the lexeme table, None if it was not recorded)
+# control (see newcontrol) lets another thread follow the run and stop it, profile (see newprofile) profiles it
+def runsource(rawtextinput, recordlexemes=True, control=None, profile=None):
+    if profile != None:
+        start = time.perf_counter()
+    program = cachedprogram(rawtextinput)
+    run = {"program": program, "slots": newslots(program), "symbols": None, "error": program["error"], "stop": -1, "finished": False, "lexemes": None}
+    if control != None:
+        control["linenumbers"] = program["linenumbers"]     # to show the line running in the program text
+    if profile != None:
+        profilephase(profile, "load", time.perf_counter() - start)     # compiling, or taking the program from the cache
+    if run["error"] == None:
+        running = program
+        events = tuple([event for event in runhooks if len(runhooks[event]) != 0 and event != "on_error"])
+        if len(events) != 0:
+            running = hookedprogram(program, events)
+        if profile != None:
+            running = profiledprogram(running, profile)
+        result = runprogram(running, run["slots"], control)
+        run["stop"] = len(program["source"]) - 1                            # --|
+        if result != None:                                                  #   |--> the program stopped on an error,
+            [run["error"], run["stop"]] = result                            #   |--> echo its line
+            iohandlers["write"](program["source"][run["stop"]] + "\n")      # --|
+        run["finished"] = result == None
+    if run["error"] != None:                    # first error met, also written to the output
+        iohandlers["write"](run["error"])
+        for function in runhooks["on_error"]:
+            function(program["linenumbers"][run["stop"]] if run["stop"] != -1 else None, run["error"])
+    if profile != None:
+        profileend(profile)
+        start = time.perf_counter()
+    if recordlexemes:
+        runlexemes(run)
+    if profile != None and recordlexemes:
+        profilephase(profile, "lexemes", time.perf_counter() - start)
+    return run
+
+# control of a run made on a worker thread, given to runsource: every interval instructions the run updates
+# "instructions" and "line" (index of the line running in program["source"], whose line numbers in the program text
+# runsource puts in "linenumbers") and stops if "stop" is True
+def newcontrol(interval=10000):
+    return {"interval": interval, "instructions": 0, "line": 0, "linenumbers": None, "stop": False}
+
+# starting function call, compiles the program text (or takes it from the cache) and runs it
+# rawtextinput is the whole program text, ending in a newline like the contents of a Text widget
+# recordlexemes False is the execute-only mode: no lexeme is made while running, the lexeme table is
+# returned as a function that makes it when it is called (when the lexeme table is shown)
+# returns the lexeme table, the symbol table and the error message (None if the program ran to the end)
+def executesource(rawtextinput, recordlexemes=True):
+    run = runsource(rawtextinput, recordlexemes)
+    if recordlexemes:
+        return [run["lexemes"], runsymbols(run), run["error"]]
+    return [lambda: runlexemes(run), runsymbols(run), run["error"]]
@@ -0,0 +1,81 @@
+# Headless runner: executes a LOLCODE file without the GUI (and without importing tkinter)
+# usage: python lolrun.py [--no-fold] [--memo size] [--output file] [--input file] [--profile file] file.lol
+# --no-fold compiles every expression and branch as written (no constant folding), for debugging
+# --memo keeps the results of up to size calls of pure functions to return them again (see lolinterpreter.callsettings)
+# --output writes the output to a file instead of stdout
+# --input takes the GIMMEH inputs from the lines of a file instead of stdin
+# --profile profiles the run and writes the report as JSON to a file (see lolinterpreter.profilereport)
+# VISIBLE output and error messages go to stdout (buffered, see outputsink.py), GIMMEH reads one line from stdin per input
+import sys
+import os.path
+import lolinterpreter
+import outputsink
+
+usage = "usage: python lolrun.py [--no-fold] [--memo size] [--output file] [--input file] [--profile file] file.lol\n"
+
+
+def main(arguments):
+    outputpath = None
+    inputpath = None
+    profilepath = None
+    while len(arguments) != 0 and arguments[0].startswith("--"):
+        if arguments[0] == "--no-fold":
+            lolinterpreter.compilesettings["fold"] = False
+            arguments = arguments[1:]
+        elif arguments[0] == "--memo" and len(arguments) > 1 and arguments[1].isdigit():
+            lolinterpreter.callsettings["memo"] = int(arguments[1])
+            arguments = arguments[2:]
+        elif arguments[0] == "--output" and len(arguments) > 1:
+            outputpath = arguments[1]
+            arguments = arguments[2:]
+        elif arguments[0] == "--input" and len(arguments) > 1:
+            inputpath = arguments[1]
+            arguments = arguments[2:]
+        elif arguments[0] == "--profile" and len(arguments) > 1:
+            profilepath = arguments[1]
+            arguments = arguments[2:]
+        else:
+            sys.stderr.write(usage)
+            return 2
+    if len(arguments) != 1:
+        sys.stderr.write(usage)
+        return 2
+    if not os.path.isfile(arguments[0]):
+        sys.stderr.write("lolrun: no such file: " + arguments[0] + "\n")
+        return 2
+    if inputpath != None and not os.path.isfile(inputpath):
+        sys.stderr.write("lolrun: no such file: " + inputpath + "\n")
+        return 2
+    with open(arguments[0], "r") as file:
+        rawtextinput = file.read()
+    if not rawtextinput.endswith("\n"):     # same shape as the text taken from the code display
+        rawtextinput += "\n"
+    if outputpath != None:
+        sink = outputsink.filesink(outputpath)
+    else:
+        sink = outputsink.streamsink()
+    def sinkread(variable):             # the output so far is shown before waiting for an input
+        outputsink.sinkflush(sink)
+        sys.stdout.flush()
+        return lolinterpreter.stdinread(variable)
+    lolinterpreter.iohandlers["write"] = lambda text: outputsink.sinkwrite(sink, text)
+    lolinterpreter.iohandlers["read"] = sinkread
+    if inputpath != None:               # nothing to wait for, no flush needed
+        lolinterpreter.iohandlers["read"] = lolinterpreter.filereader(inputpath)
+    profile = None
+    if profilepath != None:
+        profile = lolinterpreter.newprofile()
+    run = lolinterpreter.runsource(rawtextinput, False, None, profile)     # execute-only, no lexeme table
+    error = run["error"]
+    if error != None and not error.endswith("\n"):      # some error messages are not newline-terminated
+        outputsink.sinkwrite(sink, "\n")
+    outputsink.sinkclose(sink)
+    if profile != None:
+        lolinterpreter.profileexport(lolinterpreter.profilereport(profile, run["program"]), profilepath)
+    if error != None:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
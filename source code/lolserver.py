@@ -0,0 +1,288 @@
+# Interpreter server: a long-running local HTTP server that runs LOLCODE programs for other tools, on a pool of worker
+# processes started (and warmed up) once, so a request does not pay for starting Python and importing the interpreter
+# usage: python lolserver.py [--host host] [--port port] [--workers count] [--timeout seconds]
+# POST /run with a JSON body {"source": "program text", "inputs": ["GIMMEH input", ...], "lexemes": true} answers
+#   {"output": "...", "lexemes": [[lexeme, classification], ...], "symbols": {"name": [value, type], ...},
+#    "error": "error message" or null, "code": the number of the error or null, "seconds": run time,
+#    "cached": if the program was in the cache of its worker, "worker": index of the worker}
+# ("lexemes": false skips the lexeme table, like execute-only mode). GET /metrics answers the request count, the
+# latency of the last requests, the requests waiting or running on each worker (queue depth) and the cache lookups.
+# Each worker keeps its own program cache (see lolinterpreter.cachedprogram): a compiled program does not cross
+# processes any faster than it compiles, so instead the requests for the same program text are all sent to the same
+# worker, which finds it in its cache, unless that worker already has serversettings["spill"] requests waiting
+# (then the least busy worker takes it).
+# A worker process that dies (killed, out of memory) is started again at once: the request it was running is answered
+# with a 500, the ones waiting for it are sent to the new worker. A worker still busy with a request past its timeout
+# and the grace (see serversettings) is killed, which starts it again the same way.
+import re
+import sys
+import json
+import time
+import zlib
+import queue
+import threading
+import collections
+import multiprocessing
+import http.server
+import lolinterpreter
+
+usage = "usage: python lolserver.py [--host host] [--port port] [--workers count] [--timeout seconds]\n"
+serversettings = {"host": "127.0.0.1", "port": 8124, "workers": multiprocessing.cpu_count(), "timeout": 10.0, "spill": 4, "window": 1000, "grace": 30.0}
+# window: number of the last requests the latency metrics are computed on
+# grace: seconds a request may wait after its timeout (compiling, a single long instruction that does not see the
+# stop, the requests before it) before it is answered with a 504 and its worker is killed and started again
+
+
+# WORKERS
+# a worker process takes (request id, request) from its tasks queue and sends (request id, answer) on its results
+# connection, until it takes None
+# every worker has a queue and a connection of its own, so a worker that dies cannot leave a lock of the others taken
+
+# the answer to a request (see the top of this file), run in a worker
+def runrequest(request, timeout):
+    rawtextinput = request["source"]
+    if not rawtextinput.endswith("\n"):     # same shape as the text taken from the code display
+        rawtextinput += "\n"
+    output = []
+    lolinterpreter.iohandlers["write"] = output.append
+    lolinterpreter.iohandlers["read"] = lolinterpreter.listreader(request.get("inputs", []))
+    hits = lolinterpreter.cachestats["hits"]
+    control = lolinterpreter.newcontrol()
+    timer = threading.Timer(timeout, lambda: control.update(stop=True))
+    start = time.perf_counter()
+    timer.start()
+    try:
+        run = lolinterpreter.runsource(rawtextinput, request.get("lexemes", True), control)
+    finally:
+        timer.cancel()
+    seconds = time.perf_counter() - start
+    found = re.match(r"Error (\d+)", run["error"]) if run["error"] != None else None
+    code = int(found.group(1)) if found != None else None
+    return {"output": "".join(output), "lexemes": run["lexemes"] or [], "symbols": lolinterpreter.runsymbols(run), "error": run["error"], "code": code, "cached": lolinterpreter.cachestats["hits"] != hits, "seconds": round(seconds, 6)}
+
+# the loop of a worker process, warmed up by a first run (the patterns and the lexeme table are made once)
+def workerloop(tasks, results, timeout):
+    runrequest({"source": "HAI\nI HAS A x ITZ SUM OF 1 AN 2\nVISIBLE x\nKTHXBYE\n"}, timeout)
+    lolinterpreter.clearcache()
+    results.send((None, None))              # ready
+    while True:
+        task = tasks.get()
+        if task == None:
+            return
+        try:
+            answer = runrequest(task[1], timeout)
+        except Exception as error:          # the server answers it with a 500
+            answer = {"failure": type(error).__name__ + ": " + str(error)}
+        results.send((task[0], answer))
+
+
+# SERVER
+# serverstate: "workers" ([process, tasks queue, results connection, id of the request it was killed for or None] of
+# each worker), "depth" (requests sent to each
+# worker and not answered yet), "pending" ([reply Queue, worker index, request] of each request sent to a worker, by
+# request id), "next" (next request id), "latencies" (seconds taken by the last requests), "requests", "failures",
+# "hits" (requests whose program was in the cache of its worker), "restarts" (workers started again after dying)
+serverstate = {"workers": [], "depth": [], "pending": {}, "next": 0, "latencies": collections.deque(), "requests": 0, "failures": 0, "hits": 0, "restarts": 0, "timeout": None, "lock": threading.Lock()}
+
+# starts a worker process, returns [process, tasks queue, results connection, None]
+def startworker(timeout):
+    tasks = multiprocessing.Queue()
+    (results, workerresults) = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=workerloop, args=(tasks, workerresults, timeout), daemon=True)
+    process.start()
+    workerresults.close()               # only the worker holds it, the connection ends when the worker does
+    return [process, tasks, results, None]
+
+# starts the worker processes and waits until they are all warmed up
+def startworkers(count, timeout):
+    serverstate["timeout"] = timeout
+    serverstate["latencies"] = collections.deque(maxlen=serversettings["window"])
+    for index in range(0, count):
+        serverstate["workers"].append(startworker(timeout))
+        serverstate["depth"].append(0)
+    for index in range(0, count):
+        serverstate["workers"][index][2].recv()
+        threading.Thread(target=collectresults, args=(index, serverstate["workers"][index]), daemon=True).start()
+
+# stops the worker processes
+def stopworkers():
+    with serverstate["lock"]:
+        workers = serverstate["workers"]
+        serverstate["workers"] = []     # not started again when their connections end
+        serverstate["depth"] = []
+    for [process, tasks, results, killed] in workers:
+        tasks.put(None)
+    for [process, tasks, results, killed] in workers:
+        process.join()
+
+# the thread handing the answers of worker (the one of index) to the requests waiting for them, until it dies
+def collectresults(index, worker):
+    while True:
+        try:
+            (identifier, answer) = worker[2].recv()
+        except (EOFError, OSError):
+            restartworker(index, worker)
+            return
+        with serverstate["lock"]:
+            pending = serverstate["pending"].pop(identifier, None)
+        if pending != None:
+            pending[0].put(answer)
+
+# starts the worker of index again after worker died: the request it was running (the one it was killed for, or else
+# its oldest one) gets a failure, the others are sent to the new worker
+def restartworker(index, worker):
+    worker[0].join()
+    with serverstate["lock"]:
+        if index >= len(serverstate["workers"]) or serverstate["workers"][index] is not worker:      # stopped
+            return
+        replacement = startworker(serverstate["timeout"])
+        serverstate["workers"][index] = replacement
+        serverstate["restarts"] += 1
+        waiting = sorted([identifier for identifier in serverstate["pending"] if serverstate["pending"][identifier][1] == index])
+    threading.Thread(target=collectresults, args=(index, replacement), daemon=True).start()
+    running = worker[3] if worker[3] != None else (waiting[0] if len(waiting) != 0 else None)
+    with serverstate["lock"]:
+        pending = serverstate["pending"].pop(running, None)
+    if pending != None:
+        pending[0].put({"failure": "the worker process died (exit code " + str(worker[0].exitcode) + ")"})
+    for identifier in waiting:
+        if identifier == running:
+            continue
+        pending = serverstate["pending"].get(identifier)
+        if pending != None:
+            replacement[1].put((identifier, pending[2]))
+
+# sends request to a worker (the one its program text goes to, unless it is too busy) and waits for the answer
+# returns the answer, None if the worker did not answer in time
+def dispatch(request):
+    start = time.perf_counter()
+    reply = queue.Queue(1)
+    with serverstate["lock"]:
+        depth = serverstate["depth"]
+        worker = zlib.crc32(request["source"].encode("utf-8")) % len(depth)
+        if depth[worker] >= serversettings["spill"]:
+            worker = depth.index(min(depth))
+        depth[worker] += 1
+        identifier = serverstate["next"]
+        serverstate["next"] += 1
+        serverstate["pending"][identifier] = [reply, worker, request]
+        serverstate["workers"][worker][1].put((identifier, request))
+    try:
+        answer = reply.get(timeout=serversettings["timeout"] + serversettings["grace"])
+    except queue.Empty:                 # the worker is stuck, it is killed (see restartworker)
+        answer = None
+        with serverstate["lock"]:
+            entry = serverstate["pending"].get(identifier)
+            if entry != None and entry[1] < len(serverstate["workers"]):
+                serverstate["workers"][entry[1]][3] = identifier
+                serverstate["workers"][entry[1]][0].kill()
+    with serverstate["lock"]:
+        serverstate["depth"][worker] -= 1
+        serverstate["pending"].pop(identifier, None)
+        serverstate["requests"] += 1
+        serverstate["latencies"].append(time.perf_counter() - start)
+        if answer == None or "failure" in answer:
+            serverstate["failures"] += 1
+        elif answer["cached"]:
+            serverstate["hits"] += 1
+    if answer != None:
+        answer["worker"] = worker
+    return answer
+
+# the metrics answered to GET /metrics
+def servermetrics():
+    with serverstate["lock"]:
+        latencies = sorted(serverstate["latencies"])
+        metrics = {"requests": serverstate["requests"], "failures": serverstate["failures"], "cachehits": serverstate["hits"], "queue": list(serverstate["depth"]), "queued": sum(serverstate["depth"]), "workers": len(serverstate["workers"]), "restarts": serverstate["restarts"]}
+    latency = {"count": len(latencies), "mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+    if len(latencies) != 0:
+        latency["mean"] = sum(latencies) / len(latencies)
+        for [name, fraction] in [["p50", 0.5], ["p95", 0.95], ["p99", 0.99]]:
+            latency[name] = latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+        latency["max"] = latencies[-1]
+    metrics["latency"] = latency
+    return metrics
+
+class RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # the connections of a client are kept open
+
+    def answer(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self.answer(200, servermetrics())
+        else:
+            self.answer(404, {"failure": "no such path: " + self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.path != "/run":
+            self.answer(404, {"failure": "no such path: " + self.path})
+            return
+        try:
+            request = json.loads(body)
+        except ValueError:
+            request = None
+        if not isinstance(request, dict) or not isinstance(request.get("source"), str):
+            self.answer(400, {"failure": "the body must be a JSON object with a \"source\" string"})
+            return
+        answer = dispatch(request)
+        if answer == None:
+            self.answer(504, {"failure": "the worker did not answer"})
+        elif "failure" in answer:
+            self.answer(500, answer)
+        else:
+            self.answer(200, answer)
+
+    def log_message(self, format, *arguments):      # no line on stderr for every request
+        pass
+
+# starts the workers and an HTTP server on host and port (0 for any free port) serving on a thread, returns the server
+# (its port is server.server_address[1])
+def startserver(host, port, workers):
+    startworkers(workers, serversettings["timeout"])
+    server = http.server.ThreadingHTTPServer((host, port), RequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# stops a server made by startserver and its workers
+def stopserver(server):
+    server.shutdown()
+    server.server_close()
+    stopworkers()
+
+def main(arguments):
+    while len(arguments) != 0:
+        if arguments[0] in ("--host", "--port", "--workers", "--timeout") and len(arguments) > 1:
+            if arguments[0] == "--host":
+                serversettings["host"] = arguments[1]
+            elif arguments[0] == "--port":
+                serversettings["port"] = int(arguments[1])
+            elif arguments[0] == "--workers":
+                serversettings["workers"] = int(arguments[1])
+            else:
+                serversettings["timeout"] = float(arguments[1])
+            arguments = arguments[2:]
+        else:
+            sys.stderr.write(usage)
+            return 2
+    server = startserver(serversettings["host"], serversettings["port"], serversettings["workers"])
+    sys.stderr.write("serving on http://%s:%d with %d workers\n" % (serversettings["host"], server.server_address[1], serversettings["workers"]))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stopserver(server)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,104 @@
+# Output sink: collects the text written by a run (VISIBLE output, echoed lines and error messages) and writes
+# it to its target in batches, a Text widget at most a few times per second, or a stream/file for headless runs
+# A Text widget only keeps the last lines of the output (the scrollback), older lines go to a temporary file.
+# This module does not import Tkinter, 124proj.py gives the functions that write to and trim its widget.
+import sys
+import time
+import tempfile
+import collections
+
+
+# a sink writing to target (a function taking a text)
+# interval is the time between two writes to the target in seconds (None: only when buffersize characters are waiting)
+# scrollback is the number of lines the target keeps (None: no limit), trim the function that removes the given
+# number of characters from the start of the target
+def newsink(target, interval=None, buffersize=65536, scrollback=None, trim=None):
+    return {
+        "target":       target,
+        "interval":     interval,
+        "buffersize":   buffersize,
+        "scrollback":   scrollback,
+        "trim":         trim,
+        "pending":      [],                     # texts not written to the target yet
+        "pendingsize":  0,                      # their number of characters
+        "lastflush":    time.perf_counter(),
+        "kept":         collections.deque(),    # [text, newlines] written to the target and still in it
+        "keptlines":    0,                      # newlines in these texts
+        "spill":        None,                   # temporary file of the lines removed from the target
+        "spilledlines": 0
+    }
+
+# sink writing to a stream (sys.stdout by default), flushed when a lot of text is waiting
+def streamsink(stream=None):
+    if stream == None:
+        stream = sys.stdout
+    return newsink(stream.write)
+
+# sink writing to the file at path (the file is replaced), flushed when a lot of text is waiting
+def filesink(path):
+    stream = open(path, "w")
+    sink = newsink(stream.write)
+    sink["stream"] = stream         # closed by sinkclose
+    return sink
+
+# the write function for iohandlers
+def sinkwrite(sink, text):
+    sink["pending"].append(text)
+    sink["pendingsize"] += len(text)
+    if sink["pendingsize"] >= sink["buffersize"]:
+        sinkflush(sink)
+    elif sink["interval"] != None and time.perf_counter() - sink["lastflush"] >= sink["interval"]:
+        sinkflush(sink)
+
+# writes the waiting text to the target, then removes the lines over the scrollback from it
+def sinkflush(sink):
+    sink["lastflush"] = time.perf_counter()
+    if sink["pendingsize"] == 0:
+        return
+    text = "".join(sink["pending"])
+    sink["pending"] = []
+    sink["pendingsize"] = 0
+    sink["target"](text)
+    if sink["scrollback"] == None:
+        return
+    newlines = text.count("\n")
+    sink["kept"].append([text, newlines])
+    sink["keptlines"] += newlines
+    excess = sink["keptlines"] - sink["scrollback"]
+    removed = []                                                # --|
+    while excess > 0 and sink["kept"][0][1] <= excess:          #   |
+        [text, newlines] = sink["kept"].popleft()               #   |
+        removed.append(text)                                    #   |--> whole texts first,
+        excess -= newlines                                      #   |--> then the first lines
+        sink["keptlines"] -= newlines                           #   |--> of the next one
+    if excess > 0:                                              #   |
+        first = sink["kept"][0]                                 #   |
+        split = 0                                               #   |
+        for line in range(0, excess):                           #   |
+            split = first[0].index("\n", split) + 1             #   |
+        removed.append(first[0][0:split])                       #   |
+        sink["kept"][0] = [first[0][split:], first[1] - excess] #   |
+        sink["keptlines"] -= excess                             # --|
+    if len(removed) != 0:
+        removed = "".join(removed)
+        if sink["spill"] == None:
+            sink["spill"] = tempfile.NamedTemporaryFile("w", prefix="lolcode-output-", suffix=".txt", delete=False)
+        sink["spill"].write(removed)
+        sink["spilledlines"] += removed.count("\n")
+        sink["trim"](len(removed))
+
+# path of the temporary file with the lines removed from the target (None if there is none)
+def spillpath(sink):
+    if sink["spill"] == None:
+        return None
+    elif not sink["spill"].closed:
+        sink["spill"].flush()
+    return sink["spill"].name
+
+# flushes the sink and closes its file (the temporary file is kept for reading)
+def sinkclose(sink):
+    sinkflush(sink)
+    if sink["spill"] != None:
+        sink["spill"].close()
+    if "stream" in sink:
+        sink["stream"].close()